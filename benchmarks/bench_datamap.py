@@ -0,0 +1,97 @@
+"""
+compares mapping the instances of list queries with a DataMap per instance against the compiled extractor of the
+DataMap class, and against its batch function that maps a whole page at once, in rows per second, for all properties
+and for a few of them. each is timed until its instances are collected into the columns of the query dataframe::
+
+    python benchmarks/bench_datamap.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import make_block, make_transaction  # noqa: E402
+from tron_explorer.account import AccountDataMap  # noqa: E402
+from tron_explorer.block import BlockDataMap  # noqa: E402
+from tron_explorer.columns import ColumnBuilder  # noqa: E402
+from tron_explorer.token_list import TokenListDataMap  # noqa: E402
+from tron_explorer.transaction import TransactionDataMap  # noqa: E402
+from tron_explorer.utils import SendRequestMultiple  # noqa: E402
+
+
+def make_account(number):
+    return {"address": "TACCOUNT%d" % number, "addressTag": "tag_%d" % (number % 50), "balance": number * 10 ** 6,
+            "power": number * 10, "totalTransactionCount": number % 1000, "latestOperationTime": 1668000000000 + number}
+
+
+def make_token(number):
+    return {"tokenType": ["trc10", "trc20"][number % 2], "name": "token_%d" % number, "abbr": "TK%d" % number,
+            "ownerAddress": "TOWNER%d" % number, "dateCreated": 1668000000 + number, "description": "",
+            "vip": False, "supply": 10 ** 9, "nrOfTokenHolders": number, "transferCount": number * 3,
+            "tokenId": str(1000000 + number), "gain": 0.1, "marketcap": number * 100, "volume24hInTrx": number,
+            "priceInTrx": 0.5, "priceInUsd": 0.03, "contractAddress": "TCONTRACT%d" % number}
+
+
+CASES = [(BlockDataMap, make_block, ["number", "hash", "timestamp", "sr_name"]),
+         (AccountDataMap, make_account, ["address", "balance"]),
+         (TokenListDataMap, make_token, ["name", "timestamp", "market_cap"]),
+         (TransactionDataMap, lambda number: make_transaction(number, number % 4),
+          ["hash", "timestamp", "value", "trx_burned_total"])]
+
+
+def pages(rows):
+    size = SendRequestMultiple.LIMIT
+    return [rows[first:first + size] for first in range(0, len(rows), size)]
+
+
+def per_instance(data_map, rows, properties):
+    started = time.perf_counter()
+    columns = ColumnBuilder()
+    for page in pages(rows):
+        columns.append([data_map(d, properties).__dict__ for d in page])
+    return columns.frame(), time.perf_counter() - started
+
+
+def extracted(data_map, rows, properties):
+    started = time.perf_counter()
+    extract = data_map.extractor(properties)
+    columns = ColumnBuilder()
+    for page in pages(rows):
+        columns.append([extract(d) for d in page])
+    return columns.frame(), time.perf_counter() - started
+
+
+def batched(data_map, rows, properties):
+    started = time.perf_counter()
+    batch = data_map.batch(properties)
+    columns = ColumnBuilder()
+    for page in pages(rows):
+        columns.append(batch(page))
+    return columns.frame(), time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    for data_map, make, some in CASES:
+        rows = [make(number) for number in range(args.rows)]
+        for properties in (None, some):
+            before, before_seconds = per_instance(data_map, rows, properties)
+            after, after_seconds = extracted(data_map, rows, properties)
+            batch, batch_seconds = batched(data_map, rows, properties)
+            # same rows with the same columns in the same order
+            assert before.equals(after) and before.equals(batch)
+            print("%-16s properties=%-4s before=%9.0f rows/s  extractor=%9.0f rows/s (x%.1f)  "
+                  "batch=%9.0f rows/s (x%.1f)"
+                  % (data_map.__name__, "all" if properties is None else len(properties), args.rows / before_seconds,
+                     args.rows / after_seconds, before_seconds / after_seconds, args.rows / batch_seconds,
+                     before_seconds / batch_seconds))
+
+
+if __name__ == "__main__":
+    main()
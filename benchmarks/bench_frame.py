@@ -0,0 +1,72 @@
+"""
+compares the peak memory and time of building the dataframe of a block export from a list of the dicts of its
+instances against collecting the instances column by column with a ColumnBuilder. pages are mapped one at a time the
+same way list queries map them::
+
+    python benchmarks/bench_frame.py --rows 1000000
+    python benchmarks/bench_frame.py --rows 1000000 --properties number timestamp size sr_name
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import make_block  # noqa: E402
+from tron_explorer.block import BlockDataMap  # noqa: E402
+from tron_explorer.columns import ColumnBuilder  # noqa: E402
+from tron_explorer.utils import MiscUtils, SendRequestMultiple  # noqa: E402
+
+
+def pages(rows, properties):
+    extract = BlockDataMap.extractor(properties)
+    size = SendRequestMultiple.LIMIT
+    for first in range(1, rows + 1, size):
+        yield [extract(make_block(number)) for number in range(first, min(first + size, rows + 1))]
+
+
+def dict_list(rows, properties):
+    all_data = []
+    for page in pages(rows, properties):
+        all_data.extend(page)
+    return MiscUtils.dict_list_df(all_data)
+
+
+def columnar(rows, properties):
+    columns = ColumnBuilder()
+    for page in pages(rows, properties):
+        columns.append(page)
+    return columns.frame()
+
+
+def measure(build, rows, properties):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    df = build(rows, properties)
+    seconds = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return df, peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--properties", nargs="+", default=None)
+    args = parser.parse_args()
+
+    before, before_peak, before_seconds = measure(dict_list, args.rows, args.properties)
+    del before
+    after, after_peak, after_seconds = measure(columnar, args.rows, args.properties)
+    print("rows=%d  list of dicts: peak=%.0fMB %.1fs  columns: peak=%.0fMB %.1fs  (peak x%.1f smaller)"
+          % (args.rows, before_peak / 2 ** 20, before_seconds, after_peak / 2 ** 20, after_seconds,
+             before_peak / after_peak))
+
+
+if __name__ == "__main__":
+    main()
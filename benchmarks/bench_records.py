@@ -0,0 +1,53 @@
+"""
+compares creating the DataMap of single instances, which single getters return by default, against creating their
+DataRecord, in instances per second and in bytes per instance::
+
+    python benchmarks/bench_records.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_datamap import make_account  # noqa: E402
+from benchmarks.stub_server import make_block, make_transaction  # noqa: E402
+from tron_explorer.account import AccountDataMap  # noqa: E402
+from tron_explorer.block import BlockDataMap  # noqa: E402
+from tron_explorer.transaction import TransactionDataMap  # noqa: E402
+
+CASES = [(BlockDataMap, make_block), (AccountDataMap, make_account),
+         (TransactionDataMap, lambda number: make_transaction(number, number % 6))]
+
+
+def timed(create, rows):
+    started = time.perf_counter()
+    instances = [create(d) for d in rows]
+    return instances, time.perf_counter() - started
+
+
+def size(instance):
+    if hasattr(instance, "__dict__"):
+        return sys.getsizeof(instance) + sys.getsizeof(instance.__dict__)
+    return sys.getsizeof(instance)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    for data_map, make in CASES:
+        rows = [make(number) for number in range(1, args.rows + 1)]
+        before, before_seconds = timed(lambda d: data_map(d, None), rows)
+        after, after_seconds = timed(lambda d: data_map.record(d, None), rows)
+        assert [m.get_dict() for m in before] == [r.get_dict() for r in after]
+        print("%-18s datamap=%8.0f/s %4dB  record=%8.0f/s %4dB  (x%.1f)"
+              % (data_map.__name__, args.rows / before_seconds, size(before[0]), args.rows / after_seconds,
+                 size(after[0]), before_seconds / after_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+records block and transaction list queries from the stub server and then replays them with an artificial latency,
+so pagination can be profiled without network. the seconds spent in each stage of the queries show which one limits
+throughput::
+
+    python benchmarks/bench_replay.py --count 5000 --latency 20 --workers 8 --save-live
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import serve  # noqa: E402
+from tron_explorer.explore import Explore  # noqa: E402
+from tron_explorer.session import HttpSession  # noqa: E402
+from tron_explorer.transport import RecordingTransport, ReplayTransport  # noqa: E402
+from tron_explorer.utils import SendRequestSingle  # noqa: E402
+
+QUERIES = {"get_block_list": {}, "get_transaction_list_blockchain": {}}
+
+
+def run(explore, count, save_path=None):
+    timings = {}
+    for name, kwargs in QUERIES.items():
+        if save_path is not None:
+            kwargs = dict(kwargs, save_live=True, save_path=save_path)
+        explore.session.stats.reset()
+        started = time.perf_counter()
+        df = getattr(explore, name)(count=count, **kwargs)
+        timings[name] = (len(df), time.perf_counter() - started, explore.session.stats.summary()["stages"])
+    explore.close()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--latency", type=float, default=20, help="replayed per request latency in milliseconds")
+    parser.add_argument("--workers", type=int, default=1, help="pages of a query window requested at the same time")
+    parser.add_argument("--save-live", action="store_true", help="live save the queries to a temporary folder")
+    parser.add_argument("--archive", default=os.path.join(tempfile.gettempdir(), "tron_explorer_replay.jsonl.gz"))
+    args = parser.parse_args()
+
+    if not os.path.exists(args.archive):
+        server, base_api = serve()
+        SendRequestSingle.BASE_API = base_api
+        run(Explore(HttpSession(transport=RecordingTransport(args.archive))), args.count)
+        server.shutdown()
+
+    save_path = tempfile.mkdtemp() if args.save_live else None
+    print()
+    for latency in (0, args.latency):
+        transport = ReplayTransport(args.archive, latency=latency / 1000)
+        explore = Explore(HttpSession(transport=transport, page_workers=args.workers))
+        for name, (rows, elapsed, stages) in run(explore, args.count, save_path).items():
+            print("latency=%-4g workers=%-3d %-32s rows=%d wall=%.2fs" % (latency, args.workers, name, rows, elapsed))
+            print("    " + "  ".join("%s=%.2fs" % stage for stage in stages.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+compares a block list export with one connection per page against the pooled keep-alive session.
+
+    python benchmarks/bench_session.py --count 2000 --handshake 30 --latency 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import serve, stats  # noqa: E402
+from tron_explorer.explore import Explore  # noqa: E402
+from tron_explorer.session import HttpSession  # noqa: E402
+from tron_explorer.utils import SendRequestSingle  # noqa: E402
+
+
+def run(server, session, count):
+    connections, requests = stats(server)
+    explore = Explore(session)
+    started = time.perf_counter()
+    df = explore.get_block_list(count=count)
+    elapsed = time.perf_counter() - started
+    explore.close()
+    connections_after, requests_after = stats(server)
+    pages = requests_after - requests
+    return len(df), connections_after - connections, pages, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=5, help="per request latency in milliseconds")
+    parser.add_argument("--handshake", type=float, default=30, help="per connection latency in milliseconds")
+    args = parser.parse_args()
+
+    server, base_api = serve(latency=args.latency / 1000, handshake=args.handshake / 1000)
+    SendRequestSingle.BASE_API = base_api
+
+    results = {"connection per page": run(server, HttpSession(keep_alive=False), args.count),
+               "pooled keep-alive": run(server, HttpSession(), args.count)}
+
+    print()
+    for name, (rows, connections, pages, elapsed) in results.items():
+        print("%-20s rows=%d pages=%d connections=%d wall=%.2fs per_page=%.1fms"
+              % (name, rows, pages, connections, elapsed, 1000 * elapsed / pages))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
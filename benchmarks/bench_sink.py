@@ -0,0 +1,59 @@
+"""
+compares live saving by rewriting the whole csv file after every page against appending each page to a CsvSink,
+for exports of growing size. rewriting grows quadratically with the number of rows, appending linearly::
+
+    python benchmarks/bench_sink.py --counts 2000 5000 10000 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import make_block  # noqa: E402
+from tron_explorer.block import BlockDataMap  # noqa: E402
+from tron_explorer.sink import CsvSink  # noqa: E402
+from tron_explorer.utils import MiscUtils, SendRequestMultiple  # noqa: E402
+
+
+def pages(count):
+    rows = [BlockDataMap(make_block(number), None).__dict__ for number in range(count)]
+    return [rows[i:i + SendRequestMultiple.LIMIT] for i in range(0, count, SendRequestMultiple.LIMIT)]
+
+
+def rewrite(path, query):
+    all_data = []
+    started = time.perf_counter()
+    for page in query:
+        all_data.extend(page)
+        MiscUtils.dict_list_df(all_data).to_csv(path)
+    return time.perf_counter() - started
+
+
+def append(path, query):
+    started = time.perf_counter()
+    with CsvSink(path) as sink:
+        for page in query:
+            sink.write(page)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--counts", type=int, nargs="+", default=[2000, 5000, 10000])
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "query.csv")
+    for count in args.counts:
+        query = pages(count)
+        rewritten = rewrite(path, query)
+        appended = append(path, query)
+        print("rows=%-7d rewrite=%.2fs (%.0fus/row)  append=%.2fs (%.0fus/row)"
+              % (count, rewritten, rewritten / count * 1e6, appended, appended / count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
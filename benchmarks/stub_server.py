@@ -0,0 +1,194 @@
+"""
+a local stub of the tronscan api used by the benchmarks. it serves synthetic blocks and transactions with the same
+pagination rules as tronscan (start/limit offsets capped per query window, start/end timestamp filters and
+timestamp sort) and counts the tcp connections and requests it receives.
+
+run it directly to serve on a fixed port::
+
+    python benchmarks/stub_server.py --port 8090 --latency 20
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+T0 = 1668000000000
+BLOCK_INTERVAL = 3000
+TRANSACTIONS_PER_BLOCK = 3
+QUERY_CAP = {"/api/block": 10000, "/api/transaction": 10000, "/api/account/list": 2000}
+
+
+def make_block(number):
+    return {"number": number, "hash": "%064x" % number, "parentHash": "%064x" % (number - 1),
+            "timestamp": T0 + number * BLOCK_INTERVAL, "size": 1000 + number % 500, "confirmed": True,
+            "nrOfTrx": TRANSACTIONS_PER_BLOCK, "blockReward": 16, "netUsage": 0, "energyUsage": 0,
+            "witnessAddress": "TSR%d" % (number % 27), "witnessName": "sr_%d" % (number % 27)}
+
+
+def make_transaction(number, index):
+    contract_type = [1, 31, 11, 4][index % 4]
+    transaction = {"block": number, "hash": "%060x%04x" % (number, index), "timestamp": T0 + number * BLOCK_INTERVAL,
+                   "ownerAddress": "TOWNER%d" % (number % 101), "toAddress": "TTO%d" % (index % 13),
+                   "contractType": contract_type, "confirmed": True, "result": "SUCCESS", "contractRet": "SUCCESS",
+                   "amount": str(index * 10 ** 6),
+                   "cost": {"net_fee": 100000, "energy_fee": 0, "fee": 100000, "energy_usage_total": 0,
+                            "net_usage": 267},
+                   "tokenInfo": {"tokenName": "trx", "tokenAbbr": "trx"},
+                   "contractData": {"amount": index * 10 ** 6, "resource": "ENERGY"}}
+    if contract_type == 31:
+        transaction["trigger_info"] = {"contract_address": "TCONTRACT", "methodName": "transfer", "data": "a9059cbb",
+                                       "parameter": {"_to": "TTO%d" % index, "_value": str(index * 10 ** 6)}}
+    return transaction
+
+
+class StubState:
+    """
+    counters and settings shared by every handler of a stub server.
+    """
+
+    def __init__(self, latency=0.0, handshake=0.0, blocks=200000, failure_rate=0.0):
+        self.latency = latency
+        self.handshake = handshake
+        self.blocks = blocks
+        self.failure_rate = failure_rate
+        self.random = random.Random(0)
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    state: StubState = None
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+        # a new connection pays for the handshake that tls would cost against the real api
+        time.sleep(self.state.handshake)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        with self.state.lock:
+            self.state.requests += 1
+        time.sleep(self.state.latency)
+
+        # injected failures: throttling with a Retry-After header or a bad gateway
+        with self.state.lock:
+            failure = self.state.random.random() < self.state.failure_rate and url.path != "/__stats"
+            status = self.state.random.choice([429, 502])
+        if failure:
+            self.send_response(status)
+            if status == 429:
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if url.path == "/__stats":
+            body = {"connections": self.state.connections, "requests": self.state.requests}
+        elif url.path == "/api/block/latest":
+            body = make_block(self.state.blocks)
+        elif url.path == "/api/block" and "number" in params:
+            body = {"data": [make_block(int(params["number"]))]}
+        elif url.path == "/api/block":
+            body = self._list(url.path, params, self._blocks)
+        elif url.path == "/api/transaction":
+            body = self._list(url.path, params, self._transactions)
+        elif url.path == "/api/transaction-info":
+            number, index = int(params["hash"][:60], 16), int(params["hash"][60:], 16)
+            body = make_transaction(number, index)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _blocks(self, first, last, descending):
+        numbers = range(last, first - 1, -1) if descending else range(first, last + 1)
+        for n in numbers:
+            yield make_block(n)
+
+    def _transactions(self, first, last, descending):
+        for block in self._blocks(first, last, descending):
+            indexes = range(TRANSACTIONS_PER_BLOCK - 1, -1, -1) if descending else range(TRANSACTIONS_PER_BLOCK)
+            for i in indexes:
+                yield make_transaction(block["number"], i)
+
+    def _list(self, path, params, rows):
+        start = int(params.get("start", 0))
+        limit = int(params.get("limit", 50))
+        if start + limit > QUERY_CAP.get(path, 10000):
+            return {"total": 0, "data": []}
+
+        first, last = 1, self.state.blocks
+        if "start_timestamp" in params:
+            first = max(first, -(-(int(params["start_timestamp"]) - T0) // BLOCK_INTERVAL))
+        if "end_timestamp" in params:
+            last = min(last, (int(params["end_timestamp"]) - T0) // BLOCK_INTERVAL)
+        if "block" in params:
+            first = last = int(params["block"])
+        descending = params.get("sort", "-timestamp").startswith("-")
+
+        data = []
+        for i, row in enumerate(rows(first, last, descending)):
+            if i >= start + limit:
+                break
+            if i >= start:
+                data.append(row)
+        return {"total": len(data), "data": data}
+
+
+def serve(port=0, latency=0.0, handshake=0.0, blocks=200000, failure_rate=0.0):
+    """
+    starts a stub server in a background thread.
+
+    :returns: the server and its base api url.
+    :rtype: tuple
+    """
+
+    state = StubState(latency, handshake, blocks, failure_rate)
+    handler = type("Handler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:%d/api" % server.server_address[1]
+
+
+def stats(server):
+    """
+    :returns: number of connections and requests the server has received so far.
+    :rtype: tuple
+    """
+
+    state = server.RequestHandlerClass.state
+    return state.connections, state.requests
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0, help="per request latency in milliseconds")
+    parser.add_argument("--handshake", type=float, default=0, help="per connection latency in milliseconds")
+    parser.add_argument("--failure-rate", type=float, default=0, help="fraction of requests answered with 429 or 502")
+    args = parser.parse_args()
+    stub, base_api = serve(args.port, args.latency / 1000, args.handshake / 1000, failure_rate=args.failure_rate)
+    print("serving", base_api)
+    threading.Event().wait()
@@ -4,6 +4,7 @@ from tron_explorer.data_map import DataMap
 # noinspection PyAttributeOutsideInit
 from tron_explorer.exceptions import ParameterException, ParameterWarning
 from tron_explorer.utils import SendRequestSingle, SendRequestMultiple
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit
@@ -37,6 +38,11 @@ class AccountDataMap(DataMap):
             timestamp of last operation the account has performed.
     """
 
+    PLAN_NAME = "Account"
+
+    properties_dtypes = {"balance": "int64", "power": "int64", "number_of_transactions": "int64"
+        , "latest_operation_time": "int64"}
+
     def __init__(self, data: dict, properties: list):
         super().__init__(data, properties)
 
@@ -69,8 +75,8 @@ class Account:
     _API_ACCOUNT_ADDRESS = "/account/list"
     _API_ACCOUNT_ANALYSIS_ADDRESS = "/account/analysis"
 
-    def __init__(self):
-        pass
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
 
     @staticmethod
     def _check_list_params(sort):
@@ -85,7 +91,7 @@ class Account:
         if sort != "balance" and sort != "power" :
             ParameterException(ParameterException.SORT_EXCEPTION_MESSAGE, ["sort"])
 
-    def get_account(self, account_address: str, properties: list = None):
+    def get_account(self, account_address: str, properties: list = None, records: bool = False):
         """
         get data for a specific account.
 
@@ -95,22 +101,26 @@ class Account:
         :args:
             * *properties* (``list``)
                 properties of accounts that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: AccountDataMap
 
         """
         params = {"address": account_address}
-        req = SendRequestSingle(self._API_ACCOUNT_ADDRESS, params)
+        req = SendRequestSingle(self._API_ACCOUNT_ADDRESS, params, self.session)
         data = req.get_data()
-        return AccountDataMap(data["data"][0], properties)
+        return AccountDataMap.single(data["data"][0], properties, records)
 
     def get_account_list(self , save_live: bool = False
                          , save_path: str = ""
                          , sort: str = "power"
                          , order: str = "DESC"
                          , properties: list = None
-                         , count: int = 10000):
+                         , count: int = 10000
+                         , resume: bool = False):
         """
         get data for a list of accounts.
 
@@ -133,6 +143,9 @@ class Account:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired accounts.
         :rtype: Pandas Dataframe
@@ -143,10 +156,45 @@ class Account:
         params = {"sort": sort, "order": order, "start_timestamp": None, "end_timestamp": None}
 
         address = self._API_ACCOUNT_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, AccountDataMap)
         return data
 
+    def iter_account_list(self
+                          , sort: str = "power"
+                          , order: str = "DESC"
+                          , properties: list = None
+                          , count: int = 10000
+                          , chunks: bool = False):
+        """
+        get data for a list of accounts, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of accounts that will be returned. default is all.
+            * *sort* (``str``)
+                the property that accounts are ordered by. can be sorted by "power", "balance".
+                default is "power".
+            * *order* (``str``)
+                order of accounts by sort ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired accounts. default is 10000.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired accounts data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        self._check_list_params(sort)
+        params = {"sort": sort, "order": order, "start_timestamp": None, "end_timestamp": None}
+
+        address = self._API_ACCOUNT_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=2000, session=self.session)
+        return req.iter_data_multiple(count, properties, AccountDataMap, chunks=chunks)
+
     def get_account_analysis(self, type_: int, account_address: str, start_timestamp: int = 1):
 
         """
@@ -175,7 +223,7 @@ class Account:
             ParameterWarning(ParameterWarning.START_TIME_ACCOUNT_ANALYSIS_WARNING, '"start_timestamp"')
 
         params = {"address": account_address, "type": type_, "start_timestamp": start_timestamp}
-        req = SendRequestSingle(self._API_ACCOUNT_ANALYSIS_ADDRESS, params)
+        req = SendRequestSingle(self._API_ACCOUNT_ANALYSIS_ADDRESS, params, self.session)
         data = req.get_data()
         df = DataFrame(data["data"])
         return df
\ No newline at end of file
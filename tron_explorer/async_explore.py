@@ -0,0 +1,145 @@
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+from tron_explorer.explore import Explore
+from tron_explorer.session import HttpSession
+
+
+def _coroutine(getter):
+    """
+    :param getter: a get_* method of Explore.
+    :type getter: callable
+
+    :returns: a coroutine method with the same parameters, that runs the getter on the executor of AsyncExplore.
+    :rtype: callable
+    """
+
+    @functools.wraps(getter)
+    async def coroutine(self, *args, **kwargs):
+        return await self._run(getter, self, *args, **kwargs)
+
+    return coroutine
+
+
+def _async_iterator(getter):
+    """
+    :param getter: an iter_* method of Explore.
+    :type getter: callable
+
+    :returns: an async generator method with the same parameters, that takes the items of the getter on the executor
+    of AsyncExplore.
+    :rtype: callable
+    """
+
+    @functools.wraps(getter)
+    async def iterator(self, *args, **kwargs):
+        items = await self._run(getter, self, *args, **kwargs)
+        try:
+            while True:
+                taken = await self._run(list, itertools.islice(items, self.ITER_BATCH))
+                for item in taken:
+                    yield item
+                if len(taken) < self.ITER_BATCH:
+                    return
+        finally:
+            await self._run(items.close)
+
+    return iterator
+
+
+# noinspection PyIncorrectDocstring
+class AsyncExplore(Explore):
+    """
+    instantiate an object that contains coroutine versions of all requests. every get_* method of Explore is a
+    coroutine with the same parameters here and every iter_* method is an async generator, so several queries can run
+    at the same time::
+
+        async with AsyncExplore() as explore:
+            blocks, srs = await asyncio.gather(explore.get_block_list(count=2000), explore.get_sr_list())
+            async for block in explore.iter_block_list(count=2000):
+                print(block["number"])
+
+    each query runs the same pagination engine as Explore on an executor thread, so the event loop is never blocked.
+    requests are sent by the blocking SendRequestSingle and SendRequestMultiple of the session, there is no
+    asynchronous http client, so queries run in parallel on as many threads as the session has connections.
+
+    :args:
+        * *session* (``HttpSession``)
+            the pooled keep-alive session that every request of this object is sent through. its page_workers pages
+            of a list query are requested at the same time. default is a new session with DEFAULT_PAGE_WORKERS page
+            workers.
+
+    :cvar DEFAULT_PAGE_WORKERS: page_workers of the default session.
+    :type DEFAULT_PAGE_WORKERS: int
+
+    :cvar ITER_BATCH: number of items that an iter_* async generator takes from its query on the executor at a time.
+    :type ITER_BATCH: int
+    """
+
+    DEFAULT_PAGE_WORKERS = 8
+    ITER_BATCH = 50
+
+    def __init__(self, session: HttpSession = None):
+        super().__init__(session if session is not None else HttpSession(page_workers=self.DEFAULT_PAGE_WORKERS))
+        # queries run on as many threads as the session has connections
+        self.executor = ThreadPoolExecutor(max_workers=self.session.pool_size)
+        # futures of the executor that are not done
+        self._futures = set()
+
+    def close(self):
+        """
+        stops the executor threads and closes the connections of the session. queries that have not started yet are
+        cancelled and the running ones are waited for, so no query uses the session after it is closed.
+        """
+
+        for future in list(self._futures):
+            future.cancel()
+        self.executor.shutdown(wait=True)
+        super().close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # running queries are waited for on another thread, so the event loop is not blocked
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _run(self, function, *args, **kwargs):
+        """
+        :returns: the result of the blocking function, which runs on the executor.
+        """
+
+        future = self.executor.submit(functools.partial(function, *args, **kwargs))
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return await asyncio.wrap_future(future)
+
+    get_account = _coroutine(Explore.get_account)
+    get_account_list = _coroutine(Explore.get_account_list)
+    iter_account_list = _async_iterator(Explore.iter_account_list)
+    get_account_analysis = _coroutine(Explore.get_account_analysis)
+    get_latest_block = _coroutine(Explore.get_latest_block)
+    get_block = _coroutine(Explore.get_block)
+    get_block_list = _coroutine(Explore.get_block_list)
+    iter_block_list = _async_iterator(Explore.iter_block_list)
+    get_list_proposals = _coroutine(Explore.get_list_proposals)
+    iter_list_proposals = _async_iterator(Explore.iter_list_proposals)
+    get_list_network_parameters = _coroutine(Explore.get_list_network_parameters)
+    get_smart_contract = _coroutine(Explore.get_smart_contract)
+    get_smart_contract_list_blockchain = _coroutine(Explore.get_smart_contract_list_blockchain)
+    iter_smart_contract_list_blockchain = _async_iterator(Explore.iter_smart_contract_list_blockchain)
+    get_sr = _coroutine(Explore.get_sr)
+    get_sr_list = _coroutine(Explore.get_sr_list)
+    get_transaction = _coroutine(Explore.get_transaction)
+    get_transaction_list_block = _coroutine(Explore.get_transaction_list_block)
+    iter_transaction_list_block = _async_iterator(Explore.iter_transaction_list_block)
+    get_transaction_list_account = _coroutine(Explore.get_transaction_list_account)
+    iter_transaction_list_account = _async_iterator(Explore.iter_transaction_list_account)
+    get_transaction_list_blockchain = _coroutine(Explore.get_transaction_list_blockchain)
+    iter_transaction_list_blockchain = _async_iterator(Explore.iter_transaction_list_blockchain)
+    get_token_list = _coroutine(Explore.get_token_list)
+    iter_token_list = _async_iterator(Explore.iter_token_list)
+    get_trc10_token = _coroutine(Explore.get_trc10_token)
+    get_trc20_token = _coroutine(Explore.get_trc20_token)
@@ -1,4 +1,5 @@
 from tron_explorer.utils import SendRequestSingle, SendRequestMultiple
+from tron_explorer.session import HttpSession
 from tron_explorer.data_map import DataMap
 
 
@@ -49,6 +50,12 @@ class BlockDataMap(DataMap):
 
     """
 
+    PLAN_NAME = "Block"
+
+    properties_dtypes = {"number": "int64", "timestamp": "int64", "size": "int64", "confirmed": "bool"
+        , "number_of_transactions": "int64", "block_reward": "float64", "bandwidth_used": "float64"
+        , "energy_used": "float64", "sr_address": "category", "sr_name": "category"}
+
     def __init__(self, data, properties):
         super().__init__(data, properties)
 
@@ -83,8 +90,8 @@ class Block:
     _API_BLOCK_LATEST_ADDRESS = "/block/latest"
     _API_BLOCK_ADDRESS = "/block"
 
-    def __init__(self):
-        pass
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
 
     def _get_latest_block_number(self):
         """
@@ -97,18 +104,43 @@ class Block:
         properties = ["number"]
         params = {}
         address = self._API_BLOCK_LATEST_ADDRESS
-        req = SendRequestSingle(address, params)
+        req = SendRequestSingle(address, params, self.session)
         data = req.get_data()
         block_latest = BlockDataMap(data, properties)
         return block_latest.number
 
-    def get_latest_block(self, properties: list = None):
+    def _get_block_data(self, number):
+        """
+        get raw data of a block, from the entity cache of the session when it is cached.
+
+        :param number: the number of desired block.
+        :type number: int
+
+        :returns: the block data instance.
+        :rtype: dict
+
+        """
+
+        def get_data():
+            params = {"number": number}
+            req = SendRequestSingle(self._API_BLOCK_ADDRESS, params, self.session)
+            return req.get_data()["data"][0]
+
+        cache = self.session.entity_cache
+        if cache is None:
+            return get_data()
+        return cache.fetch((self._API_BLOCK_ADDRESS, str(number)), get_data)
+
+    def get_latest_block(self, properties: list = None, records: bool = False):
         """
         get the latest block data.
 
         :args:
             * *properties* (``list``) 
                 properties of blocks that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the latest block data.
         :rtype: BlockDataMap
@@ -116,13 +148,10 @@ class Block:
         """
 
         number = self._get_latest_block_number()
-        address = self._API_BLOCK_ADDRESS
-        params = {"number": number}
-        req = SendRequestSingle(address, params)
-        data = req.get_data()
-        return BlockDataMap(data["data"][0], properties)
+        data = self._get_block_data(number)
+        return BlockDataMap.single(data, properties, records)
 
-    def get_block(self, number: int, properties: list = None):
+    def get_block(self, number: int, properties: list = None, records: bool = False):
         """
         get a specific block.
 
@@ -132,16 +161,17 @@ class Block:
         :args:
             * *properties* (``list``) 
                 properties of blocks that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired block data.
         :rtype: BlockDataMap
 
         """
 
-        params = {"number": number}
-        req = SendRequestSingle(self._API_BLOCK_ADDRESS, params)
-        data = req.get_data()
-        return BlockDataMap(data["data"][0], properties)
+        data = self._get_block_data(number)
+        return BlockDataMap.single(data, properties, records)
 
     def get_block_list(self, start_timestamp: int = None
                        , end_timestamp: int = None
@@ -149,7 +179,8 @@ class Block:
                        , save_path: str = ""
                        , order: str = "DESC"
                        , properties: list = None
-                       , count: int = 10000):
+                       , count: int = 10000
+                       , resume: bool = False):
         r"""
         get multiple blocks data.
 
@@ -169,6 +200,9 @@ class Block:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired blocks.
         :rtype: Pandas Dataframe
@@ -179,6 +213,42 @@ class Block:
                   "order": order, "sort": "timestamp"}
 
         address = self._API_BLOCK_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=10000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=10000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, BlockDataMap)
         return data
+
+    def iter_block_list(self, start_timestamp: int = None
+                        , end_timestamp: int = None
+                        , order: str = "DESC"
+                        , properties: list = None
+                        , count: int = 10000
+                        , chunks: bool = False):
+        r"""
+        get multiple blocks data, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``) 
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``) 
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``) 
+                properties of blocks that will be returned. default is all.
+            * *order* (``str``)
+                order of blocks by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``) 
+                number of desired blocks. default is 10000. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired blocks data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        params = {"start_timestamp": start_timestamp, "end_timestamp": end_timestamp,
+                  "order": order, "sort": "timestamp"}
+
+        address = self._API_BLOCK_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=10000, session=self.session)
+        return req.iter_data_multiple(count, properties, BlockDataMap, chunks=chunks)
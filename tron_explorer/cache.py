@@ -0,0 +1,333 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from tron_explorer.decoder import LazyItems
+from tron_explorer.exceptions import ParameterException
+
+
+class ResponseCache:
+    """
+    a persistent on-disk cache of api responses that SendRequestSingle looks up before sending a request. responses
+    are keyed by api segment address and normalized request params, expire based on a per segment ttl and the least
+    recently used ones are evicted when the cache grows over max_size.
+
+    the cache is a sqlite file, so it can be shared between threads, processes and runs.
+
+    :param path: path of the cache file.
+    :type path: str
+
+    :param max_size: maximum total size of cached responses in bytes.
+    :type max_size: int
+
+    :param ttls: seconds each api segment is cached, by address. a value of None never expires and CONFIRMED
+                 never expires once every returned instance is confirmed. segments that are not in ttls are not
+                 cached. default is DEFAULT_TTLS.
+    :type ttls: dict
+
+    :param cache_pages: whether if pages of list queries are cached too. default is False since the same page of
+                        a query without timestamps changes as new instances are added.
+    :type cache_pages: bool
+
+    :cvar CONFIRMED: ttl value for responses that never change after they are confirmed.
+    :type CONFIRMED: str
+
+    :cvar UNCONFIRMED_TTL: seconds that responses with a CONFIRMED ttl are cached while not confirmed.
+    :type UNCONFIRMED_TTL: int
+
+    :cvar DEFAULT_TTLS: default ttl of api segments.
+    :type DEFAULT_TTLS: dict
+
+    """
+
+    CONFIRMED = "confirmed"
+    UNCONFIRMED_TTL = 3
+    DEFAULT_TTLS = {"/block/latest": 3, "/chainparameters": 600, "/block": CONFIRMED, "/transaction-info": CONFIRMED,
+                    "/contract": 300, "/token": 60, "/token_trc20": 60, "/account/list": 60, "/vote/witness": 60,
+                    "/pagewitness": 60}
+
+    def __init__(self, path: str, max_size: int = 256 * 1024 * 1024, ttls: dict = None, cache_pages: bool = False):
+        if max_size <= 0:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["max_size"])
+        self.path = path
+        self.max_size = max_size
+        self.ttls = ttls if ttls is not None else self.DEFAULT_TTLS
+        self.cache_pages = cache_pages
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def _connect(self):
+        """
+        opens the cache file and creates its table.
+
+        :returns: connection to the cache file.
+        :rtype: sqlite3.Connection
+        """
+
+        connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body TEXT, size INTEGER,"
+                           " expires REAL, accessed REAL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        return connection
+
+    @staticmethod
+    def make_key(address: str, params: dict):
+        """
+        :returns: cache key of a request, the same for any order of params.
+        :rtype: str
+        """
+
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        return address + "?" + urlencode(items)
+
+    def _is_cached(self, address: str, params: dict):
+        """
+        :returns: whether if responses of the request are cached.
+        :rtype: bool
+        """
+
+        if address not in self.ttls:
+            return False
+        if not self.cache_pages and params is not None and "limit" in params:
+            return False
+        return True
+
+    def _ttl(self, address: str, data):
+        """
+        :returns: seconds the response is cached, None for never expiring.
+        :rtype: float
+        """
+
+        ttl = self.ttls[address]
+        if ttl != self.CONFIRMED:
+            return ttl
+
+        is_page = isinstance(data, dict) and isinstance(data.get("data"), (list, LazyItems))
+        instances = data["data"] if is_page else [data]
+        if len(instances) > 0 and all(isinstance(d, dict) and d.get("confirmed") is True for d in instances):
+            return None
+        return self.UNCONFIRMED_TTL
+
+    def get(self, address: str, params: dict):
+        """
+        :param address: the address of api segment.
+        :type address: str
+
+        :param params: parameters of api request.
+        :type params: dict
+
+        :returns: the cached response, None when it is not cached or has expired.
+        :rtype: dict
+        """
+
+        if not self._is_cached(address, params):
+            return None
+
+        key = self.make_key(address, params)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT body, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, address: str, params: dict, data):
+        """
+        caches a response and evicts the least recently used responses when cache is full.
+
+        :param address: the address of api segment.
+        :type address: str
+
+        :param params: parameters of api request.
+        :type params: dict
+
+        :param data: the data returned by api.
+        :type data: dict
+        """
+
+        if not self._is_cached(address, params):
+            return
+
+        ttl = self._ttl(address, data)
+        if ttl is not None and ttl <= 0:
+            return
+
+        key = self.make_key(address, params)
+        # lists of incrementally decoded pages are decoded fully to be cached
+        body = json.dumps(data, default=list)
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        if len(body) > self.max_size:
+            return
+
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                                     (key, body, len(body), expires, now))
+            self._evict()
+
+    def _evict(self):
+        """
+        removes expired responses and then least recently used ones until cache size is under max_size.
+        """
+
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        self._connection.execute("DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall()
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def stats(self):
+        """
+        :returns: hits, misses, hit rate and evictions of this cache object, and number and size of cached responses.
+        :rtype: dict
+        """
+
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        requests = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions, "entries": entries, "size": size}
+
+    def clear(self):
+        """
+        removes every cached response.
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        """
+        closes the cache file.
+        """
+
+        self._connection.close()
+
+
+class EntityCache:
+    """
+    a bounded in-process cache of raw single instance data (blocks and transactions). a confirmed instance never
+    changes so it is kept until it is the least recently used one of a full cache, while an unconfirmed one is only
+    kept for unconfirmed_ttl seconds. since raw data is cached, later requests with any properties are served from it.
+
+    :param max_entries: maximum number of cached instances.
+    :type max_entries: int
+
+    :param unconfirmed_ttl: seconds that unconfirmed instances are cached.
+    :type unconfirmed_ttl: float
+
+    """
+
+    def __init__(self, max_entries: int = 10000, unconfirmed_ttl: float = 3):
+        if max_entries <= 0:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["max_entries"])
+        self.max_entries = max_entries
+        self.unconfirmed_ttl = unconfirmed_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        # key -> (data, expires), expires is None for confirmed instances
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        :param key: key of the instance, for example ("/block", "45986120").
+        :type key: tuple
+
+        :returns: the cached data of the instance, None when it is not cached or has expired.
+        :rtype: dict
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[1] is not None and entry[1] <= time.monotonic()):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, data: dict):
+        """
+        caches the data of an instance and evicts the least recently used instance when cache is full.
+
+        :param key: key of the instance.
+        :type key: tuple
+
+        :param data: the data instance.
+        :type data: dict
+        """
+
+        expires = None if data.get("confirmed") is True else time.monotonic() + self.unconfirmed_ttl
+        with self._lock:
+            self._entries[key] = (data, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def fetch(self, key, get_data):
+        """
+        :param key: key of the instance.
+        :type key: tuple
+
+        :param get_data: function that requests the data of the instance when it is not cached.
+        :type get_data: callable
+
+        :returns: data of the instance.
+        :rtype: dict
+        """
+
+        data = self.get(key)
+        if data is None:
+            data = get_data()
+            self.put(key, data)
+        return data
+
+    def stats(self):
+        """
+        :returns: hits, misses, hit rate, evictions and number of cached instances.
+        :rtype: dict
+        """
+
+        requests = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / requests if requests else 0.0,
+                "evictions": self.evictions, "entries": len(self._entries)}
+
+    def clear(self):
+        """
+        removes every cached instance.
+        """
+
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,57 @@
+import json
+import os
+
+
+class Checkpoint:
+    """
+    a json file next to the live saved file of a list query that records the position the query got to, so a query
+    that stopped before it was complete can be continued from that position instead of being downloaded again. the
+    file is replaced in one step each time it is saved, so it always holds one whole state.
+
+    :param path: path of the checkpoint file.
+    :type path: str
+
+    :cvar TEMP_SUFFIX: suffix of the file that a state is written to before it replaces the checkpoint.
+    :type TEMP_SUFFIX: str
+
+    """
+
+    TEMP_SUFFIX = ".tmp"
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self):
+        """
+        :returns: the saved state, None when there is no checkpoint.
+        :rtype: dict
+        """
+
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: dict):
+        """
+        replaces the saved state.
+
+        :param state: json serializable state of the query.
+        :type state: dict
+        """
+
+        temp_path = self.path + self.TEMP_SUFFIX
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(temp_path, self.path)
+
+    def remove(self):
+        """
+        removes the checkpoint once its query is complete.
+        """
+
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,66 @@
+import threading
+
+
+class _Call:
+    """
+    a request in flight and the waiters of its result.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RequestCoalescer:
+    """
+    makes concurrent identical requests share one request in flight (single flight). the first caller of a key sends
+    the request and every caller that asks for the same key before it finishes waits for and gets the same result,
+    or the same exception.
+
+    :ivar shared: number of calls that were served by a request of another caller.
+    :type shared: int
+
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        """
+        :param key: key of the request, identical requests have the same key.
+        :type key: str
+
+        :param function: function that sends the request and returns its result.
+        :type function: callable
+
+        :returns: result of the function.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
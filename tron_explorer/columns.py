@@ -0,0 +1,277 @@
+from math import nan
+from operator import itemgetter
+
+import pandas as pd
+
+
+class ColumnPage:
+    """
+    the data instances of a page, mapped at once to one list per property instead of a dict for each instance. it is
+    used as the list of dicts of the page would be: its length is the number of instances and iterating over it
+    yields the dict of each instance.
+
+    instances of a page can also have different properties, see merge. then the column of a property has MISSING for
+    the instances that dont have it, and row_keys has the properties of each instance in the order of its dict.
+
+    :param columns: values of each property, in order of the instances.
+    :type columns: dict
+
+    :param rows: number of instances.
+    :type rows: int
+
+    :param row_keys: properties of each instance, None when every instance has every property.
+    :type row_keys: list
+
+    """
+
+    # value in a column for an instance that doesnt have the property
+    MISSING = object()
+
+    def __init__(self, columns: dict, rows: int, row_keys: list = None):
+        self.columns = columns
+        self.rows = rows
+        self.row_keys = row_keys
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        if self.row_keys is not None:
+            yield from self._sparse_rows()
+            return
+        if len(self.columns) == 0:
+            # instances without properties
+            yield from ({} for _ in range(self.rows))
+            return
+        keys = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(keys, values))
+
+    def _sparse_rows(self):
+        columns = self.columns
+        missing = self.MISSING
+        for i in range(self.rows):
+            d = {}
+            for key in self.row_keys[i]:
+                column = columns.get(key)
+                if column is not None and column[i] is not missing:
+                    d[key] = column[i]
+            yield d
+
+    def column(self, key: str, fill=None):
+        """
+        :param key: the property.
+        :type key: str
+
+        :param fill: value for the instances that dont have the property.
+
+        :returns: values of the property in order of the instances.
+        :rtype: list
+        """
+
+        values = self.columns.get(key)
+        if values is None:
+            return [fill] * self.rows
+        if self.row_keys is None:
+            return values
+        missing = self.MISSING
+        return [fill if v is missing else v for v in values]
+
+    def pop(self):
+        """
+        removes the last instance.
+        """
+
+        for column in self.columns.values():
+            column.pop()
+        if self.row_keys is not None:
+            self.row_keys.pop()
+        self.rows -= 1
+
+    @classmethod
+    def merge(cls, parts: list, rows: int):
+        """
+        merges the columns of groups of the instances of a page, which are mapped separately, back into one page in
+        order of the instances. columns of the page are in order of first appearance, the same as the keys of the
+        list of the dicts of the instances.
+
+        :param parts: (indexes of the instances in the page, columns of the instances) of each group. columns of a
+        group are in the order of the dicts of its instances and have MISSING for instances that dont have them.
+        :type parts: list
+
+        :param rows: number of instances of the page.
+        :type rows: int
+
+        :returns: the page.
+        :rtype: ColumnPage
+        """
+
+        missing = cls.MISSING
+        if len(parts) == 1 and all(missing not in column for column in parts[0][1].values()):
+            # every instance has every property
+            return cls(parts[0][1], rows)
+
+        # (first instance, position in the dict of the instance) of each property
+        first = {}
+        for indexes, columns in parts:
+            for position, (key, column) in enumerate(columns.items()):
+                i = indexes[0]
+                if column[0] is missing:
+                    i = next((i for i, v in zip(indexes, column) if v is not missing), None)
+                    if i is None:
+                        continue
+                if key not in first or (i, position) < first[key]:
+                    first[key] = (i, position)
+
+        # position of each instance in the groups one after another
+        order = [0] * rows
+        row_keys = [()] * rows
+        offset = 0
+        for indexes, columns in parts:
+            keys = tuple(columns)
+            for i in indexes:
+                order[i] = offset
+                row_keys[i] = keys
+                offset += 1
+
+        gather = itemgetter(*order) if rows > 1 else lambda values: values
+        merged = {}
+        for key in sorted(first, key=first.get):
+            values = []
+            for indexes, columns in parts:
+                column = columns.get(key)
+                values.extend(column if column is not None else [missing] * len(indexes))
+            merged[key] = list(gather(values))
+        return cls(merged, rows, row_keys)
+
+
+class ColumnBuilder:
+    """
+    collects the data instances of a query into one list per property as their pages are mapped, and builds the
+    dataframe of query from the lists. no dict is kept for each instance and the dataframe is built column by column
+    instead of from a list of dicts, which would need both at the same time.
+
+    columns are in order of first appearance and instances that dont have a property are NaN in its column, the same
+    as the dataframe of a list of the dicts. columns with a declared dtype are built with it, see typed.
+
+    :param dtypes: dtype of each property, properties that are not in it have the dtype that pandas infers.
+    :type dtypes: dict
+
+    :cvar BOOLS: value of a bool column for each value that the api or a saved file has for it.
+    :type BOOLS: dict
+
+    """
+
+    BOOLS = {True: True, False: False, "true": True, "false": False, "True": True, "False": False}
+
+    def __init__(self, dtypes: dict = None):
+        self.dtypes = dtypes if dtypes is not None else {}
+        self.rows = 0
+        self._columns = {}
+
+    def append(self, page: list):
+        """
+        appends the data instances of a page.
+
+        :param page: dicts of data instances, or a ColumnPage.
+        :type page: list
+        """
+
+        columns = self._columns
+        if isinstance(page, ColumnPage):
+            self._append_columns(page)
+            return
+
+        for d in page:
+            for key in d:
+                if key not in columns:
+                    # the instances of previous pages dont have it
+                    columns[key] = [nan] * self.rows
+
+        if all(len(d) == len(columns) for d in page):
+            # every instance has every property
+            for key, column in columns.items():
+                column.extend([d[key] for d in page])
+        else:
+            for key, column in columns.items():
+                column.extend([d.get(key, nan) for d in page])
+        self.rows += len(page)
+
+    def _append_columns(self, page):
+        columns = self._columns
+        for key in page.columns:
+            if key not in columns:
+                columns[key] = [nan] * self.rows
+        for key, column in columns.items():
+            column.extend(page.column(key, nan))
+        self.rows += page.rows
+
+    def frame(self):
+        """
+        builds the dataframe and empties the builder.
+
+        :returns: a panda dataframe of the data instances.
+        :rtype: Pandas Dataframe
+        """
+
+        # each list is freed once its column is built, and columns are not copied again into the dataframe
+        columns, self._columns = self._columns, {}
+        data = {}
+        for key in list(columns):
+            data[key] = self.typed(columns.pop(key), self.dtypes.get(key))
+        self.rows = 0
+        return pd.DataFrame(data, copy=False)
+
+    @classmethod
+    def typed(cls, values, dtype=None):
+        """
+        builds a column with its declared dtype. a column that has missing values keeps the dtype pandas infers for
+        int64 and bool, which cant hold them, and so does a column with values that dont fit the dtype. values of a
+        bool column are mapped with BOOLS, so "false" is False.
+
+        :param values: values of the column.
+        :type values: list
+
+        :param dtype: the declared dtype, None to infer it.
+        :type dtype: str
+
+        :returns: the column.
+        :rtype: Pandas Series
+        """
+
+        column = pd.Series(values)
+        if dtype is None or column.dtype == dtype:
+            return column
+        if dtype in ("int64", "bool") and column.hasnans:
+            return column
+        # fractions would be cut off
+        if dtype == "int64" and column.dtype.kind == "f" and not (column % 1 == 0).all():
+            return column
+        if dtype == "bool":
+            mapped = column.map(cls.BOOLS)
+            return column if mapped.hasnans else mapped.astype(bool)
+        try:
+            return column.astype(dtype)
+        except (TypeError, ValueError, OverflowError):
+            return column
+
+    @classmethod
+    def apply(cls, df, dtypes: dict):
+        """
+        converts the columns of a dataframe that was not built by a ColumnBuilder, such as one read from a saved file,
+        to their declared dtypes.
+
+        :param df: the dataframe.
+        :type df: Pandas Dataframe
+
+        :param dtypes: dtype of each property.
+        :type dtypes: dict
+
+        :returns: the dataframe with declared dtypes.
+        :rtype: Pandas Dataframe
+        """
+
+        for key in df.columns:
+            if key in dtypes:
+                df[key] = cls.typed(df[key], dtypes[key])
+        return df
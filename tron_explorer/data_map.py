@@ -1,5 +1,7 @@
 from json import dumps
+from operator import itemgetter
 
+from tron_explorer.columns import ColumnPage
 from tron_explorer.exceptions import PropertiesException
 
 
@@ -14,8 +16,38 @@ class DataMap:
     :param properties: properties of instance that will be returned.
     :type properties: list
 
+    list queries map the instances of each page at once with a batch function of the DataMap class instead of creating
+    an instance for each one, see batch and extractor. single instances can be mapped to a DataRecord instead, see
+    record.
+
+    :cvar properties_dtypes: dtype of the dataframe column of each property, properties that are not in it have the
+                             dtype that pandas infers.
+    :type properties_dtypes: dict
+
+    :cvar PLAN_NAME: name of the class in exceptions, set by classes whose properties are renamed keys of the data
+                     instances, the keys of properties_dict. their extractor, batch and record functions read the keys
+                     of the plan of properties instead of running filter_data, see _plan.
+    :type PLAN_NAME: str
+
+    :cvar PLAN_FIXED: (property, key) of the properties that such a class returns before the others whatever the
+                      properties are. every data instance has their keys.
+    :type PLAN_FIXED: tuple
+
+    :cvar PLAN_FACTORS: factor that a property is multiplied by, for example timestamps in seconds, by property.
+    :type PLAN_FACTORS: dict
+
     """
 
+    properties_dtypes = {}
+    PLAN_NAME = None
+    PLAN_FIXED = ()
+    PLAN_FACTORS = {}
+
+    # compiled extractors, batch and record functions by (class, properties)
+    _extractors = {}
+    _batches = {}
+    _records = {}
+
     def __init__(self, data: dict, properties: list):
         self.CLASS_NAME = None
         if type(self) is DataMap:
@@ -47,6 +79,257 @@ class DataMap:
             else:
                 raise PropertiesException(differences, self.CLASS_NAME)
 
+    @classmethod
+    def extractor(cls, properties: list = None):
+        """
+        compiles properties into a function that maps a data instance straight to the dict of its properties, the same
+        dict as get_dict of the DataMap of the instance. extractors are compiled once for each class and properties,
+        so properties are checked once for all the instances of a query.
+
+        :param properties: properties of instances that will be returned.
+        :type properties: list
+
+        :returns: the extractor, a function of a data instance that returns a dict.
+        :rtype: callable
+
+        :raise: PropertiesException
+        """
+
+        return cls._compiled(DataMap._extractors, cls._compile, properties)
+
+    @classmethod
+    def batch(cls, properties: list = None):
+        """
+        compiles properties into a function that maps all the data instances of a page at once. classes whose
+        properties are renamed keys of the data instances, and transactions, map a page to a ColumnPage, one list per
+        property, without a dict for each instance. other classes map it to the list of the dicts of their extractor.
+
+        :param properties: properties of instances that will be returned.
+        :type properties: list
+
+        :returns: the batch function, a function of a list of data instances that returns a ColumnPage or a list.
+        :rtype: callable
+
+        :raise: PropertiesException
+        """
+
+        return cls._compiled(DataMap._batches, cls._compile_batch, properties)
+
+    @classmethod
+    def record(cls, data: dict, properties: list = None):
+        """
+        maps a data instance to an immutable DataRecord with the same properties as the DataMap of the instance. like
+        extractors, the function that creates records is compiled once for each class and properties.
+
+        :param data: the data instance.
+        :type data: dict
+
+        :param properties: properties of instance that will be returned.
+        :type properties: list
+
+        :returns: the record of instance.
+        :rtype: DataRecord
+
+        :raise: PropertiesException
+        """
+
+        return cls._compiled(DataMap._records, cls._compile_record, properties)(data)
+
+    @classmethod
+    def single(cls, data: dict, properties: list = None, records: bool = False):
+        """
+        maps a data instance that is returned by a single getter.
+
+        :param records: if set to True a DataRecord is returned instead of a DataMap.
+        :type records: bool
+
+        :returns: the DataMap or the DataRecord of instance.
+        :rtype: DataMap
+        """
+
+        if records:
+            return cls.record(data, properties)
+        return cls(data, properties)
+
+    @classmethod
+    def _compiled(cls, cache, compile_, properties):
+        """
+        :param cache: compiled functions by (class, properties).
+        :type cache: dict
+
+        :param compile_: compiles the function of properties when it is not in cache.
+        :type compile_: callable
+
+        :returns: the compiled function of the class and properties.
+        :rtype: callable
+        """
+
+        key = (cls, None if properties is None else tuple(properties))
+        compiled = cache.get(key)
+        if compiled is None:
+            compiled = compile_(properties)
+            cache[key] = compiled
+        return compiled
+
+    @classmethod
+    def _compile(cls, properties):
+        """
+        compiles the extractor of properties. each instance is mapped by a DataMap of the class, unless the class sets
+        PLAN_NAME.
+
+        :returns: the extractor.
+        :rtype: callable
+        """
+
+        if cls.PLAN_NAME is not None:
+            names, values = cls._compile_values(properties)
+            return lambda data: dict(zip(names, values(data)))
+
+        def extract(data):
+            return cls(data, properties).__dict__
+
+        return extract
+
+    @classmethod
+    def _compile_batch(cls, properties):
+        """
+        compiles the batch function of properties. each instance is mapped by the extractor, unless the class sets
+        PLAN_NAME. then the page is mapped to a ColumnPage with _columns.
+
+        :returns: the batch function.
+        :rtype: callable
+        """
+
+        if cls.PLAN_NAME is not None:
+            plan = cls._plan(properties, cls.PLAN_NAME)
+            columns = cls._columns(plan)
+            factors = [(p, factor) for p, factor in cls.PLAN_FACTORS.items() if any(p == q for q, _ in plan)]
+
+            def batch(rows):
+                if len(rows) == 0:
+                    return ColumnPage({}, 0)
+                page = {p: [d[key] for d in rows] for p, key in cls.PLAN_FIXED}
+                page.update(columns(rows))
+                for p, factor in factors:
+                    page[p] = [v * factor if v is not None else None for v in page[p]]
+                return ColumnPage(page, len(rows))
+
+            return batch
+
+        extract = cls.extractor(properties)
+
+        def batch(rows):
+            return [extract(d) for d in rows]
+
+        return batch
+
+    @classmethod
+    def _compile_values(cls, properties):
+        """
+        compiles the function that reads the values of properties from a data instance, for classes that set
+        PLAN_NAME. properties whose keys are missing are None.
+
+        :returns: (the properties in order, the function of a data instance that returns the list of their values).
+        :rtype: tuple
+
+        :raise: PropertiesException
+        """
+
+        plan = list(cls.PLAN_FIXED) + cls._plan(properties, cls.PLAN_NAME)
+        names = tuple(p for p, _ in plan)
+        fixed = [key for _, key in cls.PLAN_FIXED]
+        keys = [key for _, key in plan[len(fixed):]]
+        factors = [(i, cls.PLAN_FACTORS[p]) for i, p in enumerate(names) if p in cls.PLAN_FACTORS]
+        if len(fixed) == 0 and len(factors) == 0:
+            return names, lambda data: [data.get(key) for key in keys]
+
+        def values(data):
+            row = [data[key] for key in fixed] + [data.get(key) for key in keys]
+            for i, factor in factors:
+                if row[i] is not None:
+                    row[i] *= factor
+            return row
+
+        return names, values
+
+    @staticmethod
+    def _columns(plan):
+        """
+        compiles a plan of _plan into a function that maps the data instances of a page to one list per property. when
+        every instance has every key, the keys of all of them are read at once with an itemgetter and the rows are
+        turned into columns with zip, otherwise the properties of missing keys are None.
+
+        :param plan: (property, key of the property in data instance) of each property.
+        :type plan: list
+
+        :returns: the function of a list of data instances that returns a dict of lists.
+        :rtype: callable
+        """
+
+        names = [p for p, _ in plan]
+        keys = [key for _, key in plan]
+        if len(keys) == 0:
+            return lambda rows: {}
+        get = itemgetter(*keys)
+
+        def columns(rows):
+            if len(rows) == 0:
+                return {}
+            try:
+                values = [list(map(get, rows))] if len(keys) == 1 else map(list, zip(*map(get, rows)))
+                return dict(zip(names, values))
+            except KeyError:
+                # some instances dont have every key
+                return {p: [d.get(key) for d in rows] for p, key in plan}
+
+        return columns
+
+    @classmethod
+    def _compile_record(cls, properties):
+        """
+        compiles the function that creates the records of properties. instances are mapped by the extractor and their
+        record type is looked up for each one, since the properties of some instances depend on their data. instances
+        of classes that set PLAN_NAME all have the same properties, so they have one record type.
+
+        :returns: the function of a data instance that returns a DataRecord.
+        :rtype: callable
+        """
+
+        if cls.PLAN_NAME is not None:
+            names, values = cls._compile_values(properties)
+            record_type = DataRecord.type_of(cls, names)
+            return lambda data: record_type(values(data))
+
+        extract = cls.extractor(properties)
+
+        def make(data):
+            d = extract(data)
+            return DataRecord.type_of(cls, tuple(d))(d.values())
+
+        return make
+
+    @classmethod
+    def _plan(cls, properties, class_name):
+        """
+        checks properties against properties_dict of the class.
+
+        :param class_name: name of the class in exceptions.
+        :type class_name: str
+
+        :returns: (property, key of the property in data instance) of each property, in order.
+        :rtype: list
+
+        :raise: PropertiesException
+        """
+
+        if properties is None:
+            properties = cls.properties_dict.keys()
+        else:
+            differences = set(properties).difference(cls.properties_dict)
+            if len(differences) > 0:
+                raise PropertiesException(differences, class_name)
+        return [(p, cls.properties_dict[p]) for p in properties]
+
     def filter_data(self):
         """
         filters data based on specified properties. this method will be overridden in child classes
@@ -64,3 +347,59 @@ class DataMap:
 
     def __str__(self):
         return dumps(self.__dict__)
+
+
+class DataRecord(tuple):
+    """
+    an immutable record of the properties of a data instance, stored in a tuple with no __dict__. properties are read
+    as attributes, get_dict and str() return the same as the DataMap of the instance.
+
+    a record type is generated for each DataMap class and each set of properties that its instances have, see type_of.
+
+    :cvar _fields: properties of the record, in order.
+    :type _fields: tuple
+
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    # generated record types by (DataMap class, properties)
+    _types = {}
+
+    @staticmethod
+    def type_of(data_map, fields: tuple):
+        """
+        :param data_map: the DataMap class of instances.
+        :type data_map: type
+
+        :param fields: properties of the instances, in order.
+        :type fields: tuple
+
+        :returns: the record type of the instances.
+        :rtype: type
+        """
+
+        key = (data_map, fields)
+        record_type = DataRecord._types.get(key)
+        if record_type is None:
+            namespace = {p: property(itemgetter(i)) for i, p in enumerate(fields)}
+            namespace.update(__slots__=(), _fields=fields)
+            name = data_map.__name__.replace("DataMap", "") + "Record"
+            record_type = type(name, (DataRecord,), namespace)
+            DataRecord._types[key] = record_type
+        return record_type
+
+    def get_dict(self):
+        """
+        :returns: dict representation of object.
+        :rtype:  dict
+
+        """
+        return dict(zip(self._fields, self))
+
+    def __str__(self):
+        return dumps(self.get_dict())
+
+    def __repr__(self):
+        return "%s(%s)" % (type(self).__name__, ", ".join("%s=%r" % item for item in zip(self._fields, self)))
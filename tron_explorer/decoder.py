@@ -0,0 +1,256 @@
+import json
+import threading
+import time
+from json.decoder import WHITESPACE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonDecoder:
+    """
+    decodes api responses with the standard library json module.
+
+    :cvar NAME: name of the decoder.
+    :type NAME: str
+
+    """
+
+    NAME = "json"
+
+    def loads(self, content: bytes):
+        """
+        :returns: the decoded content.
+        :rtype: dict
+        """
+
+        return json.loads(content)
+
+    def decode(self, content: bytes, done=None):
+        """
+        decodes a response body.
+
+        :param content: body of the response.
+        :type content: bytes
+
+        :param done: function that is called with the seconds spent decoding once content is fully decoded.
+        :type done: callable
+
+        :returns: the decoded content.
+        :rtype: dict
+        """
+
+        started = time.perf_counter()
+        data = self.loads(content)
+        if done is not None:
+            done(time.perf_counter() - started)
+        return data
+
+
+class OrjsonDecoder(JsonDecoder):
+    """
+    decodes api responses with orjson, which is several times faster than the json module. needs orjson installed.
+
+    """
+
+    NAME = "orjson"
+
+    def loads(self, content: bytes):
+        return orjson.loads(content)
+
+
+def default_decoder():
+    """
+    :returns: the fastest decoder that is installed.
+    :rtype: JsonDecoder
+    """
+
+    if orjson is not None:
+        return OrjsonDecoder()
+    return JsonDecoder()
+
+
+class LazyItems:
+    """
+    the list of instances of a page, decoded one instance at a time as it is iterated so mapping of the first
+    instances can start before the rest are decoded. decoded instances are kept, so it can be iterated again.
+    members of the page that come after the list are added to the page once the list is fully decoded.
+
+    :param text: body of the response.
+    :type text: str
+
+    :param position: position of the first character after the opening bracket of the list.
+    :type position: int
+
+    :param page: the decoded page that the list belongs to.
+    :type page: dict
+
+    :param decoder: the decoder used for each instance.
+    :type decoder: json.JSONDecoder
+
+    :param elapsed: seconds already spent decoding the page.
+    :type elapsed: float
+
+    :param done: function that is called with the seconds spent decoding once the page is fully decoded.
+    :type done: callable
+
+    """
+
+    def __init__(self, text: str, position: int, page: dict, decoder, elapsed: float, done=None):
+        self._text = text
+        self._position = position
+        self._page = page
+        self._decoder = decoder
+        self._elapsed = elapsed
+        self._done = done
+        self._items = []
+        self._finished = False
+        # a page can be shared by coalesced requests of several threads
+        self._lock = threading.Lock()
+
+    def _skip(self, position):
+        return WHITESPACE.match(self._text, position).end()
+
+    def _decode_next(self):
+        """
+        decodes the next instance of the list.
+
+        :returns: whether if an instance was decoded.
+        :rtype: bool
+
+        :raise: ValueError
+        """
+
+        with self._lock:
+            return self._decode_locked()
+
+    def _decode_locked(self):
+        if self._finished:
+            return False
+
+        started = time.perf_counter()
+        text = self._text
+        try:
+            position = self._skip(self._position)
+            if text[position] == ",":
+                position = self._skip(position + 1)
+
+            if text[position] == "]":
+                self._finish(position + 1)
+                decoded = False
+            else:
+                item, position = self._decoder.raw_decode(text, position)
+                self._items.append(item)
+                self._position = position
+                decoded = True
+        except IndexError:
+            raise ValueError("truncated response body")
+
+        self._elapsed += time.perf_counter() - started
+        if self._finished:
+            self._text = None
+            if self._done is not None:
+                self._done(self._elapsed)
+        return decoded
+
+    def _finish(self, position):
+        """
+        decodes members of the page after the list.
+        """
+
+        text = self._text
+        position = self._skip(position)
+        while text[position] == ",":
+            key, position = self._decoder.raw_decode(text, self._skip(position + 1))
+            position = self._skip(position)
+            value, position = self._decoder.raw_decode(text, self._skip(position + 1))
+            self._page[key] = value
+            position = self._skip(position)
+        self._finished = True
+
+    def __iter__(self):
+        index = 0
+        while True:
+            if index < len(self._items):
+                yield self._items[index]
+                index += 1
+            elif not self._decode_next():
+                return
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            return list(self)[index]
+        while index >= len(self._items) and self._decode_next():
+            pass
+        return self._items[index]
+
+    def __len__(self):
+        while self._decode_next():
+            pass
+        return len(self._items)
+
+    def __bool__(self):
+        with self._lock:
+            if len(self._items) > 0:
+                return True
+            if self._finished:
+                return False
+            return self._text[self._skip(self._position)] != "]"
+
+
+class IncrementalDecoder(JsonDecoder):
+    """
+    decodes pages of list queries incrementally. members of the page before the list of instances are decoded at once
+    and the list itself is a LazyItems that decodes instances as they are used. responses without a list of
+    instances are decoded at once by the json module.
+
+    since the list is decoded after the response is returned, an invalid instance raises ValueError while it is
+    iterated instead of the request being sent again.
+
+    :param data_keys: keys of the list of instances in pages.
+    :type data_keys: tuple
+
+    """
+
+    NAME = "incremental"
+
+    def __init__(self, data_keys: tuple = ("data", "tokens")):
+        self.data_keys = data_keys
+        self._decoder = json.JSONDecoder()
+
+    def decode(self, content: bytes, done=None):
+        try:
+            return self._decode(content, done)
+        except IndexError:
+            raise ValueError("truncated response body")
+
+    def _decode(self, content: bytes, done):
+        started = time.perf_counter()
+        text = content.decode("utf-8")
+        decoder = self._decoder
+
+        page = {}
+        position = WHITESPACE.match(text, 0).end()
+        if text[position] != "{":
+            return super().decode(content, done)
+
+        position = WHITESPACE.match(text, position + 1).end()
+        while text[position] == '"':
+            key, position = decoder.raw_decode(text, position)
+            position = WHITESPACE.match(text, position).end() + 1
+            position = WHITESPACE.match(text, position).end()
+
+            if key in self.data_keys and text[position] == "[":
+                page[key] = LazyItems(text, position + 1, page, decoder, time.perf_counter() - started, done)
+                return page
+
+            page[key], position = decoder.raw_decode(text, position)
+            position = WHITESPACE.match(text, position).end()
+            if text[position] == ",":
+                position = WHITESPACE.match(text, position + 1).end()
+
+        if done is not None:
+            done(time.perf_counter() - started)
+        return page
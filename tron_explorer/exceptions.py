@@ -68,9 +68,24 @@ class ParameterException(Exception):
                                     of "start_timestamp" or "end_timestamp" parameters.
     :type TIME_EXCEPTION_NEGATIVE_MESSAGE: str
 
+    :cvar BLOCK_EXCEPTION_BIGGER_MESSAGE: an error message for incorrect use of "number" or "end_number" parameters.
+    :type BLOCK_EXCEPTION_BIGGER_MESSAGE: str
+
     :cvar SORT_EXCEPTION_MESSAGE: an error message for incorrect use
                                     of "start_timestamp" or "end_timestamp" parameters.
     :type SORT_EXCEPTION_MESSAGE: str
+
+    :cvar SHARED_FILE_EXCEPTION_MESSAGE: an error message for when file sharing is not supported on the platform.
+    :type SHARED_FILE_EXCEPTION_MESSAGE: str
+
+    :cvar RESUME_EXCEPTION_MESSAGE: an error message for when the checkpoint in save path is of another query.
+    :type RESUME_EXCEPTION_MESSAGE: str
+
+    :cvar RESUME_FILE_EXCEPTION_MESSAGE: an error message for when the saved file is shorter than its checkpoint.
+    :type RESUME_FILE_EXCEPTION_MESSAGE: str
+
+    :cvar RESUME_SAVE_LIVE_EXCEPTION_MESSAGE: an error message for when a query that is not live saved is resumed.
+    :type RESUME_SAVE_LIVE_EXCEPTION_MESSAGE: str
     """
 
     ORDER_EXCEPTION_MESSAGE = 'order can only be one of two values : "ASC" or "DESC"'
@@ -79,7 +94,12 @@ class ParameterException(Exception):
                              ", please check the docs for more info."
     TIME_EXCEPTION_BIGGER_MESSAGE = "start time cant be bigger than end time"
     TIME_EXCEPTION_NEGATIVE_MESSAGE = "timestamps cant be negative"
+    BLOCK_EXCEPTION_BIGGER_MESSAGE = "start block cant be bigger than end block"
+    SHARED_FILE_EXCEPTION_MESSAGE = "sharing through a file needs fcntl file locks which this platform doesnt support"
     SR_TYPE_EXCEPTION_MESSAGE = 'sr type can only be one of these values : "all", "sr", "sr_partner", "sr_candidate"'
+    RESUME_EXCEPTION_MESSAGE = "the checkpoint in save path is of a query with different parameters"
+    RESUME_FILE_EXCEPTION_MESSAGE = "the saved file of query is shorter than its checkpoint, it cant be resumed"
+    RESUME_SAVE_LIVE_EXCEPTION_MESSAGE = "only a live saved query can be resumed, resume needs save_live"
 
     def __init__(self, message, parameter):
         self.message = message
@@ -87,3 +107,32 @@ class ParameterException(Exception):
 
     def __str__(self):
         return self.parameter + " : " + self.message
+
+
+class ResponseException(Exception):
+    """
+    used to raise exceptions related to api responses.
+
+    :cvar STATUS_EXCEPTION_MESSAGE: an error message for when api responds with an error status.
+    :type STATUS_EXCEPTION_MESSAGE: str
+
+    :cvar RETRIES_EXCEPTION_MESSAGE: an error message for when a request still fails after all of its retries.
+    :type RETRIES_EXCEPTION_MESSAGE: str
+
+    :cvar DECODE_EXCEPTION_MESSAGE: an error message for when api response is not valid json.
+    :type DECODE_EXCEPTION_MESSAGE: str
+    """
+
+    STATUS_EXCEPTION_MESSAGE = "api responded with an error status"
+    RETRIES_EXCEPTION_MESSAGE = "request failed after all retries"
+    DECODE_EXCEPTION_MESSAGE = "api response is not valid json"
+
+    def __init__(self, message, address, status=None):
+        self.message = message
+        self.address = str(address)
+        self.status = status
+
+    def __str__(self):
+        if self.status is None:
+            return self.address + " : " + self.message
+        return self.address + " : " + self.message + " (" + str(self.status) + ")"
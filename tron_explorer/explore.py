@@ -1,6 +1,7 @@
 from tron_explorer.account import Account, AccountDataMap
 from tron_explorer.block import Block, BlockDataMap
 from tron_explorer.proposals import Proposals, ProposalsDataMap
+from tron_explorer.session import HttpSession
 from tron_explorer.smart_contract import SmartContract, SmartContractDataMap
 from tron_explorer.sr import SR, SrDataMap
 from tron_explorer.token_list import TokenList, TokenListDataMap
@@ -12,17 +13,36 @@ from tron_explorer.transaction import Transaction, TransactionDataMap
 class Explore:
     """
     instantiate an object that contains methods for all requests.
+
+    :args:
+        * *session* (``HttpSession``)
+            the pooled keep-alive session that every request of this object is sent through. default is a new
+            session with default pool size and timeouts.
     """
 
-    def __init__(self):
-        self.account = Account()
-        self.block = Block()
-        self.proposals = Proposals()
-        self.smart_contracts = SmartContract()
-        self.sr = SR()
-        self.token_single = TokenSingle()
-        self.token_list = TokenList()
-        self.transaction = Transaction()
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession()
+        self.account = Account(self.session)
+        self.block = Block(self.session)
+        self.proposals = Proposals(self.session)
+        self.smart_contracts = SmartContract(self.session)
+        self.sr = SR(self.session)
+        self.token_single = TokenSingle(self.session)
+        self.token_list = TokenList(self.session)
+        self.transaction = Transaction(self.session)
+
+    def close(self):
+        """
+        closes the connections of the session.
+        """
+
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @staticmethod
     def get_account_properties():
@@ -119,7 +139,7 @@ class Explore:
         """
         return list(TokenListDataMap.properties_dict.keys())
 
-    def get_account(self, account_address: str, properties: list = None):
+    def get_account(self, account_address: str, properties: list = None, records: bool = False):
         """
         get data for a specific account.
 
@@ -129,13 +149,16 @@ class Explore:
         :args:
             * *properties* (``list``)
                 properties of accounts that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: AccountDataMap
 
         """
 
-        return self.account.get_account(account_address, properties)
+        return self.account.get_account(account_address, properties, records)
 
     def get_account_list(self
                          , save_live: bool = False
@@ -143,7 +166,8 @@ class Explore:
                          , sort: str = "power"
                          , order: str = "DESC"
                          , properties: list = None
-                         , count: int = 10000):
+                         , count: int = 10000
+                         , resume: bool = False):
         """
         get data for a list of accounts.
 
@@ -166,13 +190,45 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired accounts.
         :rtype: Pandas Dataframe
 
         """
 
-        return self.account.get_account_list(save_live, save_path, sort, order, properties, count)
+        return self.account.get_account_list(save_live, save_path, sort, order, properties, count, resume)
+
+    def iter_account_list(self
+                          , sort: str = "power"
+                          , order: str = "DESC"
+                          , properties: list = None
+                          , count: int = 10000
+                          , chunks: bool = False):
+        """
+        get data for a list of accounts, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of accounts that will be returned. default is all.
+            * *sort* (``str``)
+                the property that accounts are ordered by. can be sorted by "power", "balance".
+                default is "power".
+            * *order* (``str``)
+                order of accounts by sort ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired accounts. default is 10000.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired accounts data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        return self.account.iter_account_list(sort, order, properties, count, chunks)
 
     def get_account_analysis(self, type_: str, account_address: str, start_timestamp: int = 1):
         """
@@ -199,22 +255,25 @@ class Explore:
         type_dict = {"balance": 0, "token_transfer": 1, "energy": 2, "bandwidth": 3}
         return self.account.get_account_analysis(type_dict[type_], account_address, start_timestamp)
 
-    def get_latest_block(self, properties: list = None):
+    def get_latest_block(self, properties: list = None, records: bool = False):
         """
         get the latest block data.
 
         :args:
             * *properties* (``list``)
                 properties of blocks that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the latest block data.
         :rtype: BlockDataMap
 
         """
 
-        return self.block.get_latest_block(properties)
+        return self.block.get_latest_block(properties, records)
 
-    def get_block(self, number: int, properties: list = None):
+    def get_block(self, number: int, properties: list = None, records: bool = False):
         """
         get a specific block.
 
@@ -224,13 +283,16 @@ class Explore:
         :args:
             * *properties* (``list``)
                 properties of blocks that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired block data.
         :rtype: BlockDataMap
 
         """
 
-        return self.block.get_block(number, properties)
+        return self.block.get_block(number, properties, records)
 
     def get_block_list(self, start_timestamp: int = None
                        , end_timestamp: int = None
@@ -238,7 +300,8 @@ class Explore:
                        , save_path: str = ""
                        , order: str = "DESC"
                        , properties: list = None
-                       , count: int = 10000):
+                       , count: int = 10000
+                       , resume: bool = False):
         r"""
         get multiple blocks data.
 
@@ -258,6 +321,9 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired blocks.
         :rtype: Pandas Dataframe
@@ -265,12 +331,44 @@ class Explore:
         """
 
         return self.block.get_block_list(start_timestamp, end_timestamp
-                                         , save_live, save_path, order, properties, count)
+                                         , save_live, save_path, order, properties, count, resume)
+
+    def iter_block_list(self, start_timestamp: int = None
+                        , end_timestamp: int = None
+                        , order: str = "DESC"
+                        , properties: list = None
+                        , count: int = 10000
+                        , chunks: bool = False):
+        r"""
+        get multiple blocks data, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of blocks that will be returned. default is all.
+            * *order* (``str``)
+                order of blocks by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired blocks. default is 10000. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired blocks data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        return self.block.iter_block_list(start_timestamp, end_timestamp
+                                         , order, properties, count, chunks)
 
     def get_list_proposals(self, save_live: bool = False
                            , save_path: str = ""
                            , properties: list = None
                            , count: int = 100
+                           , resume: bool = False
                            ):
         """
         get data for a list of proposals.
@@ -285,13 +383,38 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired proposals.
         :rtype: Pandas Dataframe
 
         """
 
-        return self.proposals.get_list_proposals(save_live, save_path, properties, count)
+        return self.proposals.get_list_proposals(save_live, save_path, properties, count, resume)
+
+    def iter_list_proposals(self
+                            , properties: list = None
+                            , count: int = 100
+                            , chunks: bool = False):
+        """
+        get data for a list of proposals, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of proposals that will be returned. default is all.
+            * *count* (``int``)
+                number of desired proposals. default is 100. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired proposals data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        return self.proposals.iter_list_proposals(properties, count, chunks)
 
     def get_list_network_parameters(self):
         """
@@ -304,7 +427,7 @@ class Explore:
 
         return self.proposals.get_list_network_parameters()
 
-    def get_smart_contract(self, contract_address: str, properties: list = None):
+    def get_smart_contract(self, contract_address: str, properties: list = None, records: bool = False):
         """
         get data for a specific smart contract.
 
@@ -314,13 +437,16 @@ class Explore:
         :args:
             * *properties* (``list``)
                 properties of accounts that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: SmartContractDataMap
 
         """
 
-        return self.smart_contracts.get_smart_contract(contract_address, properties)
+        return self.smart_contracts.get_smart_contract(contract_address, properties, records)
 
     def get_smart_contract_list_blockchain(self, start_timestamp: int = None
                                            , end_timestamp: int = None
@@ -331,7 +457,8 @@ class Explore:
                                            , properties: list = None
                                            , count: int = 10000
                                            , verified_only: bool = False
-                                           , open_source_only: bool = False):
+                                           , open_source_only: bool = False
+                                           , resume: bool = False):
         """
         get data for a list of account.
 
@@ -358,6 +485,9 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
 
         :returns: a panda dataframe containing data of desired contracts.
@@ -367,9 +497,51 @@ class Explore:
 
         return self.smart_contracts.get_smart_contract_list_blockchain(
             start_timestamp, end_timestamp, save_live, save_path
-            , sort, order, properties, count, verified_only, open_source_only)
+            , sort, order, properties, count, verified_only, open_source_only, resume)
+
+    def iter_smart_contract_list_blockchain(self, start_timestamp: int = None
+                                            , end_timestamp: int = None
+                                            , sort: str = "timestamp"
+                                            , order: str = "DESC"
+                                            , properties: list = None
+                                            , count: int = 10000
+                                            , verified_only: bool = False
+                                            , open_source_only: bool = False
+                                            , chunks: bool = False):
+        """
+        get data for a list of account, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of contracts that will be returned. default is all.
+            * *sort* (``str``)
+                the property that contracts are ordered by. can be sorted by "number_of_calls", "balance", "timestamp".
+                default is "timestamp".
+            * *order* (``str``)
+                order of contracts by sort ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired contracts. default is 10000. is ignored when both times are specified.
+            * *verified_only* (``bool``)
+                get only verified contracts.
+            * *open_source_only* (``bool``)
+                get only open_source_only contracts.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired contracts data, or of panda dataframes when chunks is True.
+        :rtype: generator
 
-    def get_sr(self, sr_address: str, properties: list = None):
+        """
+
+        return self.smart_contracts.iter_smart_contract_list_blockchain(
+            start_timestamp, end_timestamp
+            , sort, order, properties, count, verified_only, open_source_only, chunks)
+
+    def get_sr(self, sr_address: str, properties: list = None, records: bool = False):
         """
         get a specific SR.
 
@@ -379,13 +551,16 @@ class Explore:
         :args:
             * *properties* (``list``)
                 properties of blocks that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired block data.
         :rtype: BlockDataMap
 
         """
 
-        return self.sr.get_sr(sr_address, properties)
+        return self.sr.get_sr(sr_address, properties, records)
 
     def get_sr_list(self, sr_type: str = "all", properties: list = None):
         r"""
@@ -406,7 +581,7 @@ class Explore:
 
         return self.sr.get_sr_list(sr_type, properties)
 
-    def get_transaction(self, hash_: str, properties: list = None):
+    def get_transaction(self, hash_: str, properties: list = None, records: bool = False):
         """
         get a specific transaction.
 
@@ -416,20 +591,25 @@ class Explore:
         :kwargs:
             * *properties* (``list``)
                 properties of transaction that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired transaction data.
         :rtype: TransactionDataMap
 
         """
 
-        return self.transaction.get_transaction(hash_, properties)
+        return self.transaction.get_transaction(hash_, properties, records)
 
     def get_transaction_list_block(self, number: str
                                    , save_live: bool = False
                                    , save_path: str = ""
                                    , order: str = "DESC"
                                    , properties: list = None
-                                   , count: int = 10000):
+                                   , count: int = 10000
+                                   , resume: bool = False
+                                   , end_number: int = None):
         """
         get transactions in a block.
 
@@ -441,26 +621,64 @@ class Explore:
             * *order* (``str``)
                 order of transaction by time ("ASC" : Ascending , "DESC" : descending).
             * *count* (``int``)
-                number of desired transaction. default is 10000. is ignored when both times are specified.
+                number of desired transaction. default is 10000. is ignored when end_number is specified.
             * *save_live* (``bool``)
                 if set to True the downloaded data will be saved to a file in each page downloaded to avoid losing data
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
+            * *end_number* (``int``)
+                number of the last block of a range of blocks that starts at number. default is None, only the
+                transactions of number are returned.
 
 
         :returns: a panda dataframe containing data of desired transactions.
         :rtype: Pandas Dataframe
         """
 
-        return self.transaction.get_transaction_list_block(number, save_live, save_path, order, properties, count)
+        return self.transaction.get_transaction_list_block(number, save_live, save_path, order, properties, count
+                                                           , resume, end_number)
+
+    def iter_transaction_list_block(self, number: str
+                                    , order: str = "DESC"
+                                    , properties: list = None
+                                    , count: int = 10000
+                                    , chunks: bool = False
+                                    , end_number: int = None):
+        """
+        get transactions in a block, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of transaction that will be returned. default is all.
+            * *sort* (``str``)
+                the property that transaction are ordered by.
+            * *order* (``str``)
+                order of transaction by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired transaction. default is 10000. is ignored when end_number is specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+            * *end_number* (``int``)
+                number of the last block of a range of blocks that starts at number. default is None, only the
+                transactions of number are returned.
+
+        :returns: a generator of dicts of desired transactions data, or of panda dataframes when chunks is True.
+        :rtype: generator
+        """
+
+        return self.transaction.iter_transaction_list_block(number, order, properties, count, chunks, end_number)
 
     def get_transaction_list_account(self, address: str
                                      , save_live: bool = False
                                      , save_path: str = ""
                                      , order: str = "DESC"
                                      , properties: list = None
-                                     , count: int = 10000):
+                                     , count: int = 10000
+                                     , resume: bool = False):
         """
         get transactions related to an account.
 
@@ -478,12 +696,42 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired transactions.
         :rtype: Pandas Dataframe
         """
 
-        return self.transaction.get_transaction_list_account(address, save_live, save_path, order, properties, count)
+        return self.transaction.get_transaction_list_account(address, save_live, save_path, order, properties, count
+                                                             , resume)
+
+    def iter_transaction_list_account(self, address: str
+                                      , order: str = "DESC"
+                                      , properties: list = None
+                                      , count: int = 10000
+                                      , chunks: bool = False):
+        """
+        get transactions related to an account, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of transaction that will be returned. default is all.
+            * *sort* (``str``)
+                the property that transaction are ordered by.
+            * *order* (``str``)
+                order of transaction by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired transaction. default is 10000. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired transactions data, or of panda dataframes when chunks is True.
+        :rtype: generator
+        """
+
+        return self.transaction.iter_transaction_list_account(address, order, properties, count, chunks)
 
     def get_transaction_list_blockchain(self, start_timestamp: int = None
                                         , end_timestamp: int = None
@@ -491,7 +739,8 @@ class Explore:
                                         , save_path: str = ""
                                         , order: str = "DESC"
                                         , properties: list = None
-                                        , count: int = 10000):
+                                        , count: int = 10000
+                                        , resume: bool = False):
         """
         get transactions in blockchain.
 
@@ -511,13 +760,46 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired transactions.
         :rtype: Pandas Dataframe
         """
 
         return self.transaction.get_transaction_list_blockchain(start_timestamp, end_timestamp, save_live, save_path
-                                                                , order, properties, count)
+                                                                , order, properties, count, resume)
+
+    def iter_transaction_list_blockchain(self, start_timestamp: int = None
+                                         , end_timestamp: int = None
+                                         , order: str = "DESC"
+                                         , properties: list = None
+                                         , count: int = 10000
+                                         , chunks: bool = False):
+        """
+        get transactions in blockchain, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of transaction that will be returned. default is all.
+            * *order* (``str``)
+                order of transaction by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired transactions. default is 10000. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired transactions data, or of panda dataframes when chunks is True.
+        :rtype: generator
+        """
+
+        return self.transaction.iter_transaction_list_blockchain(start_timestamp, end_timestamp
+                                                                , order, properties, count, chunks)
 
     def get_token_list(self, save_live: bool = False
                        , save_path: str = ""
@@ -525,7 +807,8 @@ class Explore:
                        , order: str = "DESC"
                        , properties: list = None
                        , count: int = 10000
-                       , token_type: str = "all"):
+                       , token_type: str = "all"
+                       , resume: bool = False):
         """
         get data for a list of tokens.
 
@@ -548,6 +831,9 @@ class Explore:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
             * *token_type* (``str``)
                 all : return all tokens
                 trc10 : return only and all trc10 tokens.
@@ -562,9 +848,50 @@ class Explore:
 
         """
 
-        return self.token_list.get_token_list(save_live, save_path, sort, order, properties, count, token_type)
+        return self.token_list.get_token_list(save_live, save_path, sort, order, properties, count, token_type, resume)
+
+    def iter_token_list(self
+                        , sort: str = "gain"
+                        , order: str = "DESC"
+                        , properties: list = None
+                        , count: int = 10000
+                        , token_type: str = "all"
+                        , chunks: bool = False):
+        """
+        get data for a list of tokens, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of tokens that will be returned. default is all.
+            * *sort* (``str``)
+                the property that tokens are ordered by. can be sorted by "gain", "market_cap",
+                "number_of holders", "volume_24h". default is "gain".
+            * *order* (``str``)
+                order of tokens by sort ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired tokens. default is 10000. is ignored when both times are specified.
+            * *token_type* (``str``)
+                all : return all tokens
+                trc10 : return only and all trc10 tokens.
+                trc20 : return only and all trc20 tokens.
+                trc721 : return only and all trc721 tokens.
+                trc1155 : return only and all trc1155 tokens.
+                default is all.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired tokens data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        return self.token_list.iter_token_list(sort, order, properties, count, token_type, chunks)
 
-    def get_trc10_token(self, token_id: str, properties: list = None):
+    def get_trc10_token(self, token_id: str, properties: list = None, records: bool = False):
         """
         get data for a specific trc10 token.
 
@@ -574,15 +901,18 @@ class Explore:
         :args:
             * *properties* (``list``)
                 properties of token that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: AccountDataMap
 
         """
 
-        return self.token_single.get_trc10_token(token_id, properties)
+        return self.token_single.get_trc10_token(token_id, properties, records)
 
-    def get_trc20_token(self, contract_address: str, properties: list = None):
+    def get_trc20_token(self, contract_address: str, properties: list = None, records: bool = False):
         """
         get data for a specific trc20 token.
 
@@ -592,10 +922,13 @@ class Explore:
         :args:
             * *properties* (``list``)
                 properties of token that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: AccountDataMap
 
         """
 
-        return self.token_single.get_trc20_token(contract_address, properties)
\ No newline at end of file
+        return self.token_single.get_trc20_token(contract_address, properties, records)
\ No newline at end of file
@@ -0,0 +1,260 @@
+class PaginationStrategy:
+    """
+    decides how the windows of a list query follow each other and when the query ends. the pagination engine of
+    SendRequestMultiple pages through one window at a time, pages of a window are requested ahead on worker threads,
+    and asks the strategy of the query where the next window starts.
+
+    the methods are given the request, so one strategy can be used by the shards of a query, which each have their own
+    params.
+
+    :cvar PARALLEL: whether if a bounded query can be split into parts that are requested at the same time.
+    :type PARALLEL: bool
+
+    :cvar DEDUPLICATE: whether if a window can start with instances that the previous window returned.
+    :type DEDUPLICATE: bool
+
+    """
+
+    PARALLEL = False
+    DEDUPLICATE = False
+
+    def bounded(self, request):
+        """
+        :param request: the request of query.
+        :type request: SendRequestMultiple
+
+        :returns: whether if both ends of the query are known, then count is not used and the query can be split.
+        :rtype: bool
+        """
+
+        return False
+
+    def crossed(self, request, instance):
+        """
+        :param request: the request of query.
+        :type request: SendRequestMultiple
+
+        :param instance: an api data instance.
+        :type instance: dict
+
+        :returns: whether if the instance is past the end of query, it is the last instance that is returned.
+        :rtype: bool
+        """
+
+        return False
+
+    def timestamp(self, instance):
+        """
+        :param instance: an api data instance.
+        :type instance: dict
+
+        :returns: the timestamp that the query is ordered by, None when the instance has none.
+        :rtype: int
+        """
+
+        return None
+
+    def next_window(self, request, ended, fresh, stale):
+        """
+        moves the params of request to the next query window.
+
+        :param request: the request of query.
+        :type request: SendRequestMultiple
+
+        :param ended: whether if the window ended with an empty page, instead of at the maximum number of instances
+                      of a query.
+        :type ended: bool
+
+        :param fresh: number of instances of the window that were not returned before.
+        :type fresh: int
+
+        :param stale: number of instances of the window that were returned before.
+        :type stale: int
+
+        :returns: False when the query has no more windows.
+        :rtype: bool
+        """
+
+        return False
+
+    def split(self, request, shards):
+        """
+        splits a bounded query into parts that cover it without gaps or overlaps.
+
+        :param request: the request of query.
+        :type request: SendRequestMultiple
+
+        :param shards: the number of parts that are requested at the same time.
+        :type shards: int
+
+        :returns: params of each part, in the order that instances are returned.
+        :rtype: list
+        """
+
+        return [dict(request.params)]
+
+    def rest(self, request, part):
+        """
+        :param request: the request of query.
+        :type request: SendRequestMultiple
+
+        :param part: params of a part of the query.
+        :type part: dict
+
+        :returns: params of the query after the part.
+        :rtype: dict
+        """
+
+        raise NotImplementedError
+
+
+class OffsetOnly(PaginationStrategy):
+    """
+    pages through one query window, for queries that are not sorted by time so their windows cant be moved. the query
+    ends at the maximum number of instances of a query.
+
+    """
+
+
+class _Time(PaginationStrategy):
+    """
+    moves each query window past the instances that were returned, along timestamp. the next window starts at the
+    timestamp of the last instance, so the instances that share it and were not returned yet are not lost. if a whole
+    window only had instances that were returned before, they all have that timestamp and the window can only move
+    past it. a query whose instances have no timestamp ends after its first window, like OffsetOnly.
+
+    :param field: the field of api data instances that the query is ordered by.
+    :type field: str
+
+    """
+
+    PARALLEL = True
+    DEDUPLICATE = True
+
+    def __init__(self, field: str = "timestamp"):
+        self.field = field
+
+    def timestamp(self, instance):
+        timestamp = instance.get(self.field)
+        return timestamp if isinstance(timestamp, int) else None
+
+    def bounded(self, request):
+        return request.params["start_timestamp"] is not None and request.params["end_timestamp"] is not None
+
+    def split(self, request, shards):
+        return [dict(request.params, start_timestamp=start, end_timestamp=end)
+                for start, end in self._ranges(request, shards)]
+
+    def _ranges(self, request, shards):
+        """
+        :returns: (start_timestamp, end_timestamp) of each part, planned by the window planner of request.
+        :rtype: list
+        """
+
+        return request.planner.plan(request.density_key(), request.params["start_timestamp"],
+                                    request.params["end_timestamp"], request.MAX, shards)
+
+    def _edge(self, request, fresh, stale, step):
+        """
+        :returns: the timestamp that the next window starts at, None when the instances have no timestamp.
+        :rtype: int
+        """
+
+        edge = request._edge_timestamp
+        if edge is not None and fresh == 0 and stale > 0:
+            edge += step
+            # the next window starts past the instances that have the edge timestamp
+            request._edge_timestamp, request._edge_keys = None, set()
+        return edge
+
+
+class TimeForward(_Time):
+    """
+    pages through a query in ascending order of timestamp, each window starts at the end of the previous one.
+
+    """
+
+    def crossed(self, request, instance):
+        end_timestamp = request.params["end_timestamp"]
+        timestamp = self.timestamp(instance)
+        return end_timestamp is not None and timestamp is not None and timestamp > end_timestamp
+
+    def next_window(self, request, ended, fresh, stale):
+        if ended:
+            return False
+        edge = self._edge(request, fresh, stale, 1)
+        if edge is None:
+            return False
+        request.params["start_timestamp"] = edge
+        return True
+
+    def rest(self, request, part):
+        return dict(request.params, start_timestamp=part["end_timestamp"] + 1)
+
+
+class TimeBackward(_Time):
+    """
+    pages through a query in descending order of timestamp, each window ends at the end of the previous one.
+
+    """
+
+    def crossed(self, request, instance):
+        start_timestamp = request.params["start_timestamp"]
+        timestamp = self.timestamp(instance)
+        return start_timestamp is not None and timestamp is not None and timestamp < start_timestamp
+
+    def next_window(self, request, ended, fresh, stale):
+        if ended:
+            return False
+        edge = self._edge(request, fresh, stale, -1)
+        if edge is None:
+            return False
+        request.params["end_timestamp"] = edge
+        return True
+
+    def split(self, request, shards):
+        parts = super().split(request, shards)
+        parts.reverse()
+        return parts
+
+    def rest(self, request, part):
+        return dict(request.params, end_timestamp=part["start_timestamp"] - 1)
+
+
+class BlockRange(PaginationStrategy):
+    """
+    pages through the instances of a range of blocks, one block in each query window. the "block" param is the block
+    of the current window and "end_block" is the last block of the query, which is lower than "block" when blocks are
+    in descending order. a query without "end_block" only has one block.
+
+    """
+
+    PARALLEL = True
+
+    @staticmethod
+    def _step(request):
+        return 1 if request.params["end_block"] >= request.params["block"] else -1
+
+    def bounded(self, request):
+        return request.params.get("end_block") is not None
+
+    def next_window(self, request, ended, fresh, stale):
+        if not self.bounded(request) or request.params["block"] == request.params["end_block"]:
+            return False
+        request.params["block"] += self._step(request)
+        return True
+
+    def split(self, request, shards):
+        first, last = request.params["block"], request.params["end_block"]
+        step = self._step(request)
+        blocks = abs(last - first) + 1
+        parts = []
+        for i in range(min(shards, blocks)):
+            # the first blocks % shards parts have one more block
+            size = blocks // shards + (1 if i < blocks % shards else 0)
+            parts.append(dict(request.params, block=first, end_block=first + step * (size - 1)))
+            first += step * size
+        return parts
+
+    def rest(self, request, part):
+        return dict(request.params, block=part["end_block"] + self._step(request))
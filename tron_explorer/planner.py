@@ -0,0 +1,107 @@
+import math
+import threading
+
+from tron_explorer.exceptions import ParameterException
+
+
+class WindowPlanner:
+    """
+    estimates the density of instances (instances per millisecond) of each api segment and plans the time windows of
+    list queries, so that each window holds just under the maximum number of instances of a query and all windows of a
+    time range can be requested at the same time. densities start from known values and are learned from the
+    timestamps of downloaded pages.
+
+    densities are kept by key, the address of api segment followed by the params that filter its instances (see
+    SendRequestMultiple.density_key), so a filtered query doesnt change the density of the unfiltered one. plans are
+    only used to split queries into time shards, when time_shards of the session is more than 1. a query that is not
+    split moves each window to the last instance of the previous one, whatever the density is.
+
+    :param fill: fraction of the maximum number of instances of a query that a planned window is expected to hold.
+    :type fill: float
+
+    :param densities: initial densities by key. default is DEFAULT_DENSITIES.
+    :type densities: dict
+
+    :param smoothing: weight of a new observation in the learned density, between 0 and 1.
+    :type smoothing: float
+
+    :cvar DEFAULT_DENSITIES: known densities, a block is produced every 3 seconds.
+    :type DEFAULT_DENSITIES: dict
+
+    """
+
+    DEFAULT_DENSITIES = {"/block": 1 / 3000}
+
+    def __init__(self, fill: float = 0.9, densities: dict = None, smoothing: float = 0.2):
+        if not 0 < fill <= 1:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["fill"])
+        self.fill = fill
+        self.smoothing = smoothing
+        self._densities = dict(densities if densities is not None else self.DEFAULT_DENSITIES)
+        self._lock = threading.Lock()
+
+    def density(self, key: str):
+        """
+        :param key: the address of api segment and its filter params.
+        :type key: str
+
+        :returns: estimated instances per millisecond, None when it is not known yet.
+        :rtype: float
+        """
+
+        return self._densities.get(key)
+
+    def observe(self, key: str, instances: int, span: int):
+        """
+        learns density from a page of instances.
+
+        :param key: the address of api segment and its filter params.
+        :type key: str
+
+        :param instances: number of instances in the time span.
+        :type instances: int
+
+        :param span: milliseconds between the first and the last instance.
+        :type span: int
+        """
+
+        if instances <= 0 or span <= 0:
+            return
+
+        density = instances / span
+        with self._lock:
+            old = self._densities.get(key)
+            self._densities[key] = density if old is None else old + self.smoothing * (density - old)
+
+    def plan(self, key: str, start_timestamp: int, end_timestamp: int, max_query: int, minimum: int = 1):
+        """
+        splits a time range into windows that cover it without gaps or overlaps.
+
+        :param key: the address of api segment and its filter params.
+        :type key: str
+
+        :param start_timestamp: start of the time range. (in milliseconds)
+        :type start_timestamp: int
+
+        :param end_timestamp: end of the time range, included. (in milliseconds)
+        :type end_timestamp: int
+
+        :param max_query: the maximum number of instances returned for a query.
+        :type max_query: int
+
+        :param minimum: minimum number of windows. when density is not known the range is split into this many.
+        :type minimum: int
+
+        :returns: (start_timestamp, end_timestamp) of each window in ascending order.
+        :rtype: list
+        """
+
+        span = end_timestamp - start_timestamp + 1
+        windows = minimum
+        density = self.density(key)
+        if density is not None:
+            windows = max(windows, math.ceil(span * density / (self.fill * max_query)))
+        windows = min(windows, span)
+
+        edges = [start_timestamp + span * i // windows for i in range(windows + 1)]
+        return [(edges[i], edges[i + 1] - 1) for i in range(windows)]
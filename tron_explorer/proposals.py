@@ -2,6 +2,7 @@ from tron_explorer.data_map import DataMap
 
 # noinspection PyAttributeOutsideInit
 from tron_explorer.utils import SendRequestMultiple, SendRequestSingle
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit
@@ -41,6 +42,9 @@ class ProposalsDataMap(DataMap):
             number of approvals and vetos. ["approvals","veto"]
     """
 
+    properties_dtypes = {"timestamp_expiration": "int64", "timestamp_creation": "int64", "total_votes": "int64"
+        , "valid_votes": "int64"}
+
     # never initiated directly. its here only because of documentation.
     def __init__(self, data, properties):
         super().__init__(data, properties)
@@ -78,10 +82,14 @@ class Proposals:
     _API_PROPOSAL_ADDRESS = "/proposal"
     _API_PARAMETERS_ADDRESS = "/chainparameters"
 
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
+
     def get_list_proposals(self, save_live: bool = False
                            , save_path: str = ""
                            , properties: list = None
                            , count: int = 100
+                           , resume: bool = False
                            ):
         """
         get data for a list of proposals.
@@ -96,6 +104,9 @@ class Proposals:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired proposals.
         :rtype: Pandas Dataframe
@@ -105,10 +116,37 @@ class Proposals:
         params = {"start_timestamp": None, "end_timestamp": None, "order": "DESC", "sort": "timestamp"}
 
         address = self._API_PROPOSAL_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, ProposalsDataMap)
         return data
 
+    def iter_list_proposals(self
+                            , properties: list = None
+                            , count: int = 100
+                            , chunks: bool = False):
+        """
+        get data for a list of proposals, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of proposals that will be returned. default is all.
+            * *count* (``int``)
+                number of desired proposals. default is 100. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired proposals data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        params = {"start_timestamp": None, "end_timestamp": None, "order": "DESC", "sort": "timestamp"}
+
+        address = self._API_PROPOSAL_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=2000, session=self.session)
+        return req.iter_data_multiple(count, properties, ProposalsDataMap, chunks=chunks)
+
     def get_list_network_parameters(self):
         """
         get data for a list of network parameters.
@@ -119,6 +157,6 @@ class Proposals:
         """
 
         params = {}
-        req = SendRequestSingle(self._API_PARAMETERS_ADDRESS, params)
+        req = SendRequestSingle(self._API_PARAMETERS_ADDRESS, params, self.session)
         data = req.get_data()
         return data["tronParameters"]
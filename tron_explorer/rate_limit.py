@@ -0,0 +1,153 @@
+import json
+import threading
+import time
+
+from tron_explorer.exceptions import ParameterException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None
+
+
+class RateLimiter:
+    """
+    a token bucket rate limiter that every request of a session passes through. it is safe to share between threads,
+    and when a path is given the buckets are kept in a file so several processes on one machine share one budget.
+
+    each request reserves the earliest moment that every matching bucket allows and sleeps until then, so requests are
+    spread at the allowed rate instead of being sent in bursts and rejected.
+
+    :param rate: number of requests per second allowed for all endpoints together. None for no global limit.
+    :type rate: float
+
+    :param burst: number of requests that can be sent at once after a pause.
+    :type burst: int
+
+    :param endpoints: requests per second allowed for specific api segments, for example {"/transaction": 2}.
+                      a segment also limits its sub segments ("/block" limits "/block/latest").
+    :type endpoints: dict
+
+    :param path: path of the file that buckets are shared through. default is None (shared between threads only).
+    :type path: str
+
+    :cvar GLOBAL_BUCKET: name of the bucket that limits all endpoints together.
+    :type GLOBAL_BUCKET: str
+
+    """
+
+    GLOBAL_BUCKET = "*"
+
+    def __init__(self, rate: float = None, burst: int = 1, endpoints: dict = None, path: str = None):
+        self.rates = {}
+        if rate is not None:
+            self.rates[self.GLOBAL_BUCKET] = rate
+        if endpoints is not None:
+            self.rates.update(endpoints)
+        self.burst = burst
+        self.path = path
+        self._check_params()
+
+        self._lock = threading.Lock()
+        # theoretical arrival time of the next request of each bucket
+        self._buckets = {}
+
+    def _check_params(self):
+        """
+        checks limiter params for exceptions.
+
+        :raise: ParameterException
+        """
+
+        for rate in self.rates.values():
+            if rate <= 0:
+                raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["rate"])
+        if self.burst < 1:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["burst"])
+        if self.path is not None and fcntl is None:
+            raise ParameterException(ParameterException.SHARED_FILE_EXCEPTION_MESSAGE, ["path"])
+
+    def _matching_buckets(self, address):
+        """
+        :param address: the address of api segment.
+        :type address: str
+
+        :returns: names of buckets that limit the address.
+        :rtype: list
+        """
+
+        names = []
+        for name in self.rates:
+            if name == self.GLOBAL_BUCKET or address == name or address.startswith(name + "/"):
+                names.append(name)
+        return names
+
+    def _reserve(self, buckets: dict, names: list, now: float):
+        """
+        reserves the earliest moment allowed by all buckets and updates them.
+
+        :returns: the reserved moment.
+        :rtype: float
+        """
+
+        send_at = now
+        for name in names:
+            interval = 1 / self.rates[name]
+            allowed = buckets.get(name, now) - (self.burst - 1) * interval
+            send_at = max(send_at, allowed)
+
+        for name in names:
+            interval = 1 / self.rates[name]
+            buckets[name] = max(buckets.get(name, now), send_at) + interval
+
+        return send_at
+
+    def _reserve_shared(self, names: list, now: float):
+        """
+        same as _reserve but the buckets are read from and written to the shared file under an exclusive lock.
+
+        :returns: the reserved moment.
+        :rtype: float
+        """
+
+        with open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                content = file.read()
+                buckets = json.loads(content) if content else {}
+                send_at = self._reserve(buckets, names, now)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets))
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+        return send_at
+
+    def acquire(self, address: str = ""):
+        """
+        blocks until a request to the address is allowed.
+
+        :param address: the address of api segment.
+        :type address: str
+
+        :returns: seconds waited.
+        :rtype: float
+        """
+
+        names = self._matching_buckets(address)
+        if len(names) == 0:
+            return 0
+
+        with self._lock:
+            now = time.time()
+            if self.path is None:
+                send_at = self._reserve(self._buckets, names, now)
+            else:
+                send_at = self._reserve_shared(names, now)
+
+        wait = send_at - now
+        if wait > 0:
+            time.sleep(wait)
+        return max(wait, 0)
@@ -0,0 +1,203 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from tron_explorer.exceptions import ParameterException
+
+
+class RetryPolicy:
+    """
+    decides which failed requests are sent again and how long to wait before each try. waits grow exponentially with
+    random jitter, and a Retry-After header sent by the api is respected.
+
+    :param retries: maximum number of times a failed request is sent again.
+    :type retries: int
+
+    :param backoff: wait before the first retry in seconds. each next retry waits twice as long.
+    :type backoff: float
+
+    :param max_backoff: maximum wait between two tries in seconds.
+    :type max_backoff: float
+
+    :param jitter: fraction of each wait that is randomized so parallel callers dont retry at the same moment.
+    :type jitter: float
+
+    :param statuses: http status codes that are retried.
+    :type statuses: tuple
+
+    :cvar RETRY_STATUSES: default status codes that are retried (throttling and temporary server errors).
+    :type RETRY_STATUSES: tuple
+
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, retries: int = 5, backoff: float = 0.5, max_backoff: float = 60, jitter: float = 0.5,
+                 statuses: tuple = RETRY_STATUSES):
+        if retries < 0:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["retries"])
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = statuses
+
+    def is_retryable(self, response):
+        """
+        :param response: the api response.
+        :type response: requests.Response
+
+        :returns: whether if the request of the response should be sent again.
+        :rtype: bool
+        """
+
+        return response.status_code in self.statuses
+
+    @staticmethod
+    def _retry_after(response):
+        """
+        :returns: seconds asked by the Retry-After header of the response, None when there is no valid header.
+        :rtype: float
+        """
+
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return None
+
+    def wait_time(self, attempt: int, response=None):
+        """
+        :param attempt: number of the failed try, starting from 0.
+        :type attempt: int
+
+        :param response: the failed response, None when no response was received.
+        :type response: requests.Response
+
+        :returns: seconds to wait before the next try.
+        :rtype: float
+        """
+
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        wait = min(self.backoff * (2 ** attempt), self.max_backoff)
+        return wait * (1 - self.jitter * random.random())
+
+
+class CircuitBreaker:
+    """
+    stops sending requests to an api segment that keeps failing. after failure_threshold consecutive failures the
+    circuit of the segment opens and callers pause until reset_timeout has passed. then one trial request is let
+    through, if it succeeds the circuit closes, otherwise it opens again. a trial request that is not finished after
+    trial_timeout is given up and the next caller sends another one.
+
+    :param failure_threshold: number of consecutive failures that opens the circuit.
+    :type failure_threshold: int
+
+    :param reset_timeout: seconds the circuit stays open before a trial request.
+    :type reset_timeout: float
+
+    :param trial_timeout: seconds a trial request can take before callers waiting for it send another one.
+    :type trial_timeout: float
+
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10, trial_timeout: float = 60):
+        if failure_threshold < 1:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["failure_threshold"])
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.trial_timeout = trial_timeout
+
+        self._condition = threading.Condition()
+        self._failures = {}
+        self._opened_at = {}
+        # start time of the trial request of each half open address
+        self._trials = {}
+
+    def is_open(self, address: str):
+        """
+        :returns: whether if the circuit of the address is open.
+        :rtype: bool
+        """
+
+        with self._condition:
+            return address in self._opened_at
+
+    def wait(self, address: str):
+        """
+        blocks while the circuit of the address is open.
+
+        :param address: the address of api segment.
+        :type address: str
+
+        :returns: seconds waited.
+        :rtype: float
+        """
+
+        started = time.monotonic()
+        with self._condition:
+            while True:
+                opened_at = self._opened_at.get(address)
+                if opened_at is None:
+                    break
+
+                now = time.monotonic()
+                remaining = opened_at + self.reset_timeout - now
+                trial_remaining = self._trials.get(address, now - self.trial_timeout) + self.trial_timeout - now
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                elif trial_remaining <= 0:
+                    # half open, this caller sends the trial request
+                    self._trials[address] = now
+                    break
+                else:
+                    # half open, wait for the result of the trial request
+                    self._condition.wait(trial_remaining)
+
+        return time.monotonic() - started
+
+    def record_success(self, address: str):
+        """
+        closes the circuit of the address.
+        """
+
+        with self._condition:
+            self._failures.pop(address, None)
+            self._opened_at.pop(address, None)
+            self._trials.pop(address, None)
+            self._condition.notify_all()
+
+    def record_failure(self, address: str):
+        """
+        counts a failure of the address and opens its circuit when threshold is reached or a trial request failed.
+        """
+
+        with self._condition:
+            failures = self._failures.get(address, 0) + 1
+            self._failures[address] = failures
+            if failures >= self.failure_threshold or address in self._trials:
+                self._opened_at[address] = time.monotonic()
+            self._trials.pop(address, None)
+            self._condition.notify_all()
+
+    def release(self, address: str):
+        """
+        gives up the trial request of the address without a result, when it is stopped by an error that is not a
+        failure of the api. the next caller sends another trial request.
+        """
+
+        with self._condition:
+            if self._trials.pop(address, None) is not None:
+                self._condition.notify_all()
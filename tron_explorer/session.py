@@ -0,0 +1,192 @@
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from tron_explorer.cache import ResponseCache, EntityCache
+from tron_explorer.coalesce import RequestCoalescer
+from tron_explorer.decoder import JsonDecoder, default_decoder
+from tron_explorer.exceptions import ParameterException
+from tron_explorer.planner import WindowPlanner
+from tron_explorer.rate_limit import RateLimiter
+from tron_explorer.retry import RetryPolicy, CircuitBreaker
+from tron_explorer.stats import RequestStats
+from tron_explorer.transport import Transport
+
+
+class HttpSession:
+    """
+    a pooled keep-alive http session. one session is owned by each Explore object and every request made through it
+    reuses the open connections of the pool instead of opening a new connection per page.
+
+    :param pool_size: maximum number of connections that are kept open to the api host.
+    :type pool_size: int
+
+    :param timeout: timeout of each request in seconds, either a single number or a (connect, read) tuple.
+    :type timeout: float or tuple
+
+    :param keep_alive: if set to False connections are closed after each request.
+    :type keep_alive: bool
+
+    :param rate_limiter: the limiter that every request of the session passes through. default is None (no limit).
+    :type rate_limiter: RateLimiter
+
+    :param retry_policy: decides which failed requests are sent again. default is RetryPolicy().
+    :type retry_policy: RetryPolicy
+
+    :param circuit_breaker: pauses requests to api segments that keep failing. default is CircuitBreaker().
+    :type circuit_breaker: CircuitBreaker
+
+    :param cache: the cache that responses are looked up in before being requested. default is None (no cache).
+    :type cache: ResponseCache
+
+    :param entity_cache: in-process cache of single blocks and transactions. default is None (no cache).
+    :type entity_cache: EntityCache
+
+    :param coalesce: if set to True identical requests sent at the same time share one request.
+    :type coalesce: bool
+
+    :param transport: the transport that requests are sent through, for example RecordingTransport or
+                      ReplayTransport. default is None (requests are sent over the pooled connections).
+    :type transport: Transport
+
+    :param decoder: decodes response bodies, for example JsonDecoder, OrjsonDecoder or IncrementalDecoder. default is
+                    OrjsonDecoder when orjson is installed and JsonDecoder otherwise.
+    :type decoder: JsonDecoder
+
+    :param page_workers: maximum number of pages of a list query window that are requested at the same time. default
+                         is 1 (pages are requested one by one). more workers than pool_size wait for a connection.
+    :type page_workers: int
+
+    :param time_shards: number of sub ranges that list queries with both start and end time are split into and
+                        requested at the same time. default is 1 (no split).
+    :type time_shards: int
+
+    :param planner: estimates density of instances and plans the time shards of list queries. default is
+                    WindowPlanner().
+    :type planner: WindowPlanner
+
+    :param page_sizes: largest number of instances in a page of list queries by api segment address, in addition to
+                       SendRequestMultiple.PAGE_SIZES. a smaller page size that an api segment turns out to have is
+                       learned into it.
+    :type page_sizes: dict
+
+    :param live_fsync_interval: number of pages between forcing the live saved file of list queries to disk, 0 for
+                                never. default is SendRequestMultiple.LIVE_FSYNC_INTERVAL.
+    :type live_fsync_interval: int
+
+    :param live_atomic: if set to True list queries live save to query.csv.part, which is renamed to query.csv once
+                        the query is complete. default is SendRequestMultiple.LIVE_ATOMIC.
+    :type live_atomic: bool
+
+    :ivar stats: decode instrumentation of the responses of the session.
+    :type stats: RequestStats
+
+    :cvar DEFAULT_POOL_SIZE: default maximum number of connections kept open.
+    :type DEFAULT_POOL_SIZE: int
+
+    :cvar DEFAULT_TIMEOUT: default (connect, read) timeout in seconds.
+    :type DEFAULT_TIMEOUT: tuple
+
+    """
+
+    DEFAULT_POOL_SIZE = 10
+    DEFAULT_TIMEOUT = (10, 60)
+
+    _default = None
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, keep_alive: bool = True,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 circuit_breaker: CircuitBreaker = None, cache: ResponseCache = None,
+                 entity_cache: EntityCache = None, coalesce: bool = True, transport: Transport = None,
+                 decoder: JsonDecoder = None, page_workers: int = 1, time_shards: int = 1,
+                 planner: WindowPlanner = None, page_sizes: dict = None, live_fsync_interval: int = None,
+                 live_atomic: bool = None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self.cache = cache
+        self.entity_cache = entity_cache
+        self.coalescer = RequestCoalescer() if coalesce else None
+        self.decoder = decoder if decoder is not None else default_decoder()
+        self.stats = RequestStats()
+        if page_workers <= 0:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["page_workers"])
+        self.page_workers = page_workers
+        if time_shards <= 0:
+            raise ParameterException(ParameterException.COUNT_EXCEPTION_MESSAGE, ["time_shards"])
+        self.time_shards = time_shards
+        self.planner = planner if planner is not None else WindowPlanner()
+        self.page_sizes = dict(page_sizes) if page_sizes is not None else {}
+        self.live_fsync_interval = live_fsync_interval
+        self.live_atomic = live_atomic
+        self._session = self._build_session()
+        self.transport = transport
+        if transport is not None:
+            transport.bind(self._session)
+
+    def _build_session(self):
+        """
+        creates the underlying requests session with a connection pool mounted for both schemes.
+
+        :returns: the configured session.
+        :rtype: requests.Session
+        """
+
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, pool_block=True)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if self.keep_alive:
+            session.headers["Connection"] = "keep-alive"
+        else:
+            session.headers["Connection"] = "close"
+        return session
+
+    @classmethod
+    def default(cls):
+        """
+        the session shared by requests that are not made through an Explore object.
+
+        :returns: the shared default session.
+        :rtype: HttpSession
+        """
+
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def get(self, url: str, params: dict = None):
+        """
+        sends a get request over the pooled connections or through the transport of the session.
+
+        :param url: full url of the request.
+        :type url: str
+
+        :param params: parameters of api request.
+        :type params: dict
+
+        :returns: the api response.
+        :rtype: requests.Response
+        """
+
+        if self.transport is not None:
+            return self.transport.get(url=url, params=params, timeout=self.timeout)
+        return self._session.get(url=url, params=params, timeout=self.timeout)
+
+    def close(self):
+        """
+        closes every open connection of the pool and the transport.
+        """
+
+        if self.transport is not None:
+            self.transport.close()
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
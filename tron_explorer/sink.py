@@ -0,0 +1,315 @@
+import csv
+import os
+import queue
+import threading
+
+from tron_explorer.columns import ColumnPage
+
+
+class CsvSink:
+    """
+    an append only csv file that data instances are written to as their pages are downloaded. the header is written
+    once and each page only appends its own rows, so writing a query costs time linear in its size instead of
+    rewriting the whole file for every page. the file has the same layout as DataFrame.to_csv, columns are in order of
+    first appearance and the first column is the row index. values of the columns that are declared float64 are
+    written the way pandas writes them, 16 as 16.0.
+
+    instances of some queries have different properties (for example transactions of different types), when a page
+    has a property that is not in the header yet the file is rewritten once with the wider header. the wider file is
+    written next to the file and replaces it in one step, and on_widen is called before that so a checkpoint can be
+    saved for the wider file before any row is appended to it.
+
+    :param path: path of the csv file.
+    :type path: str
+
+    :param fsync_interval: number of pages between forcing the file to disk. pages are always flushed to the
+                           operating system, 0 never forces them to disk.
+    :type fsync_interval: int
+
+    :param atomic: if set to True rows are written to path + ".part" which is renamed to path once the sink is closed,
+                   so path only ever has a complete query. when the download fails the part file is kept.
+    :type atomic: bool
+
+    :param dtypes: declared dtype of each property. default is None (values are written as they are).
+    :type dtypes: dict
+
+    :cvar PART_SUFFIX: suffix of the file that is written to when atomic is True.
+    :type PART_SUFFIX: str
+
+    :cvar WIDEN_SUFFIX: suffix of the file that the rows are copied to under a wider header.
+    :type WIDEN_SUFFIX: str
+
+    """
+
+    PART_SUFFIX = ".part"
+    WIDEN_SUFFIX = ".wide"
+
+    def __init__(self, path: str, fsync_interval: int = 10, atomic: bool = False, dtypes: dict = None):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.atomic = atomic
+        self.dtypes = dtypes if dtypes is not None else {}
+        self.rows = 0
+        self.pages = 0
+        self.fields = []
+        self._fields = set()
+        self._file = None
+        self._writer = None
+        # function of (rows, fields, size) of the wider file, called before it replaces the file
+        self.on_widen = None
+
+    @property
+    def write_path(self):
+        """
+        :returns: path of the file that rows are written to.
+        :rtype: str
+        """
+
+        return self.path + self.PART_SUFFIX if self.atomic else self.path
+
+    @property
+    def size(self):
+        """
+        :returns: number of bytes written to the file, 0 when nothing is written yet.
+        :rtype: int
+        """
+
+        if self._file is None:
+            return 0
+        return os.fstat(self._file.fileno()).st_size
+
+    def resume(self, rows: int, fields: list, size: int):
+        """
+        continues writing a file that a previous sink stopped writing. anything after size bytes is from a page that
+        the previous sink did not finish and is removed.
+
+        :param rows: number of rows in the first size bytes of the file.
+        :type rows: int
+
+        :param fields: the header of the file, without the index column.
+        :type fields: list
+
+        :param size: number of bytes of the file that are kept.
+        :type size: int
+        """
+
+        self.recover(fields)
+        self._open("r+")
+        self._file.truncate(size)
+        self._file.seek(0, os.SEEK_END)
+        self.rows = rows
+        self.fields = list(fields)
+        self._fields = set(fields)
+
+    def recover(self, fields: list):
+        """
+        finishes or drops a rewrite with a wider header that a previous sink stopped before the wider file replaced
+        the file. the wider file is used when the saved state is already of its header, otherwise the file still
+        matches the state and the wider file is removed.
+
+        :param fields: the header of the saved state, without the index column.
+        :type fields: list
+        """
+
+        wide_path = self.write_path + self.WIDEN_SUFFIX
+        if not os.path.exists(wide_path):
+            return
+        with open(wide_path, newline="", encoding="utf-8") as wide:
+            header = next(csv.reader(wide), [])
+        if header[1:] == list(fields):
+            os.replace(wide_path, self.write_path)
+        else:
+            os.remove(wide_path)
+
+    def _open(self, mode):
+        self._file = open(self.write_path, mode, newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+
+    def _new_fields(self, page):
+        """
+        :returns: properties of the page that are not in the header yet, in order of first appearance.
+        :rtype: list
+        """
+
+        if isinstance(page, ColumnPage):
+            keys = page.columns
+        else:
+            keys = (key for d in page for key in d)
+
+        fields = []
+        for key in keys:
+            if key not in self._fields:
+                self._fields.add(key)
+                fields.append(key)
+        return fields
+
+    def _widen(self, fields):
+        """
+        rewrites the file with new properties added to the header, rows that were already written are left empty
+        in the new columns.
+        """
+
+        self._file.close()
+        wide_path = self.write_path + self.WIDEN_SUFFIX
+        with open(self.write_path, newline="", encoding="utf-8") as old, \
+                open(wide_path, "w", newline="", encoding="utf-8") as wide:
+            reader = csv.reader(old)
+            next(reader)
+            writer = csv.writer(wide)
+            writer.writerow([""] + self.fields + fields)
+            padding = [""] * len(fields)
+            for row in reader:
+                writer.writerow(row + padding)
+            wide.flush()
+            os.fsync(wide.fileno())
+            size = os.fstat(wide.fileno()).st_size
+
+        if self.on_widen is not None:
+            self.on_widen(self.rows, self.fields + fields, size)
+        os.replace(wide_path, self.write_path)
+        self._open("a")
+
+    @staticmethod
+    def _float(value):
+        """
+        :returns: the value as pandas writes it in a float64 column, an int as a float.
+        """
+
+        if isinstance(value, int) and not isinstance(value, bool):
+            try:
+                return float(value)
+            except OverflowError:
+                return value
+        return value
+
+    def write(self, page: list):
+        """
+        appends the data instances of a page.
+
+        :param page: dicts of data instances, or a ColumnPage.
+        :type page: list
+        """
+
+        if len(page) == 0:
+            return
+
+        fields = self._new_fields(page)
+        if self._file is None:
+            self._open("w")
+            self._writer.writerow([""] + fields)
+            self.fields.extend(fields)
+        elif len(fields) > 0:
+            self._widen(fields)
+            self.fields.extend(fields)
+
+        floats = [i for i, field in enumerate(self.fields) if self.dtypes.get(field) == "float64"]
+        if isinstance(page, ColumnPage):
+            columns = [page.column(field) for field in self.fields]
+            for i in floats:
+                columns[i] = [self._float(value) for value in columns[i]]
+            self._writer.writerows(zip(range(self.rows, self.rows + len(page)), *columns))
+            self.rows += len(page)
+        else:
+            rows = []
+            for d in page:
+                row = [d.get(field) for field in self.fields]
+                for i in floats:
+                    row[i] = self._float(row[i])
+                rows.append([self.rows] + row)
+                self.rows += 1
+            self._writer.writerows(rows)
+
+        self._file.flush()
+        self.pages += 1
+        if self.fsync_interval > 0 and self.pages % self.fsync_interval == 0:
+            os.fsync(self._file.fileno())
+
+    def close(self, complete: bool = True):
+        """
+        forces the file to disk and closes it.
+
+        :param complete: whether if every instance of the query was written. the part file of an atomic sink is only
+                         renamed to path when it is complete.
+        :type complete: bool
+        """
+
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        if self.atomic and complete:
+            os.replace(self.write_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(complete=exc_type is None)
+
+
+class QueuedWriter:
+    """
+    runs writes on a thread of its own that is fed through a bounded queue, so the thread that produces items only
+    waits for the writes when the queue is full. items are written in order, once a write fails the next items are
+    dropped and the error is raised on the producing thread.
+
+    :param write: function that writes an item.
+    :type write: callable
+
+    :param size: maximum number of items waiting in the queue.
+    :type size: int
+
+    """
+
+    _STOP = object()
+
+    def __init__(self, write, size: int):
+        self.write = write
+        self._queue = queue.Queue(maxsize=size)
+        self._error = None
+        self._failed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            if self._failed:
+                continue
+            try:
+                self.write(item)
+            except BaseException as e:
+                self._error = e
+                self._failed = True
+
+    def _raise(self):
+        """
+        raises the error of a failed write once.
+        """
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def put(self, item):
+        """
+        queues an item to be written, waits while the queue is full.
+
+        :param item: the item.
+        """
+
+        self._raise()
+        self._queue.put(item)
+
+    def close(self):
+        """
+        waits for the queued items to be written and stops the thread.
+        """
+
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._raise()
@@ -1,6 +1,7 @@
 from tron_explorer.data_map import DataMap
 from tron_explorer.exceptions import ParameterException
 from tron_explorer.utils import SendRequestSingle, SendRequestMultiple
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit
@@ -53,6 +54,9 @@ class SmartContractDataMap(DataMap):
 
         """
 
+    properties_dtypes = {"timestamp": "int64", "balance": "int64", "number_of_calls": "int64"
+        , "remaining_energy": "int64"}
+
     def __init__(self, data, properties):
         super().__init__(data, properties)
 
@@ -115,6 +119,9 @@ class SmartContract:
     _API_CONTRACT_ADDRESS = "/contract"
     _API_CONTRACTS_ADDRESS = "/contracts"
 
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
+
     @staticmethod
     def _check_list_params(sort):
         """
@@ -128,7 +135,7 @@ class SmartContract:
         if sort not in ["number_of_calls", "balance" , "timestamp"]:
             raise ParameterException(ParameterException.SORT_EXCEPTION_MESSAGE, ["sort"])
 
-    def get_smart_contract(self, contract_address: str, properties: list = None):
+    def get_smart_contract(self, contract_address: str, properties: list = None, records: bool = False):
         """
         get data for a specific smart contract.
 
@@ -138,6 +145,9 @@ class SmartContract:
         :args:
             * *properties* (``list``)
                 properties of accounts that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: SmartContractDataMap
@@ -145,9 +155,9 @@ class SmartContract:
         """
 
         params = {"contract": contract_address}
-        req = SendRequestSingle(self._API_CONTRACT_ADDRESS, params)
+        req = SendRequestSingle(self._API_CONTRACT_ADDRESS, params, self.session)
         data = req.get_data()
-        return SmartContractDataMap(data["data"][0], properties)
+        return SmartContractDataMap.single(data["data"][0], properties, records)
 
     def get_smart_contract_list_blockchain(self, start_timestamp: int = None
                                            , end_timestamp: int = None
@@ -158,7 +168,8 @@ class SmartContract:
                                            , properties: list = None
                                            , count: int = 10000
                                            , verified_only: bool = False
-                                           , open_source_only: bool = False):
+                                           , open_source_only: bool = False
+                                           , resume: bool = False):
         """
         get data for a list of account.
 
@@ -185,6 +196,9 @@ class SmartContract:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
 
         :returns: a panda dataframe containing data of desired contracts.
@@ -197,6 +211,53 @@ class SmartContract:
                   "order": order, "sort": sort, "verified-only": verified_only, "open-source-only": open_source_only}
 
         address = self._API_CONTRACTS_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=10000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=10000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, SmartContractDataMap)
         return data
+
+    def iter_smart_contract_list_blockchain(self, start_timestamp: int = None
+                                            , end_timestamp: int = None
+                                            , sort: str = "timestamp"
+                                            , order: str = "DESC"
+                                            , properties: list = None
+                                            , count: int = 10000
+                                            , verified_only: bool = False
+                                            , open_source_only: bool = False
+                                            , chunks: bool = False):
+        """
+        get data for a list of account, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of contracts that will be returned. default is all.
+            * *sort* (``str``)
+                the property that contracts are ordered by. can be sorted by "number_of_calls", "balance", "timestamp".
+                default is "timestamp".
+            * *order* (``str``)
+                order of contracts by sort ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired contracts. default is 10000. is ignored when both times are specified.
+            * *verified_only* (``bool``)
+                get only verified contracts.
+            * *open_source_only* (``bool``)
+                get only open_source_only contracts.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired contracts data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+        self._check_list_params(sort)
+
+        params = {"start_timestamp": start_timestamp, "end_timestamp": end_timestamp,
+                  "order": order, "sort": sort, "verified-only": verified_only, "open-source-only": open_source_only}
+
+        address = self._API_CONTRACTS_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=10000, session=self.session)
+        return req.iter_data_multiple(count, properties, SmartContractDataMap, chunks=chunks)
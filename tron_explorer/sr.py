@@ -1,7 +1,10 @@
 from tron_explorer.data_map import DataMap
 
+from tron_explorer.columns import ColumnBuilder, ColumnPage
+
 # noinspection PyAttributeOutsideInit
-from tron_explorer.utils import SendRequestSingle, MiscUtils
+from tron_explorer.utils import SendRequestSingle
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit
@@ -44,6 +47,9 @@ class SrDataMap(DataMap):
 
         """
 
+    properties_dtypes = {"produced_total": "int64", "produced_percentage": "float64", "realtime_votes": "int64"
+        , "change_votes": "int64", "votes_percentage": "float64", "annual_rate": "float64", "rank": "int64"}
+
     def __init__(self, data, properties):
         super().__init__(data, properties)
 
@@ -80,6 +86,26 @@ class SrDataMap(DataMap):
             except KeyError:
                 setattr(self, p, None)
 
+    @classmethod
+    def _compile_batch(cls, properties):
+        plan = cls._plan(properties, "SR")
+        columns = cls._columns([(p, key) for p, key in plan if key != ""])
+        computed = {"produced_percentage": ("producePercentage", "produceEfficiency"),
+                    "rank": ("realTimeRanking", "index")}
+        # like filter_data, distribution is never set
+        names = [p for p, key in plan if key != "" or p in computed]
+
+        def batch(rows):
+            if len(rows) == 0:
+                return ColumnPage({}, 0)
+            page = columns(rows)
+            for p, (key, fallback) in computed.items():
+                if p in names:
+                    page[p] = [d[key] if key in d else d.get(fallback) for d in rows]
+            return ColumnPage({p: page[p] for p in names}, len(rows))
+
+        return batch
+
 
 # noinspection PyIncorrectDocstring
 class SR:
@@ -91,6 +117,9 @@ class SR:
     _API_SINGLE_SR_ADDRESS = "/vote/witness"
     _API_SR_LIST_ADDRESS = "/pagewitness"
 
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
+
     @staticmethod
     def _check_list_params(sr_type):
         """
@@ -104,7 +133,33 @@ class SR:
         if sr not in ["all", "sr", "sr_partner", "sr_candidate"]:
             raise ParameterException(ParameterException.SR_TYPE_EXCEPTION_MESSAGE, ["sr_type"])
 
-    def get_sr(self, sr_address: str, properties: list = None):
+    @staticmethod
+    def _build_list_params(sr_type):
+        """
+        make request params of sr list.
+
+        :param sr_type: type of sr.
+        :type sr_type: str
+
+        :returns: request params.
+        :rtype: dict
+
+        """
+
+        params = {}
+
+        if sr_type == "sr":
+            params["witnesstype"] = 1
+        if sr_type == "sr_partner":
+            params["witnesstype"] = 2
+        if sr_type == "sr_candidate":
+            params["witnesstype"] = 3
+        if sr_type == "all":
+            pass
+
+        return params
+
+    def get_sr(self, sr_address: str, properties: list = None, records: bool = False):
         """
         get a specific SR.
 
@@ -114,6 +169,9 @@ class SR:
         :args:
             * *properties* (``list``)
                 properties of blocks that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired block data.
         :rtype: BlockDataMap
@@ -121,9 +179,9 @@ class SR:
         """
 
         params = {"address": sr_address}
-        req = SendRequestSingle(self._API_SINGLE_SR_ADDRESS, params)
+        req = SendRequestSingle(self._API_SINGLE_SR_ADDRESS, params, self.session)
         data = req.get_data()
-        return SrDataMap(data["data"], properties)
+        return SrDataMap.single(data["data"], properties, records)
 
     def get_sr_list(self, sr_type: str = "all", properties: list = None):
 
@@ -142,23 +200,11 @@ class SR:
         :rtype: Pandas Dataframe
 
         """
-        params = {}
-
-        if sr_type == "sr":
-            params["witnesstype"] = 1
-        if sr_type == "sr_partner":
-            params["witnesstype"] = 2
-        if sr_type == "sr_candidate":
-            params["witnesstype"] = 3
-        if sr_type == "all":
-            pass
+        params = self._build_list_params(sr_type)
 
         address = self._API_SR_LIST_ADDRESS
-        req = SendRequestSingle(address, params)
+        req = SendRequestSingle(address, params, self.session)
         data = req.get_data()
-        all_data = []
-        for d in data["data"]:
-            d_filtered = SrDataMap(d, properties)
-            all_data.append(d_filtered.__dict__)
-
-        return MiscUtils.dict_list_df(all_data)
+        columns = ColumnBuilder(SrDataMap.properties_dtypes)
+        columns.append(SrDataMap.batch(properties)(data["data"]))
+        return columns.frame()
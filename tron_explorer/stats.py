@@ -0,0 +1,121 @@
+import threading
+from collections import deque
+
+
+class RequestStats:
+    """
+    instrumentation of the requests sent through a session. totals are kept for the life of the session and a record
+    is kept for each of the latest responses. pages of list queries are also counted against pages of the base page
+    size, to show the requests and instances that sizing pages saved.
+
+    list queries are a pipeline of stages, and the seconds spent in each stage are added up in stages:
+
+        * *fetch*: requesting and decoding pages, on worker threads.
+        * *fetch_wait*: mapping waiting for the next page. when it is high the network limits throughput.
+        * *map*: mapping instances of pages with their DataMap.
+        * *sink*: writing live saved pages, on the writer thread.
+        * *sink_wait*: mapping waiting for room in the queue of the writer. when it is high the sink limits throughput.
+
+    :param history: number of latest responses that a record is kept for.
+    :type history: int
+
+    :cvar STAGES: names of the stages of list queries.
+    :type STAGES: tuple
+
+    """
+
+    STAGES = ("fetch", "fetch_wait", "map", "sink", "sink_wait")
+
+    def __init__(self, history: int = 1000):
+        self.responses = 0
+        self.bytes = 0
+        self.decode_seconds = 0.0
+        self.pages = deque(maxlen=history)
+        self.list_pages = 0
+        self.list_pages_saved = 0
+        self.rows_requested = 0
+        self.rows_saved = 0
+        self.stages = dict.fromkeys(self.STAGES, 0.0)
+        self._lock = threading.Lock()
+
+    def record_decode(self, address: str, size: int, seconds: float):
+        """
+        records decoding of a response.
+
+        :param address: the address of api segment.
+        :type address: str
+
+        :param size: size of the response body in bytes.
+        :type size: int
+
+        :param seconds: seconds spent decoding the response.
+        :type seconds: float
+        """
+
+        with self._lock:
+            self.responses += 1
+            self.bytes += size
+            self.decode_seconds += seconds
+            self.pages.append({"address": address, "size": size, "decode_seconds": seconds})
+
+    def record_page(self, size: int, base_size: int):
+        """
+        records a page request of a list query.
+
+        :param size: number of instances requested in the page.
+        :type size: int
+
+        :param base_size: page size that list queries used before pages were sized per api segment and count.
+        :type base_size: int
+        """
+
+        with self._lock:
+            self.list_pages += 1
+            self.rows_requested += size
+            # pages of base size that the page replaces, and instances that they would have had after the page
+            base_pages = -(-size // base_size)
+            self.list_pages_saved += base_pages - 1
+            self.rows_saved += base_pages * base_size - size
+
+    def record_stage(self, stage: str, seconds: float):
+        """
+        records time spent in a stage of list queries.
+
+        :param stage: one of STAGES.
+        :type stage: str
+
+        :param seconds: seconds spent in the stage.
+        :type seconds: float
+        """
+
+        with self._lock:
+            self.stages[stage] += seconds
+
+    def summary(self):
+        """
+        :returns: number and total size of decoded responses, total and average decode time, the page requests and
+        instances that sizing pages of list queries saved, and seconds spent in each stage of list queries.
+        :rtype: dict
+        """
+
+        with self._lock:
+            return {"responses": self.responses, "bytes": self.bytes, "decode_seconds": self.decode_seconds,
+                    "decode_seconds_per_page": self.decode_seconds / self.responses if self.responses else 0.0,
+                    "list_pages": self.list_pages, "list_pages_saved": self.list_pages_saved,
+                    "rows_requested": self.rows_requested, "rows_saved": self.rows_saved, "stages": dict(self.stages)}
+
+    def reset(self):
+        """
+        removes every record and total.
+        """
+
+        with self._lock:
+            self.responses = 0
+            self.bytes = 0
+            self.decode_seconds = 0.0
+            self.pages.clear()
+            self.list_pages = 0
+            self.list_pages_saved = 0
+            self.rows_requested = 0
+            self.rows_saved = 0
+            self.stages = dict.fromkeys(self.STAGES, 0.0)
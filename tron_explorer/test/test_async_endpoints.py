@@ -0,0 +1,21 @@
+import asyncio
+from tron_explorer.async_explore import AsyncExplore
+
+
+async def main():
+    async with AsyncExplore() as explore:
+        # getting blocks, SRs and tokens at the same time
+        df_blocks, df_srs, df_tokens = await asyncio.gather(explore.get_block_list(count=2000)
+                                                            , explore.get_sr_list(sr_type="sr")
+                                                            , explore.get_token_list(count=100))
+        print(df_blocks["number"], df_srs["name"], df_tokens["name"])
+
+        # getting a specific block
+        block = await explore.get_block(45986120)
+        print(block.size)
+
+        # getting transactions as their pages are downloaded
+        async for transaction in explore.iter_transaction_list_blockchain(count=200):
+            print(transaction["hash"])
+
+asyncio.run(main())
@@ -11,4 +11,8 @@ print(block.size)
 
 # getting a list of blocks
 df_blocks = explore.get_block_list(start_timestamp=1668537846000, end_timestamp=1668539846000)
-print(df_blocks["block_reward"])
\ No newline at end of file
+print(df_blocks["block_reward"])
+
+# streaming blocks as they are downloaded
+for block in explore.iter_block_list(start_timestamp=1668537846000, end_timestamp=1668539846000):
+    print(block["number"])
\ No newline at end of file
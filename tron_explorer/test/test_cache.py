@@ -0,0 +1,188 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.stub_server import serve
+from tron_explorer import cache
+from tron_explorer.block import Block
+from tron_explorer.cache import EntityCache, ResponseCache
+from tron_explorer.session import HttpSession
+from tron_explorer.utils import SendRequestSingle
+
+
+class Clock:
+    """
+    a clock that is moved by the test, in place of the time module of cache.
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+class ResponseCacheTest(unittest.TestCase):
+    """
+    responses expire after the ttl of their api segment, confirmed ones never expire, and the least recently used ones
+    are evicted when the cache is full.
+
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite")
+        self.clock = Clock()
+        patcher = mock.patch.object(cache, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def open(self, **kwargs):
+        response_cache = ResponseCache(self.path, **kwargs)
+        self.addCleanup(response_cache.close)
+        return response_cache
+
+    def test_ttl(self):
+        response_cache = self.open(ttls={"/token": 60})
+        response_cache.put("/token", {"id": 1}, {"name": "x"})
+        self.clock.now += 59
+        self.assertEqual(response_cache.get("/token", {"id": 1}), {"name": "x"})
+        self.clock.now += 2
+        self.assertIsNone(response_cache.get("/token", {"id": 1}))
+        self.assertEqual(response_cache.stats()["entries"], 0)
+
+    def test_confirmed_ttl(self):
+        response_cache = self.open(ttls={"/block": ResponseCache.CONFIRMED})
+        response_cache.put("/block", {"number": 1}, {"data": [{"number": 1, "confirmed": True}]})
+        response_cache.put("/block", {"number": 2}, {"data": [{"number": 2, "confirmed": False}]})
+        response_cache.put("/block", {"number": 3}, {"data": [{"number": 3, "confirmed": True},
+                                                              {"number": 4, "confirmed": False}]})
+        response_cache.put("/block", {"number": 5}, {"data": []})
+        self.clock.now += ResponseCache.UNCONFIRMED_TTL - 1
+        self.assertEqual([response_cache.get("/block", {"number": n}) is not None for n in (1, 2, 3, 5)],
+                         [True, True, True, True])
+        # only responses whose instances are all confirmed never expire
+        self.clock.now += 10 ** 6
+        self.assertEqual([response_cache.get("/block", {"number": n}) is not None for n in (1, 2, 3, 5)],
+                         [True, False, False, False])
+
+    def test_lru_eviction(self):
+        body = {"data": "x" * 100}
+        size = len(json.dumps(body))
+        response_cache = self.open(ttls={"/token": None}, max_size=3 * size)
+        for i in range(3):
+            response_cache.put("/token", {"id": i}, body)
+            self.clock.now += 1
+        # reading a response makes it the most recently used one
+        self.assertIsNotNone(response_cache.get("/token", {"id": 0}))
+        self.clock.now += 1
+        response_cache.put("/token", {"id": 3}, body)
+        self.assertEqual([response_cache.get("/token", {"id": i}) is not None for i in range(4)],
+                         [True, False, True, True])
+        self.assertEqual(response_cache.evictions, 1)
+        self.assertLessEqual(response_cache.stats()["size"], 3 * size)
+
+    def test_not_cached(self):
+        response_cache = self.open(ttls={"/token": 60})
+        # segments without a ttl and pages of list queries are not cached
+        response_cache.put("/contract", {"contract": "T"}, {"name": "x"})
+        response_cache.put("/token", {"start": 0, "limit": 50}, {"data": []})
+        self.assertEqual(response_cache.stats()["entries"], 0)
+        pages = self.open(ttls={"/token": 60}, cache_pages=True)
+        pages.put("/token", {"start": 0, "limit": 50}, {"data": []})
+        self.assertEqual(pages.get("/token", {"limit": 50, "start": 0}), {"data": []})
+
+    def test_key(self):
+        self.assertEqual(ResponseCache.make_key("/block", {"b": 1, "a": "x", "c": None}),
+                         ResponseCache.make_key("/block", {"a": "x", "b": "1"}))
+        self.assertNotEqual(ResponseCache.make_key("/block", {"a": 1}), ResponseCache.make_key("/block", {"a": 2}))
+
+    def test_persistent(self):
+        first = self.open(ttls={"/token": 60})
+        first.put("/token", {"id": 1}, {"name": "x"})
+        first.close()
+        # another run or process reads the same file
+        self.assertEqual(self.open(ttls={"/token": 60}).get("/token", {"id": 1}), {"name": "x"})
+
+
+class EntityCacheTest(unittest.TestCase):
+    """
+    confirmed instances are kept until they are the least recently used ones of a full cache, unconfirmed ones only
+    for unconfirmed_ttl seconds.
+
+    """
+
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch.object(cache, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unconfirmed_ttl(self):
+        entity_cache = EntityCache(unconfirmed_ttl=3)
+        entity_cache.put(("/block", "1"), {"number": 1, "confirmed": True})
+        entity_cache.put(("/block", "2"), {"number": 2, "confirmed": False})
+        self.clock.now += 2
+        self.assertEqual([entity_cache.get(("/block", n)) is not None for n in ("1", "2")], [True, True])
+        self.clock.now += 10 ** 6
+        self.assertEqual([entity_cache.get(("/block", n)) is not None for n in ("1", "2")], [True, False])
+
+    def test_lru_eviction(self):
+        entity_cache = EntityCache(max_entries=2)
+        entity_cache.put(("/block", "1"), {"confirmed": True})
+        entity_cache.put(("/block", "2"), {"confirmed": True})
+        entity_cache.get(("/block", "1"))
+        entity_cache.put(("/block", "3"), {"confirmed": True})
+        self.assertEqual([entity_cache.get(("/block", n)) is not None for n in ("1", "2", "3")], [True, False, True])
+        self.assertEqual(entity_cache.evictions, 1)
+
+    def test_fetch(self):
+        entity_cache = EntityCache()
+        calls = []
+
+        def get_data():
+            calls.append(1)
+            return {"number": 1, "confirmed": True}
+
+        self.assertEqual(entity_cache.fetch(("/block", "1"), get_data), entity_cache.fetch(("/block", "1"), get_data))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(entity_cache.stats()["hits"], 1)
+
+
+class EntityCacheSessionTest(unittest.TestCase):
+    """
+    single getters of a session with an entity cache request a confirmed block once, whatever its properties are.
+
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_api = SendRequestSingle.BASE_API
+        cls.server, SendRequestSingle.BASE_API = serve()
+
+    @classmethod
+    def tearDownClass(cls):
+        SendRequestSingle.BASE_API = cls.base_api
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_get_block(self):
+        session = HttpSession(entity_cache=EntityCache())
+        state = self.server.RequestHandlerClass.state
+        requests = state.requests
+        block = Block(session)
+        first = block.get_block(45, properties=["number", "hash"])
+        second = block.get_block(45, properties=["number", "timestamp"], records=True)
+        self.assertEqual((first.number, second.number), (45, 45))
+        self.assertEqual(state.requests - requests, 1)
+        session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
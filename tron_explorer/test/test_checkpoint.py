@@ -0,0 +1,137 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.stub_server import serve, T0
+from tron_explorer.block import BlockDataMap
+from tron_explorer.checkpoint import Checkpoint
+from tron_explorer.exceptions import ParameterException
+from tron_explorer.session import HttpSession
+from tron_explorer.utils import SendRequestMultiple, SendRequestSingle
+
+PARAMS = {"start_timestamp": T0 + 3000 * 1000, "end_timestamp": T0 + 3000 * 3000, "order": "ASC", "sort": "timestamp"}
+
+
+class CheckpointTest(unittest.TestCase):
+    """
+    the checkpoint holds the last saved state until the query is complete.
+
+    """
+
+    def test_save_load_remove(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = Checkpoint(os.path.join(directory, "query.checkpoint.json"))
+            self.assertIsNone(checkpoint.load())
+            checkpoint.save({"cursor": 1})
+            checkpoint.save({"cursor": 2})
+            self.assertEqual(checkpoint.load(), {"cursor": 2})
+            self.assertEqual(os.listdir(directory), ["query.checkpoint.json"])
+            checkpoint.remove()
+            checkpoint.remove()
+            self.assertIsNone(checkpoint.load())
+
+
+class ResumeTest(unittest.TestCase):
+    """
+    a live saved query that crashed is continued from its checkpoint, and its file ends up the same as the file of a
+    query that never crashed.
+
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_api = SendRequestSingle.BASE_API
+        cls.server, SendRequestSingle.BASE_API = serve()
+
+    @classmethod
+    def tearDownClass(cls):
+        SendRequestSingle.BASE_API = cls.base_api
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+
+    def run_query(self, resume=False, crash_after=None, workers=1):
+        """
+        runs a live saved query of blocks, that crashes after crash_after requests.
+
+        :returns: the data of query, None when it crashed, and the number of requests that it sent.
+        """
+
+        get_data = SendRequestSingle.get_data
+        requests = []
+
+        def crashing(request):
+            requests.append(request)
+            if crash_after is not None and len(requests) > crash_after:
+                raise KeyboardInterrupt
+            return get_data(request)
+
+        session = HttpSession(page_workers=workers)
+        self.addCleanup(session.close)
+        request = SendRequestMultiple("/block", True, self.path, dict(PARAMS), 10000, session, resume=resume)
+        with mock.patch.object(SendRequestSingle, "get_data", crashing), contextlib.redirect_stdout(io.StringIO()):
+            try:
+                return request.get_data_multiple(10000, None, BlockDataMap), len(requests)
+            except KeyboardInterrupt:
+                return None, len(requests)
+
+    def read(self, name=SendRequestMultiple.LIVE_FILE):
+        with open(os.path.join(self.path, name), encoding="utf-8") as file:
+            return file.read()
+
+    def test_resume(self):
+        for workers in (1, 4):
+            with self.subTest(workers=workers):
+                expected, requests = self.run_query(workers=workers)
+                expected_file = self.read()
+                self.assertEqual(len(expected), 2001)
+
+                crashed, _ = self.run_query(crash_after=requests // 2, workers=workers)
+                self.assertIsNone(crashed)
+                checkpoint = Checkpoint(os.path.join(self.path, SendRequestMultiple.CHECKPOINT_FILE)).load()
+                self.assertGreater(checkpoint["sink"]["rows"], 0)
+
+                resumed, resumed_requests = self.run_query(resume=True, workers=workers)
+                # only the pages after the checkpoint are downloaded again
+                self.assertLess(resumed_requests, requests)
+                self.assertTrue(expected.equals(resumed))
+                self.assertEqual(self.read(), expected_file)
+                self.assertFalse(os.path.exists(os.path.join(self.path, SendRequestMultiple.CHECKPOINT_FILE)))
+
+    def test_resume_twice(self):
+        expected, requests = self.run_query()
+        expected_file = self.read()
+        self.run_query(crash_after=3)
+        # a resumed query that crashes is resumed from its own checkpoint
+        self.assertIsNone(self.run_query(resume=True, crash_after=requests // 3)[0])
+        self.assertTrue(expected.equals(self.run_query(resume=True)[0]))
+        self.assertEqual(self.read(), expected_file)
+
+    def test_other_query(self):
+        self.run_query(crash_after=3)
+        params = dict(PARAMS, order="DESC", sort="-timestamp")
+        session = HttpSession()
+        self.addCleanup(session.close)
+        request = SendRequestMultiple("/block", True, self.path, params, 10000, session, resume=True)
+        with self.assertRaises(ParameterException) as raised:
+            request.get_data_multiple(10000, None, BlockDataMap)
+        self.assertEqual(raised.exception.message, ParameterException.RESUME_EXCEPTION_MESSAGE)
+
+    def test_not_live_saved(self):
+        session = HttpSession()
+        self.addCleanup(session.close)
+        request = SendRequestMultiple("/block", False, self.path, dict(PARAMS), 10000, session, resume=True)
+        with self.assertRaises(ParameterException) as raised:
+            request.get_data_multiple(10000, None, BlockDataMap)
+        self.assertEqual(raised.exception.message, ParameterException.RESUME_SAVE_LIVE_EXCEPTION_MESSAGE)
+
+
+if __name__ == "__main__":
+    unittest.main()
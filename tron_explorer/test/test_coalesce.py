@@ -0,0 +1,119 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stub_server import serve
+from tron_explorer.block import Block
+from tron_explorer.coalesce import RequestCoalescer
+from tron_explorer.session import HttpSession
+from tron_explorer.utils import SendRequestSingle
+
+
+class RequestCoalescerTest(unittest.TestCase):
+    """
+    callers of a key that is in flight wait for the request of the first caller and get its result or its error.
+
+    """
+
+    CALLERS = 8
+
+    def coalesced(self, coalescer, keys, function):
+        """
+        calls function through coalescer from a thread for each key at the same time.
+
+        :returns: the result or the error of each call.
+        """
+
+        def call(key):
+            try:
+                return coalescer.do(key, lambda: function(key))
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(len(keys)) as executor:
+            return list(executor.map(call, keys))
+
+    def test_single_flight(self):
+        coalescer = RequestCoalescer()
+        calls = []
+        release = threading.Event()
+
+        def function(key):
+            calls.append(key)
+            # the first caller is in flight until every caller asked for the key
+            release.wait(5)
+            return {"key": key}
+
+        threading.Timer(0.2, release.set).start()
+        results = self.coalesced(coalescer, ["a"] * self.CALLERS, function)
+        self.assertEqual(calls, ["a"])
+        self.assertEqual(results, [{"key": "a"}] * self.CALLERS)
+        # every caller gets the same object
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(coalescer.shared, self.CALLERS - 1)
+
+    def test_error(self):
+        coalescer = RequestCoalescer()
+        error = ValueError("failed")
+
+        def function(key):
+            time.sleep(0.2)
+            raise error
+
+        results = self.coalesced(coalescer, ["a"] * self.CALLERS, function)
+        self.assertTrue(all(result is error for result in results))
+
+    def test_keys(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        def function(key):
+            calls.append(key)
+            time.sleep(0.2)
+            return key
+
+        self.assertEqual(self.coalesced(coalescer, ["a", "b", "a", "b"], function), ["a", "b", "a", "b"])
+        self.assertEqual(sorted(calls), ["a", "b"])
+        # a key that is not in flight anymore is requested again
+        self.assertEqual(coalescer.do("a", lambda: function("a")), "a")
+        self.assertEqual(len(calls), 3)
+
+
+class CoalescedSessionTest(unittest.TestCase):
+    """
+    identical requests of a session that are sent at the same time reach the stub server once.
+
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_api = SendRequestSingle.BASE_API
+        cls.server, SendRequestSingle.BASE_API = serve(latency=0.2)
+
+    @classmethod
+    def tearDownClass(cls):
+        SendRequestSingle.BASE_API = cls.base_api
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def requests(self, coalesce):
+        """
+        :returns: the number of requests that 4 threads getting the same block send, and the numbers of the blocks.
+        """
+
+        session = HttpSession(coalesce=coalesce)
+        state = self.server.RequestHandlerClass.state
+        before = state.requests
+        with ThreadPoolExecutor(4) as executor:
+            numbers = list(executor.map(lambda _: Block(session).get_block(45).number, range(4)))
+        session.close()
+        return state.requests - before, numbers
+
+    def test_coalesce(self):
+        self.assertEqual(self.requests(True), (1, [45] * 4))
+        self.assertEqual(self.requests(False), (4, [45] * 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
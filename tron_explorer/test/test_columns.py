@@ -0,0 +1,35 @@
+import io
+import unittest
+
+import pandas as pd
+
+from tron_explorer.columns import ColumnBuilder
+
+
+class TypedTest(unittest.TestCase):
+    """
+    columns are built with their declared dtype when their values fit it.
+
+    """
+
+    def test_bool(self):
+        for values in ([True, False], ["true", "false"], ["True", "False"]):
+            with self.subTest(values=values):
+                column = ColumnBuilder.typed(values, "bool")
+                self.assertEqual(column.dtype, bool)
+                self.assertEqual(list(column), [True, False])
+
+    def test_bool_not_mapped(self):
+        # missing values and values that are not a bool keep the inferred dtype
+        self.assertEqual(list(ColumnBuilder.typed(["false", "maybe"], "bool")), ["false", "maybe"])
+        self.assertEqual(ColumnBuilder.typed([True, None], "bool").dtype, object)
+
+    def test_apply(self):
+        df = pd.read_csv(io.StringIO(',vip,supply\n0,False,16\n1,True,17\n'), index_col=0, dtype=str)
+        df = ColumnBuilder.apply(df, {"vip": "bool", "supply": "float64"})
+        self.assertEqual(list(df["vip"]), [False, True])
+        self.assertEqual(list(df["supply"]), [16.0, 17.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+import contextlib
+import io
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from benchmarks.stub_server import StubHandler, serve, T0
+from tron_explorer.explore import Explore
+from tron_explorer.pagination import BlockRange, TimeBackward, TimeForward
+from tron_explorer.planner import WindowPlanner
+from tron_explorer.session import HttpSession
+from tron_explorer.utils import SendRequestSingle
+
+# a range of 13503 transactions, more than the 10000 instances of a query
+START, END = T0 + 3000 * 1000, T0 + 3000 * 5500
+
+
+def quiet(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+class StubTestCase(unittest.TestCase):
+    """
+    a test case that sends the requests of its tests to a stub server.
+
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_api = SendRequestSingle.BASE_API
+        cls.server, SendRequestSingle.BASE_API = serve()
+        cls.state = cls.server.RequestHandlerClass.state
+
+    @classmethod
+    def tearDownClass(cls):
+        SendRequestSingle.BASE_API = cls.base_api
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def explore(self, **kwargs):
+        session = HttpSession(**kwargs)
+        self.addCleanup(session.close)
+        return Explore(session)
+
+
+class PrefetchTest(StubTestCase):
+    """
+    pages of a query window that are requested ahead on worker threads are returned in order, and only the pages
+    that can contain needed instances are requested.
+
+    """
+
+    def test_workers(self):
+        expected = quiet(self.explore().get_transaction_list_blockchain, count=2345)
+        for workers in (2, 4, 8):
+            with self.subTest(workers=workers):
+                df = quiet(self.explore(page_workers=workers).get_transaction_list_blockchain, count=2345)
+                self.assertTrue(expected.equals(df))
+        self.assertEqual(len(expected), 2345)
+        self.assertEqual(expected["hash"].nunique(), 2345)
+
+    def test_count(self):
+        requests = self.state.requests
+        df = quiet(self.explore(page_workers=8).get_block_list, count=120)
+        # 3 pages of 50 blocks
+        self.assertEqual(len(df), 120)
+        self.assertEqual(self.state.requests - requests, 3)
+
+    def test_short_pages(self):
+        list_ = StubHandler._list
+
+        def capped(handler, path, params, rows):
+            return list_(handler, path, dict(params, limit=str(min(int(params.get("limit", 50)), 30))), rows)
+
+        expected = quiet(self.explore().get_transaction_list_blockchain, count=2345)
+        with mock.patch.object(StubHandler, "_list", capped):
+            for workers in (1, 4):
+                with self.subTest(workers=workers):
+                    explore = self.explore(page_workers=workers, page_sizes={"/transaction": 200})
+                    df = quiet(explore.get_transaction_list_blockchain, count=2345)
+                    # the api caps pages at 30 instances, which is learned as the page size
+                    self.assertTrue(expected.equals(df))
+                    self.assertEqual(explore.session.page_sizes["/transaction"], 30)
+
+
+def time_request(start_timestamp, end_timestamp, edge=None):
+    """
+    :returns: the parts of a SendRequestMultiple that the time strategies use, with the edge timestamp and keys of
+    the last window.
+    """
+
+    return SimpleNamespace(params={"start_timestamp": start_timestamp, "end_timestamp": end_timestamp},
+                           _edge_timestamp=edge, _edge_keys={"a", "b"} if edge is not None else set(),
+                           planner=WindowPlanner(densities={}), density_key=lambda: "/transaction", MAX=10000)
+
+
+class TimeStrategyTest(unittest.TestCase):
+    """
+    the next window of a time ordered query starts at the timestamp of the last instance, and past it when the window
+    only had instances that were returned before.
+
+    """
+
+    def test_forward(self):
+        strategy = TimeForward()
+        request = time_request(100, 500, edge=300)
+        self.assertTrue(strategy.next_window(request, False, 10, 2))
+        self.assertEqual(request.params["start_timestamp"], 300)
+        # the keys of the edge are kept to drop the instances that the next window returns again
+        self.assertEqual(request._edge_keys, {"a", "b"})
+
+        self.assertTrue(strategy.next_window(request, False, 0, 5))
+        self.assertEqual(request.params["start_timestamp"], 301)
+        self.assertEqual((request._edge_timestamp, request._edge_keys), (None, set()))
+        self.assertFalse(strategy.next_window(request, True, 10, 0))
+        # instances without a timestamp cant move the window
+        self.assertFalse(strategy.next_window(time_request(100, 500), False, 10, 0))
+
+    def test_backward(self):
+        strategy = TimeBackward()
+        request = time_request(100, 500, edge=300)
+        self.assertTrue(strategy.next_window(request, False, 10, 2))
+        self.assertEqual(request.params["end_timestamp"], 300)
+        self.assertTrue(strategy.next_window(request, False, 0, 5))
+        self.assertEqual(request.params["end_timestamp"], 299)
+
+    def test_crossed(self):
+        request = time_request(100, 500)
+        self.assertEqual([TimeForward().crossed(request, {"timestamp": t}) for t in (100, 500, 501)],
+                         [False, False, True])
+        self.assertEqual([TimeBackward().crossed(request, {"timestamp": t}) for t in (99, 100, 500)],
+                         [True, False, False])
+        self.assertFalse(TimeForward().crossed(time_request(100, None), {"timestamp": 10 ** 15}))
+
+    def test_split(self):
+        request = time_request(100, 1099)
+        forward = TimeForward().split(request, 4)
+        self.assertEqual([(part["start_timestamp"], part["end_timestamp"]) for part in forward],
+                         [(100, 349), (350, 599), (600, 849), (850, 1099)])
+        # descending parts start with the last time range
+        self.assertEqual(TimeBackward().split(request, 4), forward[::-1])
+        self.assertEqual(TimeForward().rest(request, forward[1])["start_timestamp"], 600)
+        self.assertEqual(TimeBackward().rest(request, forward[1])["end_timestamp"], 349)
+
+
+class BlockRangeTest(unittest.TestCase):
+    """
+    a range of blocks is paged through one block in each window, in the order of query.
+
+    """
+
+    def test_next_window(self):
+        strategy = BlockRange()
+        request = SimpleNamespace(params={"block": 10, "end_block": 12})
+        blocks = [request.params["block"]]
+        while strategy.next_window(request, True, 1, 0):
+            blocks.append(request.params["block"])
+        self.assertEqual(blocks, [10, 11, 12])
+
+        request = SimpleNamespace(params={"block": 12, "end_block": 10})
+        self.assertTrue(strategy.next_window(request, True, 1, 0))
+        self.assertEqual(request.params["block"], 11)
+        # a query of one block
+        self.assertFalse(strategy.next_window(SimpleNamespace(params={"block": 10}), True, 1, 0))
+
+    def test_split(self):
+        strategy = BlockRange()
+        request = SimpleNamespace(params={"block": 10, "end_block": 19})
+        parts = strategy.split(request, 3)
+        self.assertEqual([(part["block"], part["end_block"]) for part in parts], [(10, 13), (14, 16), (17, 19)])
+        self.assertEqual(strategy.rest(request, parts[0])["block"], 14)
+
+        request = SimpleNamespace(params={"block": 19, "end_block": 10})
+        parts = strategy.split(request, 3)
+        self.assertEqual([(part["block"], part["end_block"]) for part in parts], [(19, 16), (15, 13), (12, 10)])
+        self.assertEqual(strategy.rest(request, parts[0])["block"], 15)
+        # no more parts than blocks
+        self.assertEqual(len(strategy.split(SimpleNamespace(params={"block": 1, "end_block": 2}), 8)), 2)
+
+
+class ShardTest(StubTestCase):
+    """
+    a query split into time shards, or block shards, returns the instances of the query that is not split, in the
+    same order and without the ones at the edges of windows twice.
+
+    """
+
+    # fewer pages to page through, the stub server generates the instances before each page again
+    PAGE_SIZES = {"/transaction": 200}
+
+    def check(self, df, order):
+        self.assertEqual(df["hash"].nunique(), len(df))
+        timestamps = df["timestamp"]
+        self.assertTrue(timestamps.is_monotonic_increasing if order == "ASC" else timestamps.is_monotonic_decreasing)
+
+    def test_time_shards(self):
+        for order in ("ASC", "DESC"):
+            with self.subTest(order=order):
+                expected = quiet(self.explore(page_sizes=self.PAGE_SIZES).get_transaction_list_blockchain, START,
+                                 END, order=order)
+                # windows of 10000 transactions end inside the 3 transactions of a block
+                self.assertEqual(len(expected), 13503)
+                self.check(expected, order)
+                explore = self.explore(time_shards=3, page_workers=4, page_sizes=self.PAGE_SIZES)
+                df = quiet(explore.get_transaction_list_blockchain, START, END, order=order)
+                self.assertTrue(expected.equals(df))
+
+    def test_block_shards(self):
+        for order in ("ASC", "DESC"):
+            with self.subTest(order=order):
+                expected = quiet(self.explore().get_transaction_list_block, 100, order=order, end_number=140)
+                self.assertEqual(len(expected), 41 * 3)
+                self.check(expected, order)
+                self.assertEqual(list(expected["block"].drop_duplicates()),
+                                 list(range(100, 141)) if order == "ASC" else list(range(140, 99, -1)))
+                df = quiet(self.explore(time_shards=4).get_transaction_list_block, 100, order=order, end_number=140)
+                self.assertTrue(expected.equals(df))
+
+
+if __name__ == "__main__":
+    unittest.main()
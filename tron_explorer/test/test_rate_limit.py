@@ -0,0 +1,121 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from tron_explorer import rate_limit
+from tron_explorer.exceptions import ParameterException
+from tron_explorer.rate_limit import RateLimiter
+
+
+class Clock:
+    """
+    a clock that only moves when it is slept on, in place of the time module of rate_limit.
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RateLimiterTest(unittest.TestCase):
+    """
+    requests are spread at the rate of every bucket that limits them, whether the buckets are kept in the limiter or
+    in a file shared with other limiters.
+
+    """
+
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch.object(rate_limit, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sent_at(self, limiter, addresses):
+        """
+        :returns: the moment each request is sent, after the start of the clock.
+        """
+
+        start = self.clock.now
+        moments = []
+        for address in addresses:
+            limiter.acquire(address)
+            moments.append(round(self.clock.now - start, 6))
+        return moments
+
+    def test_pacing(self):
+        limiter = RateLimiter(rate=10)
+        self.assertEqual(self.sent_at(limiter, [""] * 5), [0, 0.1, 0.2, 0.3, 0.4])
+
+    def test_burst(self):
+        limiter = RateLimiter(rate=10, burst=3)
+        self.assertEqual(self.sent_at(limiter, [""] * 5), [0, 0, 0, 0.1, 0.2])
+        # after a pause the whole burst is available again
+        self.clock.sleep(1)
+        self.assertEqual(self.sent_at(limiter, [""] * 4), [0, 0, 0, 0.1])
+
+    def test_endpoints(self):
+        limiter = RateLimiter(endpoints={"/block": 2})
+        # a segment limits its sub segments, but not other segments that start with the same characters
+        self.assertEqual(self.sent_at(limiter, ["/block", "/block/latest", "/blocks", "/transaction", "/block"]),
+                         [0, 0.5, 0.5, 0.5, 1])
+
+    def test_global_and_endpoint(self):
+        limiter = RateLimiter(rate=10, endpoints={"/transaction": 5})
+        # a request waits for every bucket that limits it
+        self.assertEqual(self.sent_at(limiter, ["/transaction", "/block", "/transaction", "/block"]),
+                         [0, 0.1, 0.2, 0.3])
+
+    def test_shared_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "buckets.json")
+            first, second = RateLimiter(rate=10, path=path), RateLimiter(rate=10, path=path)
+            start = self.clock.now
+            moments = []
+            for limiter in (first, second, first, second):
+                limiter.acquire("/block")
+                moments.append(round(self.clock.now - start, 6))
+            # limiters of other processes share one budget through the file
+            self.assertEqual(moments, [0, 0.1, 0.2, 0.3])
+
+    def test_params(self):
+        for kwargs in ({"rate": 0}, {"endpoints": {"/block": -1}}, {"rate": 1, "burst": 0}):
+            with self.subTest(kwargs=kwargs):
+                self.assertRaises(ParameterException, RateLimiter, **kwargs)
+
+
+class RateLimiterThreadsTest(unittest.TestCase):
+    """
+    the limiter spreads the requests of several threads at its rate.
+
+    """
+
+    def test_threads(self):
+        limiter = RateLimiter(rate=50)
+        moments = []
+
+        def send():
+            for _ in range(3):
+                limiter.acquire("/block")
+                moments.append(time.monotonic())
+
+        threads = [threading.Thread(target=send) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 12 requests at 50 per second take at least 11 intervals
+        self.assertEqual(len(moments), 12)
+        self.assertGreaterEqual(max(moments) - min(moments), 11 / 50 - 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
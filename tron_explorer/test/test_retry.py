@@ -0,0 +1,208 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from email.utils import formatdate
+
+from benchmarks.stub_server import serve
+from tron_explorer.exceptions import ParameterException, ResponseException
+from tron_explorer.retry import CircuitBreaker, RetryPolicy
+from tron_explorer.session import HttpSession
+from tron_explorer.transport import ReplayResponse, ReplayTransport
+from tron_explorer.utils import SendRequestSingle
+
+
+def response(status=429, retry_after=None):
+    return ReplayResponse(status, {} if retry_after is None else {"Retry-After": retry_after}, "")
+
+
+class RetryPolicyTest(unittest.TestCase):
+    """
+    waits between tries grow exponentially up to max_backoff, and a Retry-After header of the api is respected.
+
+    """
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=3, jitter=0)
+        self.assertEqual([policy.wait_time(attempt) for attempt in range(5)], [0.5, 1, 2, 3, 3])
+
+    def test_jitter(self):
+        policy = RetryPolicy(backoff=1, max_backoff=60, jitter=0.5)
+        for attempt in range(4):
+            wait = policy.wait_time(attempt)
+            self.assertTrue(2 ** attempt * 0.5 <= wait <= 2 ** attempt, wait)
+
+    def test_retry_after(self):
+        policy = RetryPolicy(backoff=1, max_backoff=60, jitter=0)
+        self.assertEqual(policy.wait_time(0, response(retry_after="7")), 7)
+        self.assertEqual(policy.wait_time(3, response(retry_after="0")), 0)
+        # retry after is capped like the backoff
+        self.assertEqual(policy.wait_time(0, response(retry_after="600")), 60)
+        # an http date
+        self.assertAlmostEqual(policy.wait_time(0, response(retry_after=formatdate(time.time() + 20, usegmt=True))),
+                               20, delta=1.5)
+        # an invalid header or none falls back to the backoff
+        self.assertEqual(policy.wait_time(2, response(retry_after="soon")), 4)
+        self.assertEqual(policy.wait_time(2, response()), 4)
+
+    def test_retryable(self):
+        policy = RetryPolicy()
+        self.assertEqual([policy.is_retryable(response(status)) for status in (200, 400, 404, 429, 500, 503)],
+                         [False, False, False, True, True, True])
+
+    def test_params(self):
+        self.assertRaises(ParameterException, RetryPolicy, retries=-1)
+        self.assertRaises(ParameterException, CircuitBreaker, failure_threshold=0)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    """
+    the circuit of an address opens after failure_threshold consecutive failures, is half open after reset_timeout,
+    when one trial request is let through, and closes when the trial succeeds.
+
+    """
+
+    ADDRESS = "/block"
+
+    def waited(self, breaker):
+        """
+        :returns: seconds that wait blocked for.
+        """
+
+        return breaker.wait(self.ADDRESS)
+
+    def start_waiter(self, breaker):
+        """
+        :returns: the thread of a caller that waits for the circuit, and the list that it appends its wait to.
+        """
+
+        waits = []
+        thread = threading.Thread(target=lambda: waits.append(breaker.wait(self.ADDRESS)))
+        thread.start()
+        return thread, waits
+
+    def test_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+        breaker.record_failure(self.ADDRESS)
+        breaker.record_failure(self.ADDRESS)
+        # a success resets the consecutive failures
+        breaker.record_success(self.ADDRESS)
+        breaker.record_failure(self.ADDRESS)
+        breaker.record_failure(self.ADDRESS)
+        self.assertFalse(breaker.is_open(self.ADDRESS))
+        breaker.record_failure(self.ADDRESS)
+        self.assertTrue(breaker.is_open(self.ADDRESS))
+        # other addresses are not paused
+        self.assertFalse(breaker.is_open("/transaction"))
+        self.assertLess(breaker.wait("/transaction"), 0.05)
+
+    def test_open_half_open_close(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.2, trial_timeout=10)
+        breaker.record_failure(self.ADDRESS)
+        # the first caller after reset_timeout sends the trial request
+        self.assertGreaterEqual(self.waited(breaker), 0.15)
+        thread, waits = self.start_waiter(breaker)
+        time.sleep(0.1)
+        # other callers wait for the result of the trial
+        self.assertEqual(waits, [])
+        breaker.record_success(self.ADDRESS)
+        thread.join(1)
+        self.assertFalse(breaker.is_open(self.ADDRESS))
+        self.assertEqual(len(waits), 1)
+        self.assertLess(self.waited(breaker), 0.05)
+
+    def test_failed_trial(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.2, trial_timeout=10)
+        breaker.record_failure(self.ADDRESS)
+        breaker.record_failure(self.ADDRESS)
+        self.waited(breaker)
+        # a failed trial opens the circuit again for reset_timeout
+        breaker.record_failure(self.ADDRESS)
+        self.assertTrue(breaker.is_open(self.ADDRESS))
+        self.assertGreaterEqual(self.waited(breaker), 0.15)
+
+    def test_trial_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, trial_timeout=0.3)
+        breaker.record_failure(self.ADDRESS)
+        self.waited(breaker)
+        # the trial request never finishes, the next caller sends another one after trial_timeout
+        thread, waits = self.start_waiter(breaker)
+        thread.join(2)
+        self.assertEqual(len(waits), 1)
+        self.assertGreaterEqual(waits[0], 0.25)
+        self.assertTrue(breaker.is_open(self.ADDRESS))
+
+    def test_release(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0, trial_timeout=10)
+        breaker.record_failure(self.ADDRESS)
+        self.waited(breaker)
+        thread, waits = self.start_waiter(breaker)
+        time.sleep(0.1)
+        # a trial request that is stopped by another error lets the next caller send one
+        breaker.release(self.ADDRESS)
+        thread.join(1)
+        self.assertEqual(len(waits), 1)
+        self.assertLess(waits[0], 1)
+
+
+class SendRequestRetryTest(unittest.TestCase):
+    """
+    failed requests are retried by the retry policy of the session and count as failures of the circuit.
+
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.base_api = SendRequestSingle.BASE_API
+        cls.server, SendRequestSingle.BASE_API = serve(failure_rate=1.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        SendRequestSingle.BASE_API = cls.base_api
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_retries(self):
+        breaker = CircuitBreaker(failure_threshold=10)
+        session = HttpSession(retry_policy=RetryPolicy(retries=2, backoff=0.01, jitter=0), circuit_breaker=breaker)
+        state = self.server.RequestHandlerClass.state
+        requests = state.requests
+        with self.assertRaises(ResponseException) as raised:
+            SendRequestSingle("/block", {"limit": 1}, session).get_data()
+        self.assertEqual(raised.exception.message, ResponseException.RETRIES_EXCEPTION_MESSAGE)
+        self.assertEqual(state.requests - requests, 3)
+        self.assertEqual(breaker._failures["/block"], 3)
+        session.close()
+
+    def test_invalid_url(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        session = HttpSession(retry_policy=RetryPolicy(retries=2, backoff=0.01), circuit_breaker=breaker)
+        request = SendRequestSingle("/block", {}, session)
+        request.BASE_API = "no scheme"
+        # an invalid url is not retried and is not a failure of the api
+        with self.assertRaises(ValueError):
+            request.get_data()
+        self.assertFalse(breaker.is_open("/block"))
+        session.close()
+
+    def test_invalid_body(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "archive.jsonl.gz")
+            with gzip.open(path, "wt", encoding="utf-8") as archive:
+                archive.write(json.dumps({"key": "/api/block?limit=1", "status": 200, "headers": {},
+                                          "body": "<html>bad gateway</html>"}) + "\n")
+            transport = ReplayTransport(path)
+            session = HttpSession(retry_policy=RetryPolicy(retries=1, backoff=0.01), transport=transport)
+            # a body that is not json is retried, and reported as such once retries run out
+            with self.assertRaises(ResponseException) as raised:
+                SendRequestSingle("/block", {"limit": 1}, session).get_data()
+            self.assertEqual(raised.exception.message, ResponseException.DECODE_EXCEPTION_MESSAGE)
+            self.assertEqual(session.circuit_breaker._failures["/block"], 2)
+            session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from tron_explorer.columns import ColumnPage
+from tron_explorer.session import HttpSession
+from tron_explorer.sink import CsvSink
+from tron_explorer.utils import SendRequestMultiple
+
+PAGES = [[{"a": 1, "b": "x"}, {"a": 2, "b": None}], [{"a": 3, "c": "q"}], [{"b": "y,z", "d": True, "a": 4}]]
+
+
+class CsvSinkTest(unittest.TestCase):
+    """
+    the file of a sink is the csv file of the dataframe of its pages, whether pages widen its header, and a sink that
+    stopped is continued from a saved state.
+
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(directory.name, "query.csv")
+
+    def read(self, path=None):
+        with open(path or self.path, encoding="utf-8") as file:
+            return file.read()
+
+    def expected(self, pages, dtypes=None):
+        df = pd.DataFrame([d for page in pages for d in page])
+        for key, dtype in (dtypes or {}).items():
+            df[key] = df[key].astype(dtype)
+        return df.to_csv()
+
+    def test_widen(self):
+        widened = []
+        with CsvSink(self.path) as sink:
+            sink.on_widen = lambda rows, fields, size: widened.append(
+                (rows, fields, size, os.path.getsize(self.path + sink.WIDEN_SUFFIX)))
+            for page in PAGES:
+                sink.write(page)
+        self.assertEqual(self.read(), self.expected(PAGES))
+        # the wider file is complete before it replaces the file
+        self.assertEqual([(rows, fields) for rows, fields, _, _ in widened], [(2, ["a", "b", "c"]),
+                                                                               (3, ["a", "b", "c", "d"])])
+        self.assertTrue(all(size == wide_size for _, _, size, wide_size in widened))
+        self.assertFalse(os.path.exists(self.path + CsvSink.WIDEN_SUFFIX))
+
+    def test_column_page(self):
+        page = ColumnPage({"a": [1, 2], "b": ["x", "y"]}, 2)
+        with CsvSink(self.path) as sink:
+            sink.write(page)
+            sink.write([{"a": 3, "c": 1.5}])
+        self.assertEqual(self.read(), self.expected([list(page), [{"a": 3, "c": 1.5}]]))
+
+    def test_float_dtype(self):
+        pages = [[{"a": 16, "b": 1}], [{"a": 2.5, "b": 2}], [{"a": None, "b": 3}]]
+        with CsvSink(self.path, dtypes={"a": "float64", "b": "int64"}) as sink:
+            for page in pages:
+                sink.write(page)
+        # ints of a float64 column are written as floats, like the column of the dataframe
+        self.assertEqual(self.read(), self.expected(pages, {"a": "float64"}))
+        self.assertIn("16.0", self.read())
+
+    def test_atomic(self):
+        sink = CsvSink(self.path, atomic=True)
+        sink.write(PAGES[0])
+        sink.close(complete=False)
+        self.assertEqual(os.listdir(self.directory), ["query.csv.part"])
+        with CsvSink(self.path, atomic=True) as sink:
+            sink.write(PAGES[0])
+        self.assertEqual(self.read(), self.expected(PAGES[:1]))
+        self.assertFalse(os.path.exists(self.path + CsvSink.PART_SUFFIX))
+
+    def test_resume(self):
+        sink = CsvSink(self.path)
+        sink.write(PAGES[0])
+        sink.write(PAGES[1])
+        state = {"rows": sink.rows, "fields": list(sink.fields), "size": sink.size}
+        # the file has part of a page that was written after the saved state when the download crashed
+        sink._file.write("3,5,")
+        sink._file.close()
+
+        resumed = CsvSink(self.path)
+        resumed.resume(**state)
+        resumed.write(PAGES[2])
+        resumed.close()
+        self.assertEqual(self.read(), self.expected(PAGES))
+
+    def crash_widen(self, save):
+        """
+        writes the first two pages and crashes while the third page widens the header.
+
+        :param save: whether if the state of the wider file was saved before the crash.
+
+        :returns: the last saved state.
+        """
+
+        sink = CsvSink(self.path)
+        sink.write(PAGES[0])
+        sink.write(PAGES[1])
+        states = [{"rows": sink.rows, "fields": list(sink.fields), "size": sink.size}]
+
+        def on_widen(rows, fields, size):
+            if save:
+                states.append({"rows": rows, "fields": fields, "size": size})
+            raise KeyboardInterrupt
+
+        sink.on_widen = on_widen
+        with self.assertRaises(KeyboardInterrupt):
+            sink.write(PAGES[2])
+        self.assertTrue(os.path.exists(self.path + CsvSink.WIDEN_SUFFIX))
+        return states[-1]
+
+    def test_recover_wide(self):
+        state = self.crash_widen(save=True)
+        resumed = CsvSink(self.path)
+        # the saved state is of the wider file, which replaces the file
+        resumed.resume(**state)
+        self.assertEqual(resumed.fields, ["a", "b", "c", "d"])
+        resumed.write(PAGES[2])
+        resumed.close()
+        self.assertEqual(self.read(), self.expected(PAGES))
+        self.assertFalse(os.path.exists(self.path + CsvSink.WIDEN_SUFFIX))
+
+    def test_recover_narrow(self):
+        state = self.crash_widen(save=False)
+        resumed = CsvSink(self.path)
+        # the saved state is of the file, the wider file is dropped
+        resumed.resume(**state)
+        self.assertEqual(resumed.fields, ["a", "b", "c"])
+        self.assertFalse(os.path.exists(self.path + CsvSink.WIDEN_SUFFIX))
+        resumed.write(PAGES[2])
+        resumed.close()
+        self.assertEqual(self.read(), self.expected(PAGES))
+
+    def test_session_params(self):
+        def live_sink(session):
+            sink = SendRequestMultiple("/block", True, self.directory, {}, session=session)._live_sink()
+            return sink.fsync_interval, sink.atomic
+
+        session = HttpSession(live_fsync_interval=0, live_atomic=True)
+        self.addCleanup(session.close)
+        self.assertEqual(live_sink(session), (0, True))
+        session = HttpSession()
+        self.addCleanup(session.close)
+        self.assertEqual(live_sink(session), (SendRequestMultiple.LIVE_FSYNC_INTERVAL, SendRequestMultiple.LIVE_ATOMIC))
+
+
+if __name__ == "__main__":
+    unittest.main()
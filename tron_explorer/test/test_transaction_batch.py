@@ -0,0 +1,125 @@
+import itertools
+import unittest
+
+from tron_explorer.columns import ColumnBuilder
+from tron_explorer.transaction import TransactionDataMap
+
+
+def make_transaction(contract_type, **fields):
+    transaction = {"block": 46012029, "hash": "%064x" % contract_type, "timestamp": 1668613534000,
+                   "ownerAddress": "TOWNER", "toAddress": "TTO", "contractType": contract_type, "confirmed": True,
+                   "result": "SUCCESS", "contractRet": "SUCCESS", "amount": "25000000",
+                   "cost": {"net_fee": 345000, "energy_fee": 0, "fee": 345000, "energy_usage_total": 0,
+                            "net_usage": 267},
+                   "tokenInfo": {"tokenName": "trx", "tokenAbbr": "trx"},
+                   "contractData": {"amount": 25000000, "resource": "ENERGY"}}
+    transaction.update(fields)
+    return transaction
+
+
+def without(transaction, *keys):
+    for key in keys:
+        del transaction[key]
+    return transaction
+
+
+def make_trigger(method, parameter, **fields):
+    trigger_info = {"contract_address": "TCONTRACT", "methodName": method, "data": "a9059cbb", "parameter": parameter}
+    trigger_info.update(fields)
+    return {"trigger_info": {key: value for key, value in trigger_info.items() if value is not None}}
+
+
+# an instance of every contract type, and of each place that filter_data reads their properties from
+TRANSACTIONS = [make_transaction(1),
+                without(make_transaction(1, contractData={"amount": 1000000, "tokenInfo": {"tokenName": "x",
+                                                                                         "tokenAbbr": "X"}}),
+                        "tokenInfo"),
+                without(make_transaction(1, contractData={"amount": 1000000, "tokenInfo": {"tokenName": "x"}}),
+                        "tokenInfo"),
+                without(make_transaction(1, contractData={"amount": 1000000}), "tokenInfo", "toAddress"),
+                without(make_transaction(2, amount=str(2 ** 60 + 1)), "result"),
+                make_transaction(4),
+                without(make_transaction(4), "toAddress", "result"),
+                make_transaction(11),
+                make_transaction(11, contractData={"amount": 25000000}),
+                make_transaction(12),
+                make_transaction(13, cost={"fee": 1100000}),
+                make_transaction(44),
+                make_transaction(31, **make_trigger("transfer", {"_to": "TTO", "_value": "7000000"})),
+                make_transaction(31, **make_trigger("transfer", {"to": "TTO", "value": "7000000"})),
+                make_transaction(31, **make_trigger("transfer", {"to": "TTO"})),
+                make_transaction(31, **make_trigger("transfer", {"value": "7000000"})),
+                make_transaction(31, **make_trigger("transfer", None)),
+                make_transaction(31, **make_trigger("transfer", {"_to": "TTO", "_value": "1"}, data=None)),
+                make_transaction(31, **make_trigger(None, {"_to": "TTO", "_value": "7000000"})),
+                make_transaction(31, **make_trigger("deposit", {"_amount": "3000000"})),
+                make_transaction(31, **make_trigger("deposit", None)),
+                make_transaction(31, **make_trigger("safeMint", {"tokenId": "1"}))]
+
+# the properties that filter_data reads, the ones of properties_list and the ones of vote transactions
+PROPERTIES = TransactionDataMap.properties_list + ["block", "vote_amount", "voter", "sr_address"]
+
+
+def map_each(transactions, properties):
+    """
+    :returns: the (property, value) of each instance mapped one by one, or the type of the error that mapping raised.
+    """
+
+    try:
+        return [list(TransactionDataMap(d, properties).get_dict().items()) for d in transactions]
+    except Exception as e:
+        return type(e)
+
+
+def map_batch(transactions, properties):
+    """
+    :returns: the (property, value) of the instances mapped by the batch function, or the type of the error that it
+    raised.
+    """
+
+    try:
+        return [list(d.items()) for d in TransactionDataMap.batch(properties)(transactions)]
+    except Exception as e:
+        return type(e)
+
+
+class TransactionBatchTest(unittest.TestCase):
+    """
+    list queries map pages of transactions with TransactionDataMap.batch, it has to return what a TransactionDataMap of
+    each instance does, in the same order and with the same errors.
+
+    """
+
+    SUBSETS = [None] + [list(p) for n in (1, 2) for p in itertools.combinations(PROPERTIES, n)]
+
+    def test_each_transaction(self):
+        for (i, transaction), properties in itertools.product(enumerate(TRANSACTIONS), self.SUBSETS):
+            with self.subTest(transaction=i, properties=properties):
+                self.assertEqual(map_each([transaction], properties), map_batch([transaction], properties))
+
+    def test_mixed_page(self):
+        for properties in self.SUBSETS:
+            # the instances that filter_data maps, interleaved
+            page = [d for d in TRANSACTIONS if not isinstance(map_each([d], properties), type)]
+            page += page[::-1]
+            with self.subTest(properties=properties):
+                self.assertEqual(map_each(page, properties), map_batch(page, properties))
+
+    def test_page_error(self):
+        for properties in self.SUBSETS:
+            with self.subTest(properties=properties):
+                self.assertEqual(map_each(TRANSACTIONS, properties), map_batch(TRANSACTIONS, properties))
+
+    def test_frame(self):
+        for properties in (None, ["hash", "value", "to_address", "method", "resource"]):
+            # the instances that filter_data maps
+            page = [d for d in TRANSACTIONS if not isinstance(map_each([d], properties), type)]
+            with self.subTest(properties=properties):
+                each, batch = ColumnBuilder(), ColumnBuilder()
+                each.append([TransactionDataMap(d, properties).get_dict() for d in page])
+                batch.append(TransactionDataMap.batch(properties)(page))
+                self.assertTrue(each.frame().equals(batch.frame()))
+
+
+if __name__ == "__main__":
+    unittest.main()
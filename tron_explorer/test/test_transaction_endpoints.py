@@ -15,4 +15,8 @@ print(df_account_transactions)
 
 # get transaction list in whole blockchain
 df_blockchain_transactions = explore.get_transaction_list_blockchain(start_timestamp=1668613534000)
-print(df_blockchain_transactions)
\ No newline at end of file
+print(df_blockchain_transactions)
+
+# stream transactions in page sized dataframes
+for df_page in explore.iter_transaction_list_account("TRHcKhF2NZHnUSWtnB5bAoueSgifwuEsAf", chunks=True):
+    print(len(df_page))
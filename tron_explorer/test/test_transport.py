@@ -0,0 +1,74 @@
+import contextlib
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.stub_server import serve, T0
+from tron_explorer.block import Block
+from tron_explorer.exceptions import ResponseException
+from tron_explorer.session import HttpSession
+from tron_explorer.transport import RecordingTransport, ReplayTransport, Transport
+from tron_explorer.utils import SendRequestSingle
+
+
+class ReplayTransportTest(unittest.TestCase):
+    """
+    a query replayed from the archive that RecordingTransport wrote returns what it returned when it was recorded,
+    without the api.
+
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "archive.jsonl.gz")
+        self.base_api = SendRequestSingle.BASE_API
+        self.addCleanup(setattr, SendRequestSingle, "BASE_API", self.base_api)
+
+    @staticmethod
+    def block_list(session):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return Block(session).get_block_list(start_timestamp=T0 + 3000 * 100, end_timestamp=T0 + 3000 * 300)
+
+    def test_record_replay(self):
+        server, SendRequestSingle.BASE_API = serve()
+        recording = HttpSession(transport=RecordingTransport(self.path))
+        recorded = self.block_list(recording)
+        recording.close()
+        server.shutdown()
+        server.server_close()
+
+        replaying = HttpSession(transport=ReplayTransport(self.path))
+        replayed = self.block_list(replaying)
+        replaying.close()
+        self.assertEqual(len(recorded), 201)
+        self.assertTrue(recorded.equals(replayed))
+
+    def test_order(self):
+        url = "http://host/api/block/latest"
+        with gzip.open(self.path, "wt", encoding="utf-8") as archive:
+            for number in (1, 2):
+                archive.write(json.dumps({"key": Transport.make_key(url, None), "status": 200, "headers": {},
+                                          "body": json.dumps({"number": number})}) + "\n")
+        transport = ReplayTransport(self.path)
+        # responses of a request are replayed in order, then the last one again
+        self.assertEqual([transport.get(url).json()["number"] for _ in range(3)], [1, 2, 2])
+        # the host of the api is not part of the key
+        self.assertEqual(transport.get("http://other/api/block/latest").json()["number"], 2)
+        self.assertEqual(transport.get(url, {"x": 1}).status_code, 404)
+
+    def test_not_recorded(self):
+        with gzip.open(self.path, "wt", encoding="utf-8"):
+            pass
+        session = HttpSession(transport=ReplayTransport(self.path))
+        with self.assertRaises(ResponseException) as raised:
+            Block(session).get_block(45)
+        self.assertEqual(raised.exception.status, 404)
+        session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
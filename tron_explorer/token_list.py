@@ -3,6 +3,7 @@ from tron_explorer.data_map import DataMap
 # noinspection PyAttributeOutsideInit
 from tron_explorer.exceptions import ParameterException
 from tron_explorer.utils import SendRequestMultiple
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit
@@ -36,7 +37,7 @@ class TokenListDataMap(DataMap):
             id of the token.
         * *description* (``str``)
             token description.
-        * *vip* (``str``)
+        * *vip* (``bool``)
             vip status of token.
         * *token_hash* (``str``)
             hash of the token.
@@ -71,7 +72,7 @@ class TokenListDataMap(DataMap):
             token's owner address.
         * *contract_address* (``str``)
             address of token's contract.
-        * *vip* (``str``)
+        * *vip* (``bool``)
             vip status of token.
         * *timestamp* (``int``)
             timestamp of token's creation.
@@ -104,7 +105,7 @@ class TokenListDataMap(DataMap):
             address of token's contract.
         * *timestamp* (``int``)
             timestamp of token's creation.
-        * *vip* (``str``)
+        * *vip* (``bool``)
             vip status of token.
         * *supply* (``int``)
             number of token in circulation.
@@ -115,6 +116,15 @@ class TokenListDataMap(DataMap):
 
     """
 
+    PLAN_NAME = "TokenList"
+    PLAN_FIXED = (("token_type", "tokenType"),)
+    # dateCreated is in seconds
+    PLAN_FACTORS = {"timestamp": 1000}
+
+    properties_dtypes = {"token_type": "category", "timestamp": "int64", "vip": "bool", "number_of_holders": "int64"
+        , "number_of_transactions": "int64", "gain": "float64", "market_cap": "float64", "volume_24h": "float64"
+        , "price_in_trx": "float64", "price_in_usd": "float64"}
+
     def __init__(self, data, properties):
         super().__init__(data, properties)
 
@@ -145,6 +155,9 @@ class TokenListDataMap(DataMap):
 class TokenList:
     _API_TOKEN_LIST_ADDRESS = "/tokens/overview"
 
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
+
     @staticmethod
     def _check_list_params(sort, token_type):
         """
@@ -161,13 +174,50 @@ class TokenList:
                 token_type != "trc721" and token_type != "trc1155" and token_type != "top" and token_type != "all":
             raise ParameterException(ParameterException.SORT_EXCEPTION_MESSAGE, ["token_type"])
 
+    @staticmethod
+    def _build_list_params(sort, order, token_type):
+        """
+        make request params of token list.
+
+        :param sort: the property that tokens are ordered by.
+        :type sort: str
+
+        :param order: order of tokens by sort.
+        :type order: str
+
+        :param token_type: type of tokens.
+        :type token_type: str
+
+        :returns: request params.
+        :rtype: dict
+
+        """
+
+        if sort == "market_cap":
+            sort = "marketcap"
+        if sort == "volume_24h":
+            sort = "volume24hInTrx"
+        if sort == "number_holder":
+            sort = "holderCount"
+
+        order = order.lower()
+
+        params = {"sort": sort, "order": order, "filter": token_type, "verifier": "all", "start_timestamp": None,
+                  "end_timestamp": None}
+
+        if token_type == "all":
+            del params["filter"]
+
+        return params
+
     def get_token_list(self, save_live: bool = False
                        , save_path: str = ""
                        , sort: str = "gain"
                        , order: str = "DESC"
                        , properties: list = None
                        , count: int = 10000
-                       , token_type: str = "all"):
+                       , token_type: str = "all"
+                       , resume: bool = False):
 
         """
         get data for a list of tokens.
@@ -191,6 +241,9 @@ class TokenList:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
             * *token_type* (``str``)
                 all : return all tokens
                 trc10 : return only and all trc10 tokens.
@@ -206,23 +259,58 @@ class TokenList:
         """
 
         self._check_list_params(sort, token_type)
+        params = self._build_list_params(sort, order, token_type)
 
-        if sort == "market_cap":
-            sort = "marketcap"
-        if sort == "volume_24h":
-            sort = "volume24hInTrx"
-        if sort == "number_holder":
-            sort = "holderCount"
+        address = self._API_TOKEN_LIST_ADDRESS
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000, session=self.session,
+                                  resume=resume)
+        data = req.get_data_multiple(count, properties, TokenListDataMap, delete_order=False, data_key="tokens")
+        return data
 
-        order = order.lower()
+    def iter_token_list(self
+                        , sort: str = "gain"
+                        , order: str = "DESC"
+                        , properties: list = None
+                        , count: int = 10000
+                        , token_type: str = "all"
+                        , chunks: bool = False):
 
-        params = {"sort": sort, "order": order, "filter": token_type, "verifier": "all", "start_timestamp": None,
-                  "end_timestamp": None}
+        """
+        get data for a list of tokens, yielded as pages are downloaded so memory use doesnt grow with count.
 
-        if token_type == "all":
-            del params["filter"]
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of tokens that will be returned. default is all.
+            * *sort* (``str``)
+                the property that tokens are ordered by. can be sorted by "gain", "market_cap",
+                "number_of holders", "volume_24h". default is "gain".
+            * *order* (``str``)
+                order of tokens by sort ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired tokens. default is 10000. is ignored when both times are specified.
+            * *token_type* (``str``)
+                all : return all tokens
+                trc10 : return only and all trc10 tokens.
+                trc20 : return only and all trc20 tokens.
+                trc721 : return only and all trc721 tokens.
+                trc1155 : return only and all trc1155 tokens.
+                default is all.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired tokens data, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        self._check_list_params(sort, token_type)
+        params = self._build_list_params(sort, order, token_type)
 
         address = self._API_TOKEN_LIST_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000)
-        data = req.get_data_multiple(count, properties, TokenListDataMap, delete_order=False, data_key="tokens")
-        return data
+        req = SendRequestMultiple(address, False, "", params, max_query=2000, session=self.session)
+        return req.iter_data_multiple(count, properties, TokenListDataMap, delete_order=False, data_key="tokens",
+                                      chunks=chunks)
@@ -4,6 +4,7 @@ import datetime
 
 # noinspection PyAttributeOutsideInit
 from tron_explorer.utils import SendRequestSingle
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit
@@ -165,7 +166,10 @@ class TokenSingle:
     _API_TRC10_ADDRESS = "/token"
     _API_TRC20_ADDRESS = "/token_trc20"
 
-    def get_trc10_token(self, token_id: str, properties: list = None):
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
+
+    def get_trc10_token(self, token_id: str, properties: list = None, records: bool = False):
         """
         get data for a specific trc10 token.
 
@@ -175,17 +179,20 @@ class TokenSingle:
         :args:
             * *properties* (``list``)
                 properties of token that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: AccountDataMap
 
         """
         params = {"id": token_id}
-        req = SendRequestSingle(self._API_TRC10_ADDRESS, params)
+        req = SendRequestSingle(self._API_TRC10_ADDRESS, params, self.session)
         data = req.get_data()
-        return TokenSingleDataMap(data["data"][0], properties)
+        return TokenSingleDataMap.single(data["data"][0], properties, records)
 
-    def get_trc20_token(self, contract_address: str, properties: list = None):
+    def get_trc20_token(self, contract_address: str, properties: list = None, records: bool = False):
         """
         get data for a specific trc20 token.
 
@@ -195,12 +202,15 @@ class TokenSingle:
         :args:
             * *properties* (``list``)
                 properties of token that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired account data.
         :rtype: AccountDataMap
 
         """
         params = {"contract": contract_address}
-        req = SendRequestSingle(self._API_TRC20_ADDRESS, params)
+        req = SendRequestSingle(self._API_TRC20_ADDRESS, params, self.session)
         data = req.get_data()
-        return TokenSingleDataMap(data["trc20_tokens"][0], properties)
+        return TokenSingleDataMap.single(data["trc20_tokens"][0], properties, records)
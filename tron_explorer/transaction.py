@@ -1,5 +1,12 @@
+from operator import itemgetter
+
+import numpy as np
+
+from tron_explorer.columns import ColumnPage
 from tron_explorer.data_map import DataMap
+from tron_explorer.exceptions import ParameterException
 from tron_explorer.utils import SendRequestSingle, SendRequestMultiple
+from tron_explorer.session import HttpSession
 
 
 # noinspection PyAttributeOutsideInit,PyBroadException
@@ -232,6 +239,12 @@ class TransactionDataMap(DataMap):
 
         """
 
+    properties_dtypes = {"transaction_type": "category", "block": "int64", "timestamp": "int64"
+        , "token_name": "category", "token_abbr": "category", "value": "float64", "confirmed": "bool"
+        , "result": "category", "trx_burned_bandwidth": "float64", "trx_burned_energy": "float64"
+        , "trx_burned_total": "float64", "energy_used": "float64", "bandwidth_used": "float64", "resource": "category"
+        , "method": "category", "vote_amount": "float64"}
+
     def __init__(self, data, properties):
         super().__init__(data, properties)
 
@@ -539,6 +552,372 @@ class TransactionDataMap(DataMap):
                 self.bandwidth_used = float(cost.get("net_usage", 0))
 
 
+    # fees of the cost of transaction, (property, key in cost, conversion, whether if it is divided by 10 ** 6)
+    _COST = (("trx_burned_bandwidth", "net_fee", int, True), ("trx_burned_energy", "energy_fee", int, True),
+             ("trx_burned_total", "fee", int, True), ("energy_used", "energy_usage_total", float, True),
+             ("bandwidth_used", "net_usage", float, False))
+
+    @classmethod
+    def _compile_batch(cls, properties):
+        """
+        compiles the batch function of properties. the instances of a page are grouped by their layout, the properties
+        that filter_data sets for them in order, which depends on their contractType and on where their data is. each
+        group is mapped column by column, and the layouts are compiled once with the properties so they are not checked
+        for each instance. a step of a layout is a (property, column function), or (properties, function of their
+        columns) for the fees. amounts and fees are divided by 10 ** 6 for a whole column at once.
+
+        errors of filter_data are raised by the columns that read the same data, in order of the groups.
+
+        :returns: the batch function, which returns a ColumnPage.
+        :rtype: callable
+        """
+
+        wanted = None if properties is None else frozenset(properties)
+        standard = cls._standard_layout(wanted, "standard")
+        layout_of = {1: standard, 2: standard, 11: cls._staking_layout(wanted),
+                     12: cls._standard_layout(wanted, "unstaking"), 13: cls._standard_layout(wanted, "rewards"),
+                     31: cls._smart_contract_layout(wanted), 4: cls._votes_layout(wanted)}
+        # filter_data doesnt map other types
+        empty = ()
+
+        def batch(rows):
+            groups = {}
+            for i, d in enumerate(rows):
+                layout = layout_of.get(d["contractType"])
+                layout = empty if layout is None else layout(d)
+                group = groups.get(id(layout))
+                if group is None:
+                    group = groups[id(layout)] = (layout, [])
+                group[1].append(i)
+
+            if len(groups) == 0:
+                return ColumnPage({}, 0)
+            parts = []
+            for layout, indexes in groups.values():
+                group = rows if len(groups) == 1 else [rows[i] for i in indexes]
+                columns = {}
+                for key, column in layout:
+                    if type(key) is tuple:
+                        columns.update(zip(key, column(group)))
+                    else:
+                        columns[key] = column(group)
+                parts.append((indexes, columns))
+            return ColumnPage.merge(parts, len(rows))
+
+        return batch
+
+    @staticmethod
+    def _scale(values):
+        """
+        divides amounts by 10 ** 6 at once. values below 2 ** 53 convert to float exactly, so dividing the array gives
+        the same floats as dividing each value in python. larger ones are divided one by one.
+
+        :param values: the amounts.
+        :type values: list
+
+        :returns: the divided amounts.
+        :rtype: list
+        """
+
+        array = np.array(values, dtype=np.float64)
+        if len(values) > 0 and np.abs(array).max() >= 2 ** 53:
+            return [v / (10 ** 6) for v in values]
+        return (array / (10 ** 6)).tolist()
+
+    @staticmethod
+    def _path(*keys):
+        """
+        :returns: the column function of the value of keys, one inside another, in each instance.
+        :rtype: callable
+        """
+
+        getters = [itemgetter(key) for key in keys]
+
+        def column(group):
+            values = group
+            for get in getters:
+                values = map(get, values)
+            return list(values)
+
+        return column
+
+    @classmethod
+    def _converted(cls, column, convert, scale=False):
+        """
+        :returns: the column function of the values of column converted by convert, and divided by 10 ** 6 when scale
+        is True.
+        :rtype: callable
+        """
+
+        def converted(group):
+            values = list(map(convert, column(group)))
+            return cls._scale(values) if scale else values
+
+        return converted
+
+    @staticmethod
+    def _constant(value):
+        return lambda group: [value] * len(group)
+
+    @classmethod
+    def _common(cls):
+        """
+        :returns: column functions of the properties that every contract type reads the same way, by property.
+        :rtype: dict
+        """
+
+        columns = {"block": cls._path("block"), "hash": cls._path("hash"),
+                   "timestamp": cls._converted(cls._path("timestamp"), int),
+                   "from_address": cls._path("ownerAddress"), "confirmed": cls._path("confirmed"),
+                   "result": lambda group: [d["result"] if "result" in d else d["contractRet"] for d in group]}
+        return columns
+
+    @classmethod
+    def _fees(cls, wanted):
+        """
+        :returns: the step of the wanted fees, which reads the cost of each instance once and divides the fees by
+        10 ** 6 in one array. no step when no fee is wanted.
+        :rtype: list
+        """
+
+        fees = [fee for fee in cls._COST if wanted is None or fee[0] in wanted]
+        if len(fees) == 0:
+            return []
+        scaled = [i for i, (_, _, _, scale) in enumerate(fees) if scale]
+
+        def column(group):
+            costs = [d.get("cost") for d in group]
+            columns = [list(map(convert, [cost.get(key, 0) for cost in costs])) for _, key, convert, _ in fees]
+            if len(scaled) > 0 and len(group) > 0:
+                array = np.array([columns[i] for i in scaled], dtype=np.float64)
+                if np.abs(array).max() >= 2 ** 53:
+                    divided = [cls._scale(columns[i]) for i in scaled]
+                else:
+                    divided = (array / (10 ** 6)).tolist()
+                for i, values in zip(scaled, divided):
+                    columns[i] = values
+            return columns
+
+        return [(tuple(key for key, _, _, _ in fees), column)]
+
+    @staticmethod
+    def _select(steps, wanted):
+        """
+        :returns: the (property, column function) of steps whose properties are wanted, all of them when wanted is None.
+        :rtype: list
+        """
+
+        return [(key, column) for key, column in steps if wanted is None or key in wanted]
+
+    @classmethod
+    def _standard_layout(cls, wanted, transaction_type):
+        """
+        :returns: the layout function of standard transactions, which also maps unstaking and reward ones.
+        :rtype: callable
+        """
+
+        common = cls._common()
+        head = [("transaction_type", cls._constant(transaction_type))]
+        head += [(key, common[key]) for key in ("block", "hash", "timestamp", "from_address")]
+        tail = [(key, common[key]) for key in ("confirmed", "result")]
+        amount = cls._converted(cls._path("amount"), int, True)
+        # the list mode of filter_data reads the key tokenAbr
+        info = [("token_name", cls._path("tokenInfo", "tokenName")),
+                ("token_abbr", cls._path("tokenInfo", "tokenAbbr" if wanted is None else "tokenAbr")),
+                ("value", amount)]
+        data = [("token_name", cls._path("contractData", "tokenInfo", "tokenName")),
+                ("token_abbr", cls._path("contractData", "tokenInfo", "tokenAbbr")),
+                ("value", cls._converted(cls._path("contractData", "amount"), int, True))]
+
+        if wanted is not None:
+            head = head[:1] + cls._select(head[1:] + [("to_address", cls._path("toAddress"))], wanted)
+            tail = cls._select(tail, wanted) + cls._fees(wanted)
+            layouts = {"info": tuple(head + cls._select(info, wanted) + tail),
+                       "data": tuple(head + cls._select(data, wanted) + tail)}
+            return lambda d: layouts["info" if "tokenInfo" in d else "data"]
+
+        head.append(("to_address", lambda group: [d.get("toAddress") for d in group]))
+        tail += cls._fees(wanted)
+        # token info in contractData is optional, a token abbreviation is only read after a token name
+        layouts = {"info": tuple(head + info + tail), "data": tuple(head + data + tail),
+                   "name": tuple(head + data[::2] + tail), "none": tuple(head + data[2:] + tail)}
+
+        def layout(d):
+            if "tokenInfo" in d:
+                return layouts["info"]
+            try:
+                token_info = d["contractData"]["tokenInfo"]
+            except KeyError:
+                return layouts["none"]
+            if "tokenName" not in token_info:
+                return layouts["none"]
+            return layouts["data" if "tokenAbbr" in token_info else "name"]
+
+        return layout
+
+    @classmethod
+    def _staking_layout(cls, wanted):
+        """
+        :returns: the layout function of staking transactions, the standard layout with the value read again from
+        amount and the resource.
+        :rtype: callable
+        """
+
+        standard = cls._standard_layout(wanted, "staking")
+        amount = cls._converted(cls._path("amount"), int, True)
+
+        def value(standard_value):
+            def column(group):
+                standard_value(group)
+                return amount(group)
+            return column
+
+        def resource(group):
+            resources = []
+            for d in group:
+                try:
+                    resources.append(d["contractData"]["resource"])
+                except KeyError:
+                    resources.append("BANDWIDTH")
+            return resources
+
+        layouts = {}
+
+        def layout(d):
+            standard_layout = standard(d)
+            staking = layouts.get(id(standard_layout))
+            if staking is None:
+                staking = tuple((key, value(column) if key == "value" else column) for key, column in standard_layout)
+                staking = layouts[id(standard_layout)] = staking + (("resource", resource),)
+            return staking
+
+        return layout
+
+    @classmethod
+    def _votes_layout(cls, wanted):
+        """
+        :returns: the layout function of vote transactions.
+        :rtype: callable
+        """
+
+        common = cls._common()
+        steps = [(key, common[key]) for key in ("block", "hash", "timestamp")]
+        steps += [("vote_amount", cls._converted(cls._path("amount"), int)), ("voter", cls._path("ownerAddress"))]
+        if wanted is None:
+            steps += [("sr_address", lambda group: [d.get("toAddress") for d in group]),
+                      ("confirmed", common["confirmed"])]
+            layout = tuple([("transaction_type", cls._constant("standard"))] + steps + cls._fees(wanted))
+        else:
+            steps += [("sr_address", cls._path("toAddress")), ("confirmed", common["confirmed"]),
+                      ("result", common["result"])]
+            steps = cls._select(steps, wanted) + cls._fees(wanted)
+            layout = tuple([("transaction_type", cls._constant("vote"))] + steps)
+        return lambda d: layout
+
+    @classmethod
+    def _smart_contract_layout(cls, wanted):
+        """
+        :returns: the layout function of smart contract transactions. which of method, contract data, to address and
+        value they have and where they are read from depends on the trigger info of each one, so their layouts are
+        compiled as they are found.
+        :rtype: callable
+        """
+
+        common = cls._common()
+        trigger = lambda *keys: cls._path("trigger_info", *keys)
+        fees = cls._fees(wanted)
+        head = [(key, common[key]) for key in ("block", "hash", "timestamp", "from_address")]
+        head += [("contract_address", trigger("contract_address")), ("method", trigger("methodName"))]
+        # keys of the to address and the value in the parameter of trigger info, by source
+        sources = {"to": ("to", "value"), "_to": ("_to", "_value"), "deposit": (None, "_amount")}
+        layouts = {}
+
+        def compile_layout(has_method, keys, source):
+            to_key, value_key = sources.get(source, (None, None))
+            optional = {"contract_data": trigger("data"), "to_address": trigger("parameter", to_key),
+                        "value": cls._converted(trigger("parameter", value_key), int, True)}
+            steps = [("transaction_type", cls._constant("smart contract"))]
+            if wanted is None:
+                steps += head if has_method else head[:-1]
+                steps += [("confirmed", common["confirmed"]),
+                          ("result", lambda group: [d.get("result", None) for d in group])]
+                steps += [(key, optional[key]) for key in keys] + fees
+            elif source == "raise":
+                steps += cls._select(head, wanted) + [("value", cls._missing_method)]
+            else:
+                steps += cls._select(head, wanted) + [(key, optional[key]) for key in keys]
+                steps += cls._select([("contract_data", optional["contract_data"]), ("confirmed", common["confirmed"]),
+                                      ("result", cls._path("result"))], wanted) + fees
+            return tuple(steps)
+
+        def layout(d):
+            flags = (cls._smart_contract_all if wanted is None else cls._smart_contract_list)(d["trigger_info"], wanted)
+            compiled = layouts.get(flags)
+            if compiled is None:
+                compiled = layouts[flags] = compile_layout(*flags)
+            return compiled
+
+        return layout
+
+    @staticmethod
+    def _missing_method(group):
+        raise AttributeError("'TransactionDataMap' object has no attribute 'method'")
+
+    @staticmethod
+    def _smart_contract_all(trigger_info, wanted):
+        """
+        :returns: (whether if it has a method, its optional properties, source of to address and value) of a smart
+        contract transaction when all properties are returned. filter_data stops at the first key that it doesnt have.
+        :rtype: tuple
+        """
+
+        has_method = "methodName" in trigger_info
+        if "data" not in trigger_info:
+            return has_method, (), None
+        if not has_method or "parameter" not in trigger_info:
+            return has_method, ("contract_data",), None
+        parameter = trigger_info["parameter"]
+        if trigger_info["methodName"] == "deposit":
+            return True, ("contract_data", "value") if "_amount" in parameter else ("contract_data",), "deposit"
+        source = "to" if "_to" not in parameter else "_to"
+        to_key, value_key = ("to", "value") if source == "to" else ("_to", "_value")
+        if to_key not in parameter:
+            return True, ("contract_data",), None
+        return True, ("contract_data", "to_address", "value") if value_key in parameter else \
+            ("contract_data", "to_address"), source
+
+    @staticmethod
+    def _smart_contract_list(trigger_info, wanted):
+        """
+        :returns: (whether if it has a method, its to address and value properties, source of them) of a smart
+        contract transaction when properties are specified. a deposit without the method property has the source
+        "raise", filter_data fails on it.
+        :rtype: tuple
+        """
+
+        method = trigger_info["methodName"]
+        if method == "deposit":
+            if "method" not in wanted:
+                return True, (), "raise"
+            # filter_data reads the value of deposits when to_address is wanted
+            if "to_address" in wanted and "_amount" in trigger_info.get("parameter", ()):
+                return True, ("value",), "deposit"
+            return True, (), None
+        if "parameter" not in trigger_info:
+            return True, (), None
+        parameter = trigger_info["parameter"]
+        source = "to" if "_to" not in parameter else "_to"
+        to_key, value_key = ("to", "value") if source == "to" else ("_to", "_value")
+        keys = ()
+        if "to_address" in wanted:
+            if to_key not in parameter:
+                return True, (), None
+            keys += ("to_address",)
+        if "value" in wanted and value_key in parameter:
+            keys += ("value",)
+        return True, keys, source
+
+
 # noinspection PyIncorrectDocstring
 class Transaction:
     """
@@ -549,7 +928,10 @@ class Transaction:
     _API_TRANSACTION_INFO_ADDRESS = "/transaction-info"
     _API_TRANSACTION_ADDRESS = "/transaction"
 
-    def get_transaction(self, hash_: str, properties: list = None):
+    def __init__(self, session: HttpSession = None):
+        self.session = session if session is not None else HttpSession.default()
+
+    def get_transaction(self, hash_: str, properties: list = None, records: bool = False):
         """
         get a specific transaction.
 
@@ -559,23 +941,70 @@ class Transaction:
         :kwargs:
             * *properties* (``list``)
                 properties of transaction that will be returned. default is all.
+            * *records* (``bool``)
+                if set to True an immutable DataRecord is returned instead of a DataMap, which is cheaper to create.
+                default is False.
 
         :returns: the desired transaction data.
         :rtype: TransactionDataMap
 
         """
 
-        params = {"hash": hash_}
-        req = SendRequestSingle(self._API_TRANSACTION_INFO_ADDRESS, params)
-        data = req.get_data()
-        return TransactionDataMap(data, properties)
+        def get_data():
+            params = {"hash": hash_}
+            req = SendRequestSingle(self._API_TRANSACTION_INFO_ADDRESS, params, self.session)
+            return req.get_data()
+
+        cache = self.session.entity_cache
+        if cache is None:
+            data = get_data()
+        else:
+            data = cache.fetch((self._API_TRANSACTION_INFO_ADDRESS, hash_), get_data)
+        return TransactionDataMap.single(data, properties, records)
+
+    @staticmethod
+    def _build_block_params(number, end_number, order):
+        """
+        make request params of the transactions in a block, or in a range of blocks.
+
+        :param number: number of the block, or of the first block of the range.
+        :type number: int
+
+        :param end_number: number of the last block of the range, None for one block.
+        :type end_number: int
+
+        :param order: order of transactions by time.
+        :type order: str
+
+        :returns: request params.
+        :rtype: dict
+
+        :raise: ParameterException
+
+        """
+
+        params = {"block": number, "sort": "timestamp", "start_timestamp": None, "end_timestamp": None, "order": order}
+        if end_number is None:
+            return params
+
+        number, end_number = int(number), int(end_number)
+        if number > end_number:
+            raise ParameterException(ParameterException.BLOCK_EXCEPTION_BIGGER_MESSAGE, ["number", "end_number"])
+        # blocks are paged through in the order of query, from "block" to "end_block"
+        if order == "DESC":
+            number, end_number = end_number, number
+        params["block"] = number
+        params["end_block"] = end_number
+        return params
 
     def get_transaction_list_block(self, number: str
                                    , save_live: bool = False
                                    , save_path: str = ""
                                    , order: str = "DESC"
                                    , properties: list = None
-                                   , count: int = 10000):
+                                   , count: int = 10000
+                                   , resume: bool = False
+                                   , end_number: int = None):
         """
         get transactions in a block.
 
@@ -587,32 +1016,73 @@ class Transaction:
             * *order* (``str``)
                 order of transaction by time ("ASC" : Ascending , "DESC" : descending).
             * *count* (``int``)
-                number of desired transaction. default is 10000. is ignored when both times are specified.
+                number of desired transaction. default is 10000. is ignored when end_number is specified.
             * *save_live* (``bool``)
                 if set to True the downloaded data will be saved to a file in each page downloaded to avoid losing data
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
+            * *end_number* (``int``)
+                number of the last block of a range of blocks that starts at number. default is None, only the
+                transactions of number are returned.
 
 
         :returns: a panda dataframe containing data of desired transactions.
         :rtype: Pandas Dataframe
         """
 
-        params = {"block": number, "sort": "timestamp",
-                  "start_timestamp": None, "end_timestamp": None, "order": order}
+        params = self._build_block_params(number, end_number, order)
 
         address = self._API_TRANSACTION_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, TransactionDataMap)
         return data
 
+    def iter_transaction_list_block(self, number: str
+                                    , order: str = "DESC"
+                                    , properties: list = None
+                                    , count: int = 10000
+                                    , chunks: bool = False
+                                    , end_number: int = None):
+        """
+        get transactions in a block, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of transaction that will be returned. default is all.
+            * *sort* (``str``)
+                the property that transaction are ordered by.
+            * *order* (``str``)
+                order of transaction by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired transaction. default is 10000. is ignored when end_number is specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+            * *end_number* (``int``)
+                number of the last block of a range of blocks that starts at number. default is None, only the
+                transactions of number are returned.
+
+        :returns: a generator of dicts of desired transactions data, or of panda dataframes when chunks is True.
+        :rtype: generator
+        """
+
+        params = self._build_block_params(number, end_number, order)
+
+        address = self._API_TRANSACTION_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=2000, session=self.session)
+        return req.iter_data_multiple(count, properties, TransactionDataMap, chunks=chunks)
+
     def get_transaction_list_account(self, address: str
                                      , save_live: bool = False
                                      , save_path: str = ""
                                      , order: str = "DESC"
                                      , properties: list = None
-                                     , count: int = 10000):
+                                     , count: int = 10000
+                                     , resume: bool = False):
         """
         get transactions related to an account.
 
@@ -630,6 +1100,9 @@ class Transaction:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired transactions.
         :rtype: Pandas Dataframe
@@ -639,17 +1112,50 @@ class Transaction:
                   "start_timestamp": None, "end_timestamp": None, "order": order}
 
         address = self._API_TRANSACTION_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=2000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, TransactionDataMap)
         return data
 
+    def iter_transaction_list_account(self, address: str
+                                      , order: str = "DESC"
+                                      , properties: list = None
+                                      , count: int = 10000
+                                      , chunks: bool = False):
+        """
+        get transactions related to an account, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *properties* (``list``)
+                properties of transaction that will be returned. default is all.
+            * *sort* (``str``)
+                the property that transaction are ordered by.
+            * *order* (``str``)
+                order of transaction by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired transaction. default is 10000. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired transactions data, or of panda dataframes when chunks is True.
+        :rtype: generator
+        """
+
+        params = {"address": address, "sort": "timestamp",
+                  "start_timestamp": None, "end_timestamp": None, "order": order}
+
+        address = self._API_TRANSACTION_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=2000, session=self.session)
+        return req.iter_data_multiple(count, properties, TransactionDataMap, chunks=chunks)
+
     def get_transaction_list_blockchain(self, start_timestamp: int = None
                                         , end_timestamp: int = None
                                         , save_live: bool = False
                                         , save_path: str = ""
                                         , order: str = "DESC"
                                         , properties: list = None
-                                        , count: int = 10000):
+                                        , count: int = 10000
+                                        , resume: bool = False):
         """
         get transactions in blockchain.
 
@@ -669,6 +1175,9 @@ class Transaction:
                 in case of an error.
             * *save_path* (``str``)
                 path of folder that data is saved to. default is ""
+            * *resume* (``bool``)
+                if set to True and a live saved query with the same parameters stopped before it was complete, it is
+                continued from where it stopped instead of being downloaded again. needs save_live.
 
         :returns: a panda dataframe containing data of desired transactions.
         :rtype: Pandas Dataframe
@@ -678,6 +1187,41 @@ class Transaction:
                   "order": order, "sort": "timestamp"}
 
         address = self._API_TRANSACTION_ADDRESS
-        req = SendRequestMultiple(address, save_live, save_path, params, max_query=10000)
+        req = SendRequestMultiple(address, save_live, save_path, params, max_query=10000, session=self.session,
+                                  resume=resume)
         data = req.get_data_multiple(count, properties, TransactionDataMap)
         return data
+
+    def iter_transaction_list_blockchain(self, start_timestamp: int = None
+                                         , end_timestamp: int = None
+                                         , order: str = "DESC"
+                                         , properties: list = None
+                                         , count: int = 10000
+                                         , chunks: bool = False):
+        """
+        get transactions in blockchain, yielded as pages are downloaded so memory use doesnt grow with count.
+
+        :args:
+            * *start_timestamp* (``int``)
+                start timestamp of query. default is None. (milliseconds)
+            * *end_timestamp* (``int``)
+                end timestamp of query. default is None. (milliseconds)
+            * *properties* (``list``)
+                properties of transaction that will be returned. default is all.
+            * *order* (``str``)
+                order of transaction by time ("ASC" : Ascending , "DESC" : descending).
+            * *count* (``int``)
+                number of desired transactions. default is 10000. is ignored when both times are specified.
+            * *chunks* (``bool``)
+                if set to True a panda dataframe is yielded for each page instead of each instance.
+
+        :returns: a generator of dicts of desired transactions data, or of panda dataframes when chunks is True.
+        :rtype: generator
+        """
+
+        params = {"start_timestamp": start_timestamp, "end_timestamp": end_timestamp,
+                  "order": order, "sort": "timestamp"}
+
+        address = self._API_TRANSACTION_ADDRESS
+        req = SendRequestMultiple(address, False, "", params, max_query=10000, session=self.session)
+        return req.iter_data_multiple(count, properties, TransactionDataMap, chunks=chunks)
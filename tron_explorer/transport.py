@@ -0,0 +1,172 @@
+import gzip
+import json
+import random
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from tron_explorer.cache import ResponseCache
+
+
+class Transport:
+    """
+    an abstract class that is super of pluggable transports. a transport is what HttpSession sends requests through,
+    by default requests go over the network through the pooled requests session.
+
+    """
+
+    def bind(self, session):
+        """
+        called by HttpSession with its pooled requests session when the transport is plugged in.
+
+        :param session: the pooled session.
+        :type session: requests.Session
+        """
+
+        pass
+
+    def get(self, url: str, params: dict = None, timeout=None):
+        """
+        sends a get request.
+
+        :returns: the api response.
+        :rtype: requests.Response
+        """
+
+        raise NotImplementedError('abstract class method cannot be called')
+
+    def close(self):
+        """
+        releases resources of the transport.
+        """
+
+        pass
+
+    @staticmethod
+    def make_key(url: str, params: dict):
+        """
+        :returns: key of a request that doesnt depend on host of the api.
+        :rtype: str
+        """
+
+        return ResponseCache.make_key(urlparse(url).path, params)
+
+
+class ReplayResponse:
+    """
+    a response read from an archive. it has the parts of requests.Response that are used by the library.
+
+    :param status_code: http status of the response.
+    :type status_code: int
+
+    :param headers: http headers of the response.
+    :type headers: dict
+
+    :param text: body of the response.
+    :type text: str
+
+    """
+
+    def __init__(self, status_code: int, headers: dict, text: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def content(self):
+        return self.text.encode()
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class RecordingTransport(Transport):
+    """
+    sends requests over the network and records every response to a compact archive (gzip compressed json lines),
+    so the same requests can be replayed later with ReplayTransport.
+
+    :param path: path of the archive.
+    :type path: str
+
+    :param transport: the transport that requests are sent through. default is the pooled session of HttpSession.
+    :type transport: Transport
+
+    """
+
+    def __init__(self, path: str, transport=None):
+        self.path = path
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._archive = gzip.open(path, "at", encoding="utf-8")
+
+    def bind(self, session):
+        if self.transport is None:
+            self.transport = session
+
+    def get(self, url: str, params: dict = None, timeout=None):
+        response = self.transport.get(url=url, params=params, timeout=timeout)
+        retry_after = response.headers.get("Retry-After")
+        record = {"key": self.make_key(url, params), "status": response.status_code,
+                  "headers": {} if retry_after is None else {"Retry-After": retry_after}, "body": response.text}
+        with self._lock:
+            self._archive.write(json.dumps(record) + "\n")
+        return response
+
+    def close(self):
+        with self._lock:
+            self._archive.close()
+
+
+class ReplayTransport(Transport):
+    """
+    serves responses recorded by RecordingTransport without network, with an optional artificial latency, so list
+    queries can be profiled repeatably. a request that was recorded more than once gets the recorded responses in
+    order and then the last one again, a request that was never recorded gets a 404 response.
+
+    :param path: path of the archive.
+    :type path: str
+
+    :param latency: seconds each response is delayed.
+    :type latency: float
+
+    :param jitter: fraction of latency that is randomized.
+    :type jitter: float
+
+    """
+
+    def __init__(self, path: str, latency: float = 0, jitter: float = 0):
+        self.path = path
+        self.latency = latency
+        self.jitter = jitter
+        self._lock = threading.Lock()
+        self._responses = self._load()
+
+    def _load(self):
+        """
+        :returns: recorded responses by request key.
+        :rtype: dict
+        """
+
+        responses = {}
+        with gzip.open(self.path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                record = json.loads(line)
+                responses.setdefault(record["key"], deque()).append(record)
+        return responses
+
+    def get(self, url: str, params: dict = None, timeout=None):
+        if self.latency > 0:
+            time.sleep(self.latency * (1 - self.jitter * random.random()))
+
+        key = self.make_key(url, params)
+        with self._lock:
+            records = self._responses.get(key)
+            if records is None:
+                return ReplayResponse(404, {}, "")
+            record = records.popleft() if len(records) > 1 else records[0]
+        return ReplayResponse(record["status"], record["headers"], record["body"])
@@ -1,7 +1,23 @@
+import copy
+import hashlib
+import json
+import os
+import queue
 import sys
-from requests import get
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from tron_explorer.exceptions import ParameterWarning, ParameterException
+from requests import exceptions as request_exceptions
+from tron_explorer.cache import ResponseCache
+from tron_explorer.checkpoint import Checkpoint
+from tron_explorer.columns import ColumnBuilder
+from tron_explorer.exceptions import ParameterWarning, ParameterException, ResponseException
+from tron_explorer.pagination import OffsetOnly, TimeForward, TimeBackward, BlockRange
+from tron_explorer.session import HttpSession
+from tron_explorer.sink import CsvSink, QueuedWriter
 
 
 class SendRequestSingle:
@@ -14,6 +30,9 @@ class SendRequestSingle:
     :param params: parameters of api request
     :type params: dict
 
+    :param session: the session that request is sent through. default is the shared session.
+    :type session: HttpSession
+
     :cvar BASE_API: base url of api.
     :type BASE_API: str
 
@@ -22,9 +41,10 @@ class SendRequestSingle:
     BASE_API = "https://apilist.tronscan.org/api"
     URL = ""
 
-    def __init__(self, address, params: dict = None):
+    def __init__(self, address, params: dict = None, session: HttpSession = None):
         self.address = address
         self.params = params
+        self.session = session if session is not None else HttpSession.default()
         self._add_address()
 
     def _add_address(self):
@@ -49,15 +69,77 @@ class SendRequestSingle:
     def _send_request(self):
 
         """
-        sends get request and passes the data.
+        sends get request and passes the data. failed requests are sent again based on retry policy of the session
+        and requests wait while the circuit of the api segment is open.
 
         :returns: the data returned by api.
         :rtype: dict
+
+        :raise: ResponseException
         """
 
-        response = get(url=self.URL, params=self.params)
-        data = response.json()
-        return data
+        retry_policy = self.session.retry_policy
+        circuit_breaker = self.session.circuit_breaker
+        attempt = 0
+
+        while True:
+            circuit_breaker.wait(self.address)
+
+            response = None
+            status = None
+            invalid = False
+            try:
+                if self.session.rate_limiter is not None:
+                    self.session.rate_limiter.acquire(self.address)
+                response = self.session.get(self.URL, self.params)
+                status = response.status_code
+                if not retry_policy.is_retryable(response):
+                    # api is reachable, errors other than the retried ones are errors of the request itself
+                    if status >= 400:
+                        circuit_breaker.record_success(self.address)
+                        raise ResponseException(ResponseException.STATUS_EXCEPTION_MESSAGE, self.address, status)
+
+                    content = response.content
+                    try:
+                        data = self.session.decoder.decode(content, self._decoded(len(content)))
+                    except ValueError:
+                        # truncated or non json bodies are temporary
+                        invalid = True
+                    else:
+                        circuit_breaker.record_success(self.address)
+                        return data
+            except (request_exceptions.ConnectionError, request_exceptions.Timeout,
+                    request_exceptions.ChunkedEncodingError):
+                # network errors are temporary
+                pass
+            except BaseException:
+                # other errors, such as an invalid url or an interrupt, dont leave a trial request of the circuit that
+                # later requests would wait for
+                circuit_breaker.release(self.address)
+                raise
+
+            circuit_breaker.record_failure(self.address)
+            if attempt >= retry_policy.retries:
+                if invalid:
+                    raise ResponseException(ResponseException.DECODE_EXCEPTION_MESSAGE, self.address, status)
+                raise ResponseException(ResponseException.RETRIES_EXCEPTION_MESSAGE, self.address, status)
+
+            time.sleep(retry_policy.wait_time(attempt, response))
+            attempt += 1
+
+    def _decoded(self, size):
+        """
+        :param size: size of the response body in bytes.
+        :type size: int
+
+        :returns: function that records the decode time of the response in stats of the session.
+        :rtype: callable
+        """
+
+        def done(seconds):
+            self.session.stats.record_decode(self.address, size, seconds)
+
+        return done
 
     def get_data(self):
         """
@@ -68,7 +150,24 @@ class SendRequestSingle:
         """
         self._add_address()
         self._param_builder()
-        return self._send_request()
+
+        cache = self.session.cache
+        if cache is not None:
+            data = cache.get(self.address, self.params)
+            if data is not None:
+                return data
+
+        def send_request():
+            data = self._send_request()
+            if cache is not None:
+                cache.put(self.address, self.params, data)
+            return data
+
+        # identical requests sent at the same time share one request
+        if self.session.coalescer is None:
+            return send_request()
+        key = ResponseCache.make_key(self.address, self.params)
+        return self.session.coalescer.do(key, send_request)
 
 
 class SendRequestMultiple:
@@ -91,200 +190,701 @@ class SendRequestMultiple:
     :param save_path: path of folder that data is saved to.
     :type save_path: str
 
-    :cvar LIMIT: the number of instances in each page of query.
+    :param session: the session that page requests are sent through. default is the shared session.
+    :type session: HttpSession
+
+    :param workers: maximum number of pages of a query window that are requested at the same time. default is
+                    page_workers of the session.
+    :type workers: int
+
+    :param shards: number of sub ranges that a bounded query, such as one with both start and end time, is split into
+                   and requested at the same time. default is time_shards of the session.
+    :type shards: int
+
+    :param resume: if set to True and the checkpoint in save_path is of a live saved query with the same parameters
+                   that stopped before it was complete, the query and its file are continued from where it stopped.
+    :type resume: bool
+
+    :cvar LIMIT: the number of instances in each page of query, for api segments that are not in PAGE_SIZES.
     :type LIMIT: int
 
+    :cvar PAGE_SIZES: largest number of instances in a page by api segment address. page_sizes of the session are used
+                      before it.
+    :type PAGE_SIZES: dict
+
+    :cvar LIVE_FSYNC_INTERVAL: number of pages between forcing the live saved file to disk, 0 for never. it is used
+                               when live_fsync_interval of the session is None.
+    :type LIVE_FSYNC_INTERVAL: int
+
+    :cvar LIVE_ATOMIC: if set to True data is live saved to query.csv.part, which is renamed to query.csv once the
+                       query is complete. it is used when live_atomic of the session is None.
+    :type LIVE_ATOMIC: bool
+
+    :cvar LIVE_QUEUE_SIZE: number of live saved pages that can wait for the writer thread before the query waits for
+                           it, 0 to write pages on the thread of the query.
+    :type LIVE_QUEUE_SIZE: int
+
+    :cvar SHARD_QUEUE_SIZE: number of pages that a shard ahead of the one being yielded can download before it waits.
+    :type SHARD_QUEUE_SIZE: int
+
+    :cvar LIVE_FILE: name of the live saved file in save_path.
+    :type LIVE_FILE: str
+
+    :cvar CHECKPOINT_FILE: name of the checkpoint file of live saved queries in save_path. it is updated after each
+                           saved page and removed once the query is complete.
+    :type CHECKPOINT_FILE: str
+
+    :cvar KEY_FIELDS: fields of api data instances that identify them, the first one that an instance has is used.
+    :type KEY_FIELDS: tuple
+
+    :cvar QUERY_PARAMS: params that only describe the query to its pagination strategy and are not sent to api.
+    :type QUERY_PARAMS: tuple
+
+    :cvar WINDOW_PARAMS: params that only place a page in the instances of api segment, the other params filter them.
+    :type WINDOW_PARAMS: tuple
+
+    :cvar TIMESTAMP_FIELDS: field of api data instances that queries sorted by timestamp are ordered by, by api segment
+                            address. "timestamp" is used for the other segments, and None pages through one window of
+                            a segment whose instances have no timestamp.
+    :type TIMESTAMP_FIELDS: dict
+
     """
 
     LIMIT = 50
-
-    def __init__(self, address: str, save_live: bool, save_path: str, params: dict = None, max_query: int = 10000):
+    PAGE_SIZES = {"/block": 50, "/transaction": 50, "/account/list": 50, "/contracts": 50, "/proposal": 50,
+                  "/tokens/overview": 50}
+    LIVE_FSYNC_INTERVAL = 10
+    LIVE_ATOMIC = False
+    LIVE_QUEUE_SIZE = 8
+    SHARD_QUEUE_SIZE = 16
+    LIVE_FILE = "query.csv"
+    CHECKPOINT_FILE = "query.checkpoint.json"
+    KEY_FIELDS = ("hash", "number", "address")
+    QUERY_PARAMS = ("end_block",)
+    # item of a shard queue after the last page of the shard
+    _SHARD_END = object()
+    WINDOW_PARAMS = ("start_timestamp", "end_timestamp", "sort", "order", "start", "limit")
+    TIMESTAMP_FIELDS = {"/contracts": "date_created", "/proposal": None}
+
+    def __init__(self, address: str, save_live: bool, save_path: str, params: dict = None, max_query: int = 10000,
+                 session: HttpSession = None, workers: int = None, shards: int = None, resume: bool = False):
         self.MAX = max_query
         self.address = address
         self.params = params
         self.save_live = save_live
         self.save_path = save_path
+        self.session = session if session is not None else HttpSession.default()
+        self.workers = workers if workers is not None else self.session.page_workers
+        self.shards = shards if shards is not None else self.session.time_shards
+        self.planner = self.session.planner
+        self.page_size = self.session.page_sizes.get(address, self.PAGE_SIZES.get(address, self.LIMIT))
+        self.resume = resume
+        self._executor = None
+        self._sink = None
+        self._writer = None
+        # dtypes of the properties of the data map, which the live saved file formats values with
+        self._dtypes = {}
+        # number of data instances passed to the sink
+        self._live_rows = 0
+        self._checkpoint = None
+        # identity of the query in its checkpoint
+        self._query = None
+        # position of the query after the last page, until it is saved to the checkpoint
+        self._cursor = None
+        # the position in the checkpoint
+        self._saved_cursor = None
+        # position that a resumed query continues from, until the pagination starts
+        self._resumed_from = None
+        self._resumed = False
+        # offset in the query window of the last page, and of the first page of the next window
+        self._page_offset = 0
+        self._first_offset = 0
+        # timestamp of the last instance and keys of the instances that have it
+        self._edge_timestamp = None
+        self._edge_keys = set()
+        # whether if the row that crosses the end of query belongs to another shard
+        self._inner_edge = False
+
+    def _get_page(self, start, limit):
+        """
+        gets one page of the current query window.
+
+        :param start: offset of the page in the query window.
+        :type start: int
 
-    def _save_live(self, all_data):
+        :param limit: number of instances in the page.
+        :type limit: int
 
+        :returns: the data returned by api.
+        :rtype: dict
         """
-        saves data to csv file.
+
+        started = time.perf_counter()
+        data = SendRequestSingle(self.address, self._page_params(start, limit), self.session).get_data()
+        self.session.stats.record_stage("fetch", time.perf_counter() - started)
+        return data
+
+    def _page_params(self, start, limit):
         """
+        :param start: offset of the page in the query window.
+        :type start: int
 
-        df = MiscUtils.dict_list_df(all_data)
-        df.to_csv(self.save_path + "/query.csv")
+        :param limit: number of instances in the page.
+        :type limit: int
 
-    def _time_both(self, properties, data_map, data_key):
+        :returns: params of the api request of a page.
+        :rtype: dict
         """
-        uses SendRequest class to get paginated data from multiple queries with more than one instance when both start
-        and end time are specified, and return the combined data.
 
-        :param properties: properties of instances that will be returned.
-        :type properties: list
+        params = {key: value for key, value in self.params.items() if key not in self.QUERY_PARAMS}
+        params["start"] = start
+        params["limit"] = limit
+        return params
 
-        :param data_map: the DataMap type class name that is responsible for filtering properties.
-        :type data_map: DataMap
+    def _window_pages(self, data_key, remaining=None):
+        """
+        iterates over the pages of the current query window in order. pages have page_size instances, except the last
+        page of a query with a count, which only has the instances that are still needed. pages are requested on the
+        worker threads, with at most workers pages in flight, and the next pages are requested before the current one
+        is yielded so fetching them overlaps mapping it.
+
+        each page starts after the instances that the previous one actually had. if a page has less instances than
+        requested and the next page is not empty, the api segment caps pages at that size and it is used as page size
+        from then on. pages are counted after they are yielded, so their instances are decoded as they are mapped
+        instead of all at once before, and until then a page is taken to have all the instances it was requested with.
 
         :param data_key: the key to data segment of request result.
         :type data_key: str
 
-        :returns: desired data instances.
-        :rtype: list
+        :param remaining: function that returns the number of instances that are still needed, None when not limited.
+        only the pages that can contain the needed instances are requested ahead.
+        :type remaining: callable
 
+        :returns: pages of the window.
+        :rtype: generator
         """
 
-        all_data = []
+        offset, self._first_offset = self._first_offset, 0
+        pending = deque()
+
+        def request(unused):
+            """
+            requests pages until workers pages are in flight.
+
+            :param unused: instances that are returned but not counted by remaining yet.
+            """
+
+            nonlocal offset
+            requested = unused + sum(limit for _, limit, _ in pending)
+            while len(pending) < self.workers and offset < self.MAX:
+                limit = min(self.page_size, self.MAX - offset)
+                if remaining is not None:
+                    limit = min(limit, remaining() - requested)
+                if limit <= 0:
+                    break
+                self.session.stats.record_page(limit, self.LIMIT)
+                pending.append((offset, limit, self._executor.submit(self._get_page, offset, limit)))
+                offset += limit
+                requested += limit
+
+        # instances of the last page when it had less than requested
+        short = None
+        try:
+            while True:
+                request(0)
+                if len(pending) == 0:
+                    return
+                start, limit, page = pending.popleft()
+                started = time.perf_counter()
+                data = page.result()
+                self.session.stats.record_stage("fetch_wait", time.perf_counter() - started)
+
+                request(limit)
+                self._page_offset = start
+                yield data
+
+                # the page is decoded once it is consumed
+                returned = len(data[data_key])
+                if short is not None and returned > 0:
+                    self.page_size = short
+                    self.session.page_sizes[self.address] = short
+                short = None
+                if 0 < returned < limit:
+                    short = returned
+                    # the pages after it were requested from the wrong offsets
+                    for _, _, ahead in pending:
+                        ahead.cancel()
+                    pending.clear()
+                    offset = start + returned
+        finally:
+            # pages after a stop condition are not needed
+            for _, _, page in pending:
+                page.cancel()
+
+    def _save_live(self, page):
 
-        # getting data
-        # one loop of while gets the maximum amount of instances in one query
-        while True:
-            self.params["start"] = 0
-            # pagination
-            while self.params["start"] <= self.MAX - self.LIMIT:
-                data = SendRequestSingle(self.address, self.params).get_data()
+        """
+        appends data instances of a page to the csv file of query.
+
+        :param page: dicts of data instances.
+        :type page: list
+        """
 
-                # when no more data exists return
-                if len(data[data_key]) == 0:
-                    return all_data
+        # a page that ends the query has no position
+        item = (page, self._cursor)
+        self._cursor = None
+        self._live_rows += len(page)
+        if self.LIVE_QUEUE_SIZE <= 0:
+            self._write_live(item)
+            return
+
+        if self._writer is None:
+            self._writer = QueuedWriter(self._write_live, self.LIVE_QUEUE_SIZE)
+        started = time.perf_counter()
+        self._writer.put(item)
+        self.session.stats.record_stage("sink_wait", time.perf_counter() - started)
+
+    def _write_live(self, item):
+        """
+        writes a page to the csv file of query, and then its position to the checkpoint.
 
-                for d in data[data_key]:
-                    obj = data_map(d, properties)
-                    # obj is data_map instance and will filter out properties
-                    all_data.append(obj.__dict__)
-                    # the return criteria depends on sort
-                    if self.params["sort"] == "timestamp":
-                        if d["timestamp"] > self.params["end_timestamp"]:
-                            MiscUtils.progressbar(len(all_data))
-                            return all_data
-                    else:
-                        if d["timestamp"] < self.params["start_timestamp"]:
-                            MiscUtils.progressbar(len(all_data))
-                            return all_data
+        :param item: data instances of the page and the position of query after it.
+        :type item: tuple
+        """
 
-                if self.save_live:
-                    self._save_live(all_data)
+        started = time.perf_counter()
+        page, cursor = item
+        if self._sink is None:
+            self._sink = self._live_sink()
+        self._sink.write(page)
 
-                MiscUtils.progressbar(len(all_data))
-                # go to next page of data
-                self.params["start"] += self.LIMIT
-            # creating a new query where previous one ended
-            if self.params["sort"] == "timestamp":
-                self.params["start_timestamp"] = all_data[-1]["timestamp"] + 1
-            else:
-                self.params["end_timestamp"] = all_data[-1]["timestamp"] - 1
+        # the position is only saved after the pages before it are written
+        if self._checkpoint is not None and cursor is not None:
+            self._save_checkpoint(cursor, self._sink.rows, self._sink.fields, self._sink.size)
+        self.session.stats.record_stage("sink", time.perf_counter() - started)
 
-    def _time_one(self, count, properties, data_map, side, data_key):
+    def _save_checkpoint(self, cursor, rows, fields, size):
+        """
+        saves a position of query and the state of the live saved file at that position to the checkpoint.
         """
-        uses SendRequest class to get paginated data from multiple queries with more than one instance when start or end
-        times are specified, and return the combined data.
 
-        :param count: number of instances that will be returned.
-        :type count: int
+        self._checkpoint.save({"query": self._query, "cursor": cursor,
+                               "sink": {"rows": rows, "fields": fields, "size": size}})
+        self._saved_cursor = cursor
 
-        :param properties: properties of instances that will be returned.
-        :type properties: list
+    def _widened(self, rows, fields, size):
+        """
+        saves the last saved position again with the state of the file that is rewritten with a wider header, before
+        the file is replaced and rows of the next position are appended to it.
+        """
 
-        :param data_map: the DataMap type class name that is responsible for filtering properties.
-        :type data_map: DataMap
+        if self._checkpoint is not None and self._saved_cursor is not None:
+            self._save_checkpoint(self._saved_cursor, rows, fields, size)
 
-        :param data_key: the key to data segment of request result.
-        :type data_key: str
+    def _live_sink(self):
+        """
+        :returns: the sink of the live saved file of query.
+        :rtype: CsvSink
+        """
 
-        :param side: indicates which of start or end time is specified.
-        :type side: str
+        fsync_interval = self.session.live_fsync_interval
+        if fsync_interval is None:
+            fsync_interval = self.LIVE_FSYNC_INTERVAL
+        atomic = self.session.live_atomic if self.session.live_atomic is not None else self.LIVE_ATOMIC
+        sink = CsvSink(self.save_path + "/" + self.LIVE_FILE, fsync_interval, atomic, self._dtypes)
+        sink.on_widen = self._widened
+        return sink
 
-        :returns: desired data instances.
-        :rtype: list
+    def _close_live(self, complete: bool = True):
+        """
+        waits for the queued pages to be written, closes the csv file of query, and removes its checkpoint when the
+        query is complete.
 
+        :param complete: whether if every data instance of query was saved.
+        :type complete: bool
         """
 
-        all_data = []
-        # getting data
-        # one loop of while gets the maximum amount of instances in one query
-        while True:
-            self.params["start"] = 0
-            # pagination
-            while self.params["start"] <= self.MAX - self.LIMIT:
-                data = SendRequestSingle(self.address, self.params).get_data()
+        writer, self._writer = self._writer, None
+        try:
+            if writer is not None:
+                writer.close()
+        except BaseException:
+            complete = False
+            raise
+        finally:
+            if self._sink is not None:
+                self._sink.close(complete)
+                self._sink = None
+            if self._checkpoint is not None and complete:
+                self._checkpoint.remove()
+
+    def _open_checkpoint(self, count, properties, data_key):
+        """
+        starts the checkpoint of a live saved query. when resume is True and there is a checkpoint of the same query,
+        the query params and the csv file are restored to the saved position.
 
-                # when no more data exists return
-                if len(data[data_key]) == 0:
-                    return all_data
+        :raise: ParameterException
+        """
 
-                for d in data[data_key]:
-                    obj = data_map(d, properties)
-                    # obj is data_map instance and will filter out properties
-                    all_data.append(obj.__dict__)
-                    # if enough there are enough instances return
-                    if len(all_data) >= count:
-                        MiscUtils.progressbar(len(all_data), count)
-                        return all_data
+        self._checkpoint = Checkpoint(self.save_path + "/" + self.CHECKPOINT_FILE)
+        # compared after a round trip through json, the same way that it is loaded. pages start at absolute offsets so
+        # page size is not a part of the query
+        params = {key: value for key, value in self.params.items() if key != "limit"}
+        self._query = json.loads(json.dumps({"address": self.address, "params": params, "count": count,
+                                             "properties": properties, "data_key": data_key}))
+
+        state = self._checkpoint.load() if self.resume else None
+        if state is None:
+            return
+        if state["query"] != self._query:
+            raise ParameterException(ParameterException.RESUME_EXCEPTION_MESSAGE, ["resume"])
+
+        sink = self._live_sink()
+        # a file that was being rewritten with a wider header is put back in the state of the checkpoint
+        sink.recover(state["sink"]["fields"])
+        if not os.path.exists(sink.write_path) or os.path.getsize(sink.write_path) < state["sink"]["size"]:
+            raise ParameterException(ParameterException.RESUME_FILE_EXCEPTION_MESSAGE, ["resume"])
+        sink.resume(**state["sink"])
+
+        self._sink = sink
+        self.params.update(state["cursor"]["params"])
+        self._resumed_from = state["cursor"]
+        self._saved_cursor = state["cursor"]
+        self._resumed = True
+
+    def _advance(self, done, returned):
+        """
+        records the position of query after a page of the current window, which is where a resumed query continues.
 
-                if self.save_live:
-                    self._save_live(all_data)
+        :param done: number of data instances of the query so far.
+        :type done: int
 
-                MiscUtils.progressbar(len(all_data), count)
-                # go to no next page of data
-                self.params["start"] += self.LIMIT
+        :param returned: number of data instances that the page had.
+        :type returned: int
+        """
 
-            # creating a new query where previous one ended
-            if side == "start":
-                self.params["start_timestamp"] = all_data[-1]["timestamp"] + 1
-            else:
-                self.params["end_timestamp"] = all_data[-1]["timestamp"] - 1
+        self._cursor = {"params": dict(self.params), "start": self._page_offset + returned, "done": done,
+                        "edge": [self._edge_timestamp, list(self._edge_keys)]}
 
-    def _time_none(self, count, properties, data_map, data_key):
+    def _resume_position(self):
         """
-        uses SendRequest class to get paginated data from multiple queries with more than one instance when none
-        of start or end times are specified.
+        starts the cursor of pagination, from the resumed position when the query is resumed.
 
-        :param count: number of instances that will be returned.
+        :returns: number of data instances of the query before the position.
+        :rtype: int
+        """
+
+        self._edge_timestamp, self._edge_keys = None, set()
+        if self._resumed_from is None:
+            return 0
+        cursor, self._resumed_from = self._resumed_from, None
+        self._first_offset = cursor["start"]
+        if cursor["edge"] is not None:
+            self._edge_timestamp, self._edge_keys = cursor["edge"][0], set(cursor["edge"][1])
+        return cursor["done"]
+
+    def _key(self, instance):
+        """
+        :param instance: an api data instance.
+        :type instance: dict
+
+        :returns: the key that identifies the instance among the ones with the same timestamp.
+        """
+
+        for field in self.KEY_FIELDS:
+            if instance.get(field) is not None:
+                return instance[field]
+        return hashlib.sha1(json.dumps(instance, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _fresh(self, instance, timestamp):
+        """
+        checks whether if an instance was not returned before. instances are returned in order of timestamp, so only
+        the ones with the timestamp of the last instance can be returned again, when a window starts at that timestamp.
+
+        :param instance: an api data instance.
+        :type instance: dict
+
+        :param timestamp: the timestamp of instance that the query is ordered by, None when it has none.
+        :type timestamp: int
+
+        :returns: False when the instance was already returned.
+        :rtype: bool
+        """
+
+        if timestamp is None:
+            # the query cant move its window, so it returns no instance twice
+            self._edge_timestamp, self._edge_keys = None, set()
+            return True
+        key = self._key(instance)
+        if timestamp != self._edge_timestamp:
+            self._edge_timestamp = timestamp
+            self._edge_keys = {key}
+            return True
+        if key in self._edge_keys:
+            return False
+        self._edge_keys.add(key)
+        return True
+
+    def _strategy(self):
+        """
+        :returns: the pagination strategy of query, by its params.
+        :rtype: PaginationStrategy
+        """
+
+        field = self.TIMESTAMP_FIELDS.get(self.address, "timestamp")
+        if "block" in self.params:
+            return BlockRange()
+        if field is not None and self.params["sort"] == "timestamp":
+            return TimeForward(field)
+        if field is not None and self.params["sort"] == "-timestamp":
+            return TimeBackward(field)
+        return OffsetOnly()
+
+    def _paginate(self, strategy, count, batch, data_key):
+        """
+        uses SendRequest class to get paginated data from multiple queries with more than one instance, and yields the
+        data of each page. the strategy of query decides where each query window starts and when the query ends.
+
+        :param strategy: the pagination strategy of query.
+        :type strategy: PaginationStrategy
+
+        :param count: number of instances that will be returned, None when the query is bounded by its strategy.
         :type count: int
 
-        :param properties: properties of instances that will be returned.
-        :type properties: list
+        :param batch: the batch function of data_map that maps the data instances of a page.
+        :type batch: callable
 
         :param data_key: the key to data segment of request result.
         :type data_key: str
 
-        :param data_map: the DataMap type class name that is responsible for filtering properties.
-        :type data_map: DataMap
-
-        :returns: desired data instances.
-        :rtype: list
+        :returns: desired data instances of each page.
+        :rtype: generator
 
         """
 
-        all_data = []
+        done = self._resume_position()
+        remaining = None if count is None else lambda: count - done
 
         # getting data
         # one loop of while gets the maximum amount of instances in one query
         while True:
-            self.params["start"] = 0
+            fresh, stale, ended = 0, 0, False
             # pagination
-            while self.params["start"] <= self.MAX - self.LIMIT:
-                data = SendRequestSingle(self.address, self.params).get_data()
-                # when no more data exists return
-                if len(data[data_key]) == 0:
-                    return all_data
-
+            for data in self._window_pages(data_key, remaining):
+                # when no more data exists the window ends
+                if not data[data_key]:
+                    ended = True
+                    break
+
+                started = time.perf_counter()
+                # instances of the page are picked first and then mapped at once
+                instances = []
                 for d in data[data_key]:
-                    obj = data_map(d, properties)
-                    # obj is data_map instance and will filter out properties
-                    all_data.append(obj.__dict__)
+                    # the window starts where the previous one ended, so its first instances can be returned already
+                    if strategy.DEDUPLICATE and not self._fresh(d, strategy.timestamp(d)):
+                        stale += 1
+                        continue
+                    instances.append(d)
+                    if strategy.crossed(self, d):
+                        page = batch(instances)
+                        self._mapped(started)
+                        yield self._crossed(page, done)
+                        return
                     # if enough there are enough instances return
-                    if len(all_data) >= count:
-                        MiscUtils.progressbar(len(all_data), count)
-                        return all_data
+                    if count is not None and done + len(instances) >= count:
+                        page = batch(instances)
+                        self._mapped(started)
+                        self._progressbar(done + len(page), count)
+                        yield page
+                        return
+
+                page = batch(instances)
+                self._observe(instances, strategy)
+                done += len(page)
+                fresh += len(page)
+                # the page is decoded by now
+                self._advance(done, len(data[data_key]))
+                self._mapped(started)
+                self._progressbar(done, count)
+                yield page
+            # creating a new query where previous one ended
+            if not strategy.next_window(self, ended, fresh, stale):
+                return
 
-                if self.save_live:
-                    self._save_live(all_data)
+    def _mapped(self, started):
+        """
+        records the time spent mapping a page.
 
-                MiscUtils.progressbar(len(all_data), count)
-                # go to no next page of data
-                self.params["start"] += self.LIMIT
-            # creating a new query where previous one ended
-            self.params["end_timestamp"] = all_data[-1]["timestamp"] + 1000
+        :param started: time.perf_counter() when mapping of the page started.
+        :type started: float
+        """
+
+        self.session.stats.record_stage("map", time.perf_counter() - started)
+
+    def _crossed(self, page, done):
+        """
+        :param page: data instances of the last page of the query, the last one crossed the end of query.
+        :type page: list
+
+        :param done: number of data instances of the query before the page.
+        :type done: int
+
+        :returns: data instances of the page.
+        :rtype: list
+        """
+
+        if self._inner_edge:
+            # the instance is in the range of the next shard
+            page.pop()
+        self._progressbar(done + len(page))
+        return page
+
+    def _progressbar(self, done, full=None):
+        MiscUtils.progressbar(done, full)
+
+    def _observe(self, instances, strategy):
+        """
+        passes the number and time span of the instances of a page to the window planner.
+
+        :param instances: data instances of a page that are mapped.
+        :type instances: list
+
+        :param strategy: the pagination strategy of query, which gives the timestamps of instances.
+        :type strategy: PaginationStrategy
+        """
+
+        if len(instances) < 2:
+            return
+        first = strategy.timestamp(instances[0])
+        last = strategy.timestamp(instances[-1])
+        if first is not None and last is not None:
+            self.planner.observe(self.density_key(), len(instances) - 1, abs(first - last))
+
+    def density_key(self):
+        """
+        :returns: the key of the density of query in the window planner, its api segment address followed by the
+        params that filter the instances, so that for example the transactions of one account dont change the density
+        of the transactions of the whole chain.
+        :rtype: str
+        """
+
+        filters = sorted((key, str(value)) for key, value in self.params.items()
+                         if value is not None and key not in self.WINDOW_PARAMS and key not in self.QUERY_PARAMS)
+        if len(filters) == 0:
+            return self.address
+        return self.address + "?" + "&".join(key + "=" + value for key, value in filters)
+
+    def _sharded(self, strategy, batch, data_key):
+        """
+        splits a bounded query into shards with its strategy, gets data of up to shards of them at the same time with
+        _paginate and yields the data of each shard in order of the query. pages of a shard are yielded as they are
+        downloaded, and a shard ahead of the one being yielded only holds up to SHARD_QUEUE_SIZE pages, so memory use
+        doesnt grow with the size of shards.
+
+        :param strategy: the pagination strategy of query.
+        :type strategy: PaginationStrategy
+
+        :param batch: the batch function of data_map that maps the data instances of a page.
+        :type batch: callable
+
+        :param data_key: the key to data segment of request result.
+        :type data_key: str
+
+        :returns: desired data instances of each page of the shards.
+        :rtype: generator
+
+        """
+
+        done = self._resume_position()
+        parts = strategy.split(self, self.shards)
+        lock = threading.Lock()
+        # instances before the resumed position are counted as a shard of their own
+        progress = {-1: done}
+
+        def progressbar(shard, done):
+            with lock:
+                progress[shard] = done
+                MiscUtils.progressbar(sum(progress.values()))
+
+        stop = threading.Event()
+
+        def get_shard(shard, pages):
+            """
+            puts the pages of a shard into its queue, waits while the queue is full.
+            """
+
+            def put(item):
+                while not stop.is_set():
+                    try:
+                        pages.put(item, timeout=0.1)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+
+            shard_pages = shard._paginate(strategy, None, batch, data_key)
+            try:
+                for page in shard_pages:
+                    if not put((page, None)):
+                        return
+                put((self._SHARD_END, None))
+            except BaseException as e:
+                put((self._SHARD_END, e))
+            finally:
+                shard_pages.close()
+
+        shards = []
+        for i, params in enumerate(parts):
+            # each shard has its own copy of params, so its own cursor
+            shard = copy.copy(self)
+            shard.params = params
+            shard._inner_edge = i != len(parts) - 1
+            shard._progressbar = lambda done, full=None, i=i: progressbar(i, done)
+            shards.append(shard)
+
+        workers = min(self.shards, len(shards))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        shards = iter(enumerate(shards))
+        pending = deque()
+        futures = []
+        try:
+            # shards ahead of the one being yielded download up to SHARD_QUEUE_SIZE pages, then wait for their turn
+            while True:
+                while len(pending) < workers:
+                    i, shard = next(shards, (None, None))
+                    if shard is None:
+                        break
+                    pages = queue.Queue(maxsize=self.SHARD_QUEUE_SIZE)
+                    futures.append(executor.submit(get_shard, shard, pages))
+                    pending.append((i, pages))
+
+                if len(pending) == 0:
+                    return
+                i, pages = pending.popleft()
+                # a page is held until the next item shows whether if it is the last page of the shard
+                held = None
+                while True:
+                    page, error = pages.get()
+                    if page is self._SHARD_END:
+                        break
+                    if held is not None:
+                        yield held
+                    done += len(page)
+                    held = page
+                if error is not None:
+                    raise error
+                if held is not None:
+                    # the query continues from the next shard after its last page, the last shard ends the query
+                    if i != len(parts) - 1:
+                        self._cursor = {"params": strategy.rest(self, parts[i]), "start": 0, "done": done,
+                                        "edge": None}
+                    yield held
+        finally:
+            stop.set()
+            # shards that didnt start are not needed, running ones stop at their next page
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     @staticmethod
     def _check_list_params(start_timestamp: int, end_timestamp: int, order: str, count: int, delete_order):
@@ -358,13 +958,8 @@ class SendRequestMultiple:
 
         """
 
-        # if desired number of instances is less than default instance limit of query, then the limit is same is desired
-        # number of instances
-        if self.LIMIT > count:
-            self.LIMIT = count
-
-        # setting request params
-        self.params["limit"] = self.LIMIT
+        # setting request params, the limit of each page is set when it is requested
+        self.params["limit"] = self.page_size
 
         if delete_order:
             if order == "DESC":
@@ -372,11 +967,106 @@ class SendRequestMultiple:
 
             del self.params["order"]
 
+    def _pages(self, count: int, properties: list, data_map, delete_order: bool, data_key: str):
+        """
+        checks and builds request params and gets the pages of query.
+
+        :returns: desired data instances of each page.
+        :rtype: generator
+
+        :raise: ParameterException
+        """
+
+        if self.resume and not self.save_live:
+            raise ParameterException(ParameterException.RESUME_SAVE_LIVE_EXCEPTION_MESSAGE, ["resume", "save_live"])
+        start_timestamp = self.params["start_timestamp"]
+        end_timestamp = self.params["end_timestamp"]
+        order = self.params["order"]
+        sort = self.params["sort"]
+
+        self._check_list_params(start_timestamp, end_timestamp, order, count, delete_order)
+        # properties are checked once, before any page is requested
+        batch = data_map.batch(properties)
+        self._build_params(count, order, sort, delete_order)
+        if self.save_live:
+            self._dtypes = data_map.properties_dtypes
+            self._open_checkpoint(count, properties, data_key)
+
+        if start_timestamp is not None and end_timestamp is not None and count != self.MAX:
+            ParameterWarning(ParameterWarning.COUNT_WARNING_MESSAGE, '"count"').warn()
+        return self._get_pages(count, batch, data_key)
+
+    def _get_pages(self, count, batch, data_key):
+        """
+        gets the pages of query with its pagination strategy. bounded queries of strategies that can be parallelized
+        are split into shards.
+
+        :returns: desired data instances of each page.
+        :rtype: generator
+        """
+
+        strategy = self._strategy()
+        bounded = strategy.bounded(self)
+        # a position inside a query window can only be continued by one shard
+        resumed_inside = self._resumed_from is not None and self._resumed_from["start"] > 0
+        sharded = strategy.PARALLEL and bounded and self.shards > 1 and not resumed_inside
+
+        # pages of a window are requested ahead on worker threads, each shard has its own workers
+        self._executor = ThreadPoolExecutor(max_workers=self.workers * (self.shards if sharded else 1))
+        try:
+            if sharded:
+                yield from self._sharded(strategy, batch, data_key)
+            else:
+                yield from self._paginate(strategy, None if bounded else count, batch, data_key)
+        finally:
+            # _window_pages cancels the pages it requested ahead, so only the pages in flight are waited for
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def iter_data_multiple(self, count: int, properties: list, data_map, delete_order: bool = True,
+                           data_key: str = "data", chunks: bool = False):
+        """
+        yields desired data instances as their pages are downloaded, so only the instances of the current page are held
+        in memory.
+
+        :param data_key: the key to data segment of request result.
+        :type data_key: str
+
+        :param count: number of instances that will be returned.
+        :type count: int
+
+        :param properties: properties of instances that will be returned.
+        :type properties: list
+
+        :param data_map: the DataMap type class name that is responsible for filtering properties.
+        :type data_map: DataMap
+
+        :param delete_order: whether if order param should be removed before sending request.
+        :type delete_order: bool
+
+        :param chunks: if set to True a panda dataframe is yielded for each page instead of each instance.
+        :type chunks: bool
+
+        :returns: a generator of dicts of data instances, or of panda dataframes when chunks is True.
+        :rtype: generator
+
+        """
+
+        def chunk(page):
+            columns = ColumnBuilder(data_map.properties_dtypes)
+            columns.append(page)
+            return columns.frame()
+
+        pages = self._pages(count, properties, data_map, delete_order, data_key)
+        if chunks:
+            return (chunk(page) for page in pages if len(page) > 0)
+        return (d for page in pages for d in page)
+
     def get_data_multiple(self, count: int, properties: list, data_map, delete_order: bool = True,
                           data_key: str = "data"):
 
         """
-        determines which of the data gathering methods should be used based on start or end time parameters.
+        gets all desired data instances and returns them in one dataframe.
 
         :param data_key: the key to data segment of request result.
         :type data_key: str
@@ -393,45 +1083,30 @@ class SendRequestMultiple:
         :param delete_order: whether if order param should be removed before sending request.
         :type delete_order: bool
 
-        :returns: a panda dataframe containing data of desired data instances.
+        :returns: a panda dataframe containing data of desired data instances. when the query is resumed, the instances
+        that were saved before are only in the saved file, so the dataframe is read from the complete file.
         :rtype: Pandas Dataframe
 
 
         """
 
-        start_timestamp = self.params["start_timestamp"]
-        end_timestamp = self.params["end_timestamp"]
-        order = self.params["order"]
-        sort = self.params["sort"]
-
-        self._check_list_params(start_timestamp, end_timestamp, order, count, delete_order)
-        self._build_params(count, order, sort, delete_order)
-
-        if start_timestamp is not None and end_timestamp is not None:
-            if count != self.MAX:
-                ParameterWarning(ParameterWarning.COUNT_WARNING_MESSAGE, '"count"').warn()
-            all_data = self._time_both(properties, data_map, data_key)
-            print("\n")
-            return MiscUtils.dict_list_df(all_data)
-
-        if start_timestamp is not None and end_timestamp is None:
-            # if order is not None:
-            # ParameterWarning(ParameterWarning.ORDER_WARNING_MESSAGE, '"order"').warn()
-            all_data = self._time_one(count, properties, data_map, "start", data_key)
-            print("\n")
-            return MiscUtils.dict_list_df(all_data)
-
-        if start_timestamp is None and end_timestamp is not None:
-            # if order is not None:
-            # ParameterWarning(ParameterWarning.ORDER_WARNING_MESSAGE, '"order"').warn()
-            all_data = self._time_one(count, properties, data_map, "end", data_key)
-            print("\n")
-            return MiscUtils.dict_list_df(all_data)
-
-        if start_timestamp is None and end_timestamp is None:
-            all_data = self._time_none(count, properties, data_map, data_key)
-            print("\n")
-            return MiscUtils.dict_list_df(all_data)
+        # pages are collected column by column, no dict is kept for each instance
+        columns = ColumnBuilder(data_map.properties_dtypes)
+        complete = False
+        try:
+            for page in self._pages(count, properties, data_map, delete_order, data_key):
+                columns.append(page)
+                if self.save_live:
+                    self._save_live(page)
+            complete = True
+        finally:
+            self._close_live(complete)
+
+        print("\n")
+        if self._resumed:
+            df = pd.read_csv(self.save_path + "/" + self.LIVE_FILE, index_col=0)
+            return ColumnBuilder.apply(df, data_map.properties_dtypes)
+        return columns.frame()
 
 
 class MiscUtils: